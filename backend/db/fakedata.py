@@ -1,5 +1,6 @@
 from faker import Faker
 from pymongo import MongoClient
+from bson import ObjectId
 import random
 import bcrypt
 from datetime import datetime, timedelta
@@ -95,41 +96,43 @@ def populate_database():
     classes_col.delete_many({})
     events_col.delete_many({})
 
+    # Every document gets its _id up front so references can be wired in
+    # memory and each collection written with a single bulk insert
     print("Creating teachers...")
     teachers = []
     for _ in range(26):
         teacher = create_teacher()
-        teacher_id = teachers_col.insert_one(teacher).inserted_id
-        teachers.append((teacher, teacher_id))
+        teacher["_id"] = ObjectId()
+        teachers.append(teacher)
 
     print("Creating classes with assigned teachers...")
     classes = []
+    class_names = set()
     years = ["22", "23"]
     for year in years:
         for char in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
             for num in range(1, 3):  # A1, A2, ..., Z1, Z2
                 class_name = f"{char}{num}"
                 teacher = teachers[len(classes) % len(teachers)]
-                teacher_id = teacher[1]
 
-                if not classes_col.find_one({"className": class_name}):
-                    class_data = create_class(class_name, teacher_id)
-                    class_id = classes_col.insert_one(class_data).inserted_id
-                    classes.append((class_id, teacher_id, year))
+                if class_name not in class_names:
+                    class_data = create_class(class_name, teacher["_id"])
+                    class_data["_id"] = ObjectId()
+                    class_names.add(class_name)
+                    classes.append((class_data, year))
 
                     # Update teacher's classes
-                    teachers_col.update_one(
-                        {"_id": teacher_id},
-                        {"$push": {"classes": class_id}}
-                    )
+                    teacher["classes"].append(class_data["_id"])
 
     print("Creating students and assigning them to classes...")
-    for class_id, teacher_id, year in classes:
-        student_ids = []
+    students = []
+    events = []
+    for class_data, year in classes:
+        class_id = class_data["_id"]
+        teacher_id = class_data["teacher"]
         for _ in range(60):
             student = create_student(class_id, year)
-            student_id = students_col.insert_one(student).inserted_id
-            student_ids.append(student_id)
+            student["_id"] = ObjectId()
 
             # Create an event for the student
             event_name = faker.unique.catch_phrase()
@@ -139,28 +142,29 @@ def populate_database():
             status = random.choices(["Approved", "Rejected", "Pending"], weights=[40, 30, 30], k=1)[0]
             approved_by = teacher_id if status != "Pending" else None
 
-            event = create_event(event_name, student_id, category, approved_by, status)
-            event_id = events_col.insert_one(event).inserted_id
+            event = create_event(event_name, student["_id"], category, approved_by, status)
+            event["_id"] = ObjectId()
 
             # Update student's eventsParticipated
-            students_col.update_one(
-                {"_id": student_id},
-                {"$push": {"eventsParticipated": event_id}}
-            )
+            student["eventsParticipated"].append(event["_id"])
 
             # Add points for approved or participated events
             if status in ["Approved", "Pending"]:
-                points = events_col.find_one({"_id": event_id})["pointsEarned"]
-                students_col.update_one(
-                    {"_id": student_id},
-                    {"$inc": {"totalPoints": points}}
-                )
-
-        # Update class with students
-        classes_col.update_one(
-            {"_id": class_id},
-            {"$set": {"students": student_ids}}
-        )
+                student["totalPoints"] += event["pointsEarned"]
+
+            # Update class with students
+            class_data["students"].append(student["_id"])
+
+            students.append(student)
+            events.append(event)
+
+    print("Writing documents to the database...")
+    teachers_col.insert_many(teachers)
+    classes_col.insert_many([class_data for class_data, _ in classes])
+    students_col.insert_many(students)
+    events_col.insert_many(events)
+    print(f"Inserted {len(teachers)} teachers, {len(classes)} classes, "
+          f"{len(students)} students and {len(events)} events")
 
     print("Database populated successfully!")
 
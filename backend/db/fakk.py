@@ -7,6 +7,13 @@ import datetime
 from bson import ObjectId
 import time
 from tqdm import tqdm
+import os
+import sys
+
+# Shared seeding helpers live with the roster tooling in data/
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'data'))
+from bulk_writer import BulkWriter
+from points_engine import PointsEngine, LEGACY_POSITION_POINTS
 
 # Initialize faker
 fake = Faker('en_IN')
@@ -24,6 +31,7 @@ DEPARTMENTS = ['CSE', 'ECE', 'EEE', 'MECH', 'CIVIL', 'IT']
 SECTIONS = ['A1', 'A2', 'B1', 'B2', 'C1', 'C2', 'D1', 'D2', 'E1', 'E2']
 STUDENTS_PER_CLASS = 20
 CLASSES_PER_YEAR_PER_DEPT = 20  # User specified 20 classes per year per department
+WRITE_BATCH_SIZE = 1000  # Documents per unordered insert_many batch
 
 # Event configuration
 EVENT_CATEGORIES = ['Hackathon', 'Ideathon', 'Coding', 'Global-Certificates', 'Workshop', 'Conference', 'Others']
@@ -35,14 +43,12 @@ EVENT_ORGANIZERS = ['Industry Based', 'College Based']
 EVENT_TYPES = ['Individual', 'Team']
 COLLEGES = ['IIT Madras', 'NIT Trichy', 'VIT University', 'SRM University', 'Anna University']
 
-# Points configuration
-POINTS_CONFIG = {
-    'First': {'International': 100, 'National': 75, 'State': 50},
-    'Second': {'International': 75, 'National': 50, 'State': 30},
-    'Third': {'International': 50, 'National': 30, 'State': 20},
-    'Participant': {'International': 25, 'National': 15, 'State': 10},
-    'None': {'International': 10, 'National': 5, 'State': 3}
-}
+# Points configuration: these events carry participationType/eventScope/eventOrganizer/positionSecured
+# and no customAnswers, so they are scored with the version 2 rules, the latest ones keyed by those
+# attributes (the active rules score customAnswers). Events those rules have no entry for
+# (Ideathon, Conference, Coding at State scope, position 'None') keep the original position x scope points.
+POINTS_CONFIG_VERSION = 2
+POINTS_ENGINE = PointsEngine.from_dump(version=POINTS_CONFIG_VERSION, fallback=LEGACY_POSITION_POINTS)
 
 # Year to registration year mapping
 YEAR_TO_REG = {
@@ -277,9 +283,8 @@ def create_students(departments, years, classes_data):
     return students
 
 def create_events(students, classes_data, faculty_data):
-    """Create events for students with various statuses"""
+    """Yield events for students with various statuses, updating each student as it goes"""
     print("Creating Events...")
-    events = []
     
     # Current date for reference
     now = datetime.datetime.now()
@@ -340,15 +345,15 @@ def create_events(students, classes_data, faculty_data):
                 
             # Position and points
             position = random.choice(EVENT_POSITIONS)
-            points = 0
-            
             if position in ['First', 'Second', 'Third'] and event_scope:
-                points = POINTS_CONFIG[position][event_scope]
                 price_money = random.randint(1000, 50000)
-            elif position == 'Participant' and event_scope:
-                points = POINTS_CONFIG['Participant'][event_scope]
-            elif event_scope:
-                points = POINTS_CONFIG['None'][event_scope]
+            
+            points = POINTS_ENGINE.score(category, event={
+                "participationType": participation_type,
+                "eventScope": event_scope,
+                "eventOrganizer": event_organizer,
+                "positionSecured": position
+            })
             
             # Status (randomly choose, with bias toward approval)
             status = random.choices(
@@ -393,8 +398,8 @@ def create_events(students, classes_data, faculty_data):
             if price_money:
                 event["priceMoney"] = price_money
                 
-            # Add event to list
-            events.append(event)
+            # Hand the event to the caller as soon as it is built
+            yield event
             
             # Add event to student's participated events
             student["eventsParticipated"].append(event["_id"])
@@ -402,8 +407,6 @@ def create_events(students, classes_data, faculty_data):
             # Add points to student's total if approved
             if status == "Approved":
                 student["totalPoints"] += points
-    
-    return events
 
 def seed_database():
     """Main function to seed the database"""
@@ -430,9 +433,6 @@ def seed_database():
     # Create students
     students = create_students(DEPARTMENTS, years, classes)
     
-    # Create events
-    events = create_events(students, classes, faculty)
-    
     # Insert data into database
     print("Inserting data into database...")
     
@@ -450,8 +450,8 @@ def seed_database():
             all_teachers.extend(faculty[dept][year])
     
     # Insert teachers
-    db.teachers.insert_many(all_teachers)
-    print(f"Inserted {len(all_teachers)} teachers")
+    with BulkWriter(db.teachers, WRITE_BATCH_SIZE) as writer:
+        writer.extend(all_teachers)
     
     # Flatten classes
     all_classes = []
@@ -460,24 +460,23 @@ def seed_database():
             all_classes.extend(classes[dept][year])
     
     # Insert classes (fix: use dictionary-style access)
-    db['classes'].insert_many(all_classes)
-    print(f"Inserted {len(all_classes)} classes")
+    with BulkWriter(db['classes'], WRITE_BATCH_SIZE) as writer:
+        writer.extend(all_classes)
     
-    # Insert students
-    db.students.insert_many(students)
-    print(f"Inserted {len(students)} students")
+    # Create events, streaming them into MongoDB as they are generated
+    with BulkWriter(db.events, WRITE_BATCH_SIZE) as events_writer:
+        events_writer.extend(create_events(students, classes, faculty))
     
-    # Insert events
-    if events:
-        db.events.insert_many(events)
-        print(f"Inserted {len(events)} events")
+    # Insert students last, once their events and points are filled in
+    with BulkWriter(db.students, WRITE_BATCH_SIZE) as writer:
+        writer.extend(students)
     
     # Print summary
     print("\nDatabase seeding completed!")
     print(f"- {len(all_teachers)} teachers created")
     print(f"- {len(all_classes)} classes created")
     print(f"- {len(students)} students created")
-    print(f"- {len(events)} events created")
+    print(f"- {events_writer.inserted} events created")
     print(f"Total time: {time.time() - start_time:.2f} seconds")
 
 if __name__ == "__main__":
@@ -7,25 +7,52 @@ import datetime
 from bson import ObjectId
 import time
 from tqdm import tqdm
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+import os
+import sys
+import shutil
 
-# Initialize faker
-fake = Faker('en_IN')
+# Shared seeding helpers live with the roster tooling in data/
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'data'))
+from bulk_writer import BulkWriter
+from seed_indexes import build_class_index
+from points_engine import PointsEngine
+from text_pools import PooledFaker
+from seed_shards import derive_seed, ShardObjectIds, seeded_bcrypt_hash, BsonFileWriter
 
 # Connect to MongoDB
-client = MongoClient('mongodb://localhost:27017/')
-db = client['leaderboard_db_full_fake']
+MONGO_URI = 'mongodb://localhost:27017/'
+DATABASE_NAME = 'leaderboard_db_full_fake'
+client = MongoClient(MONGO_URI)
+db = client[DATABASE_NAME]
 
 # Configuration
-PASSWORD = bcrypt.hashpw("password123".encode('utf-8'), bcrypt.gensalt()).decode()
+MASTER_SEED = None  # Set to an int to make runs reproducible: it seeds every shard, ObjectId and the password salt
+REFERENCE_TIME = datetime.datetime(2025, 1, 1, 9, 0)  # Used as "now" for every timestamp when MASTER_SEED is set
+SHARD_BY = None  # 'department' or 'department_year' to generate shards in worker processes (None = one process)
+SHARD_WORKERS = None  # Worker processes for sharded runs (None = all cores)
+OUTPUT_DIR = None  # Write each shard's collections as .bson files under OUTPUT_DIR/shard-NN instead of to MongoDB
 RAW_PASSWORD = "password123"
+if MASTER_SEED is None:
+    PASSWORD = bcrypt.hashpw(RAW_PASSWORD.encode('utf-8'), bcrypt.gensalt()).decode()
+else:
+    PASSWORD = seeded_bcrypt_hash(RAW_PASSWORD, derive_seed(MASTER_SEED, 'password'))
 CURRENT_YEAR = 2024
 ACADEMIC_YEAR = "2024-2025"
 
 # Updated departments as requested
 DEPARTMENTS = ['CTECH', 'CINTEL', 'DSBS', 'NWC']
+YEARS = [1, 2, 3, 4]  # BTech years of study
 SECTIONS = ['A1', 'A2', 'B1', 'B2', 'C1', 'C2', 'D1', 'D2', 'E1', 'E2', 'F1', 'F2']  # At least 10 sections
 STUDENTS_PER_CLASS = 25
 CLASSES_PER_YEAR_PER_DEPT = 10  # 10 sections per department
+WRITE_BATCH_SIZE = 1000  # Documents per unordered insert_many batch
+FAST_TEXT = False  # Draw names/phrases from pregenerated pools instead of calling Faker per document
+TEXT_POOL_DIR = '.text_pools'  # Where the pools are cached; set to None to rebuild them every run
+
+# Initialize faker
+fake = PooledFaker('en_IN', pool_dir=TEXT_POOL_DIR) if FAST_TEXT else Faker('en_IN')
 
 # Event configuration - using all categories from the configuration
 EVENT_CATEGORIES = ['Hackathon', 'Coding Competitions', 'Open Source', 'Research', 'Certifications', 'NCC_NSS_YRC', 'Sports', 'Workshops', 'Student Leadership', 'Social Work & Community Impact']
@@ -39,194 +66,8 @@ EVENT_SCOPES = ['International', 'National', 'State']  # Keep for backward compa
 EVENT_TYPES = ['Individual', 'Team']  # Keep for backward compatibility
 COLLEGES = ['IIT Madras', 'NIT Trichy', 'VIT University', 'SRM University', 'Anna University']
 
-# Updated points configuration based on the provided schema
-POINTS_CONFIG = {
-    'Hackathon': {
-        'Level': {
-            'Intra-College': 10,
-            'Inter-College': 20,
-            'National': 30,
-            'International': 50
-        },
-        'Organizer': {
-            'Industry': 5,
-            'Academic Institution': 3
-        },
-        'Mode': {
-            'Solo Participation': 5,
-            'Team Participation': 3
-        },
-        'Outcome': {
-            'Winner (1st)': 25,
-            'Runner-up (2nd)': 20,
-            '3rd Place': 15,
-            'Finalist': 10,
-            'Participant': 5
-        }
-    },
-    'Coding Competitions': {
-        'Platform': {
-            'Top-tier': 10,
-            'Unknown': 3
-        },
-        'Result Percentile': {
-            'Top 1%': 25,
-            'Top 5%': 20,
-            'Top 10%': 10,
-            'Participant': 5
-        },
-        'Region': {
-            'International': 10,
-            'National': 5
-        }
-    },
-    'Open Source': {
-        'Repo Forks': {
-            '>1000': 30,
-            '500–1000': 15,
-            'Less than 500': 0
-        },
-        'PR Status': {
-            'Merged': 10,
-            'Pending Review': 0
-        },
-        'Type of Work': {
-            'Feature': 15,
-            'Bug Fix': 10,
-            'Documentation': 5
-        },
-        'Lines of Code': {
-            '0–100': 2,
-            '100–500': 5,
-            '500+': 10
-        },
-        'Contributor Badge': {
-            'Hacktoberfest finisher': 20,
-            'GSoC Contributor': 40,
-            'None': 0
-        }
-    },
-    'Research': {
-        'Publisher': {
-            'IEEE/Springer/Elsevier(Q1)': 25,
-            'Other Scopus/SCI Journals (Q2)': 15,
-            'Others': 5
-        },
-        'Authorship': {
-            '1st Author': 20,
-            '2nd Author': 15,
-            'Co-author': 10
-        },
-        'Paper Type': {
-            'Research': 10,
-            'Review/Survey': 5
-        },
-        'Level': {
-            'National': 5,
-            'International': 10
-        }
-    },
-    'Certifications': {
-        'Provider': {
-            'Stanford/MIT/AWS/Google/Top 500': 20,
-            'NPTEL': 10,
-            'Coursera/Udemy': 2
-        },
-        'Final Project Required': {
-            'Yes': 10
-        },
-        'Certification Level': {
-            'Beginner': 5,
-            'Intermediate': 10,
-            'Advanced': 15
-        }
-    },
-    'NCC_NSS_YRC': {
-        'Camps Attended': {
-            'RDC/TSC/NSC/VSC': 15,
-            'NIC/Others': 10,
-            'CATC/ATC': 5
-        },
-        'Equivalent Rank': {
-            'SUO': 15,
-            'JUO': 12,
-            'CSM': 10,
-            'CQMS': 8,
-            'Sgt': 6,
-            'Cp': 4,
-            'Lc': 2,
-            'Cdt': 1
-        },
-        'Award': {
-            'Best Cadet/Parade': 20
-        },
-        'Volunteer Hours': {
-            '50+': 5,
-            '100+': 10,
-            '200+': 20
-        }
-    },
-    'Sports': {
-        'Level': {
-            'College': 10,
-            'Inter-College': 20,
-            'State': 30,
-            'National': 50,
-            'International': 70
-        },
-        'Position': {
-            'Winner': 30,
-            'Runner-Up': 20,
-            'Participant': 10
-        },
-        'Type': {
-            'Individual Sport': 10,
-            'Team Sport': 5
-        }
-    },
-    'Workshops': {
-        'Duration': {
-            '1 day': 5,
-            '3 day': 15,
-            '>5 full day': 20
-        },
-        'Role': {
-            'Attendee': 0,
-            'Organizer': 10
-        },
-        'Industry organizer': {
-            'Yes(Top 500 MNCs)': 10,
-            'No': 0
-        }
-    },
-    'Student Leadership': {
-        'Role': {
-            'Club President': 20,
-            'Secretary/Core Team Heads': 10,
-            'Member': 5
-        },
-        'Events Managed': {
-            '<100 participants': 10,
-            '100–500': 15,
-            '500+': 20
-        },
-        'Organized Series': {
-            'Webinars/Tech Talks/etc': 10
-        }
-    },
-    'Social Work & Community Impact': {
-        'Type of Activity': {
-            'Plantation/Cleanup Drive': 10,
-            'Education/NGO Teaching': 15,
-            'Health/Disaster Relief': 20
-        },
-        'Hours Invested': {
-            '20–50 hrs': 10,
-            '50–100 hrs': 20,
-            '100+ hrs': 30
-        }
-    }
-}
+# Event points are scored with the rules in the pointsconfigs dump, like the backend does
+POINTS_ENGINE = PointsEngine.from_dump()
 
 # Year to registration year mapping - 2026 passout students are 4th year
 YEAR_TO_REG = {
@@ -251,6 +92,36 @@ DEPT_FULL_NAMES = {
     'NWC': 'Networks and Communications'
 }
 
+# Makes document ids; start_shard swaps in a deterministic factory for seeded runs
+new_id = ObjectId
+
+def current_time():
+    """Timestamp for generated documents - pinned to REFERENCE_TIME in seeded runs"""
+    return REFERENCE_TIME if MASTER_SEED is not None else datetime.datetime.now()
+
+def start_shard(shard_number, label):
+    """Seed the random module, Faker and the ObjectId factory for one shard
+
+    Seeded runs derive everything from MASTER_SEED and the shard label, so
+    a shard produces the same documents whichever worker runs it. Unseeded
+    runs still give each shard its own Faker stream, since forked workers
+    would otherwise inherit the same one.
+    """
+    global new_id
+    if MASTER_SEED is None:
+        fake.seed_instance(random.getrandbits(64))
+        return
+    seed = derive_seed(MASTER_SEED, label)
+    random.seed(seed)
+    fake.seed_instance(seed)
+    new_id = ShardObjectIds(MASTER_SEED, shard_number, REFERENCE_TIME)
+
+def open_writer(collection, shard_number, mongo_db):
+    """Writer for one collection: batched MongoDB inserts, or a shard .bson file when OUTPUT_DIR is set"""
+    if OUTPUT_DIR:
+        return BsonFileWriter(os.path.join(OUTPUT_DIR, f"shard-{shard_number:02d}", f"{collection}.bson"))
+    return BulkWriter(mongo_db[collection], WRITE_BATCH_SIZE)
+
 def clear_database():
     """Clear all collections before seeding"""
     print("Clearing existing database...")
@@ -265,7 +136,7 @@ def create_chairperson():
     print("Creating Chairperson...")
     
     chairperson = {
-        "_id": ObjectId(),
+        "_id": new_id(),
         "name": f"Dr. {fake.name()}",
         "email": "chairperson@college.edu",
         "password": PASSWORD,
@@ -276,8 +147,8 @@ def create_chairperson():
         # No department for Chairperson - institution-wide access
         "classes": [],
         "isActive": True,
-        "createdAt": datetime.datetime.now(),
-        "updatedAt": datetime.datetime.now()
+        "createdAt": current_time(),
+        "updatedAt": current_time()
     }
     
     return chairperson
@@ -296,7 +167,7 @@ def create_associate_chairpersons():
     
     for i, managed_depts in enumerate(department_assignments, 1):
         associate_chairperson = {
-            "_id": ObjectId(),
+            "_id": new_id(),
             "name": f"Dr. {fake.name()}",
             "email": f"associate.chair{i}@college.edu",
             "password": PASSWORD,
@@ -308,8 +179,8 @@ def create_associate_chairpersons():
             "managedDepartments": managed_depts,  # All managed departments
             "classes": [],
             "isActive": True,
-            "createdAt": datetime.datetime.now(),
-            "updatedAt": datetime.datetime.now()
+            "createdAt": current_time(),
+            "updatedAt": current_time()
         }
         associate_chairpersons.append(associate_chairperson)
     
@@ -323,7 +194,7 @@ def create_hods():
     for dept in DEPARTMENTS:
         register_no = f"HOD-{dept}-001"
         hod = {
-            "_id": ObjectId(),
+            "_id": new_id(),
             "name": f"Dr. {fake.name()}",
             "email": f"hod.{dept.lower()}@college.edu",
             "password": PASSWORD,
@@ -334,18 +205,18 @@ def create_hods():
             "department": dept,
             "classes": [],
             "isActive": True,
-            "createdAt": datetime.datetime.now(),
-            "updatedAt": datetime.datetime.now()
+            "createdAt": current_time(),
+            "updatedAt": current_time()
         }
         hods[dept] = hod
     
     return hods
 
-def create_academic_advisors(departments, years):
-    """Create academic advisors for each department and year"""
+def create_academic_advisors(departments, years, counter_start=1):
+    """Create academic advisors for each department and year, numbered from counter_start"""
     print("Creating Academic Advisors...")
     advisors = {}
-    counter = 1
+    counter = counter_start
     
     for dept in departments:
         advisors[dept] = {}
@@ -354,7 +225,7 @@ def create_academic_advisors(departments, years):
             # Create one academic advisor per year per department
             register_no = f"ADV-{dept}-{year}-{counter:03d}"
             advisor = {
-                "_id": ObjectId(),
+                "_id": new_id(),
                 "name": f"Dr. {fake.name()}",
                 "email": f"advisor{counter}.{dept.lower()}@college.edu",
                 "password": PASSWORD,
@@ -365,19 +236,19 @@ def create_academic_advisors(departments, years):
                 "department": dept,
                 "classes": [],
                 "isActive": True,
-                "createdAt": datetime.datetime.now(),
-                "updatedAt": datetime.datetime.now()
+                "createdAt": current_time(),
+                "updatedAt": current_time()
             }
             advisors[dept][year].append(advisor)
             counter += 1
     
     return advisors
 
-def create_faculty(departments, years, classes_per_year):
-    """Create faculty members for each class"""
+def create_faculty(departments, years, classes_per_year, counter_start=1):
+    """Create faculty members for each class, numbered from counter_start"""
     print("Creating Faculty members...")
     faculty = {}
-    counter = 1
+    counter = counter_start
     
     for dept in departments:
         faculty[dept] = {}
@@ -387,7 +258,7 @@ def create_faculty(departments, years, classes_per_year):
             for i in range(classes_per_year):
                 register_no = f"FAC-{dept}-{year}-{counter:03d}"
                 teacher = {
-                    "_id": ObjectId(),
+                    "_id": new_id(),
                     "name": f"Prof. {fake.name()}",
                     "email": f"faculty{counter}.{dept.lower()}@college.edu",
                     "password": PASSWORD,
@@ -398,8 +269,8 @@ def create_faculty(departments, years, classes_per_year):
                     "department": dept,
                     "classes": [],
                     "isActive": True,
-                    "createdAt": datetime.datetime.now(),
-                    "updatedAt": datetime.datetime.now()
+                    "createdAt": current_time(),
+                    "updatedAt": current_time()
                 }
                 faculty[dept][year].append(teacher)
                 counter += 1
@@ -430,7 +301,7 @@ def create_classes(departments, years, faculty_data, advisors_data, sections):
                 assigned_faculty = dept_faculty[i] if i < len(dept_faculty) else dept_faculty[0]
                 
                 class_obj = {
-                    "_id": ObjectId(),
+                    "_id": new_id(),
                     "year": year,
                     "section": section,
                     "className": class_name,
@@ -440,8 +311,8 @@ def create_classes(departments, years, faculty_data, advisors_data, sections):
                     "students": [],
                     "facultyAssigned": [assigned_faculty["_id"]],
                     "academicAdvisors": [advisor["_id"] for advisor in dept_advisors],
-                    "createdAt": datetime.datetime.now(),
-                    "updatedAt": datetime.datetime.now()
+                    "createdAt": current_time(),
+                    "updatedAt": current_time()
                 }
                 
                 # Add this class to the faculty's classes
@@ -455,15 +326,15 @@ def create_classes(departments, years, faculty_data, advisors_data, sections):
     
     return classes
 
-def create_students(departments, years, classes_data):
-    """Create students for each class"""
+def create_students(departments, years, classes_data, register_start=1):
+    """Create students for each class, with register numbers counting up from register_start per department"""
     print("Creating Students...")
     students = []
     register_counter = {}
     
     # Initialize counters for each department
     for dept in departments:
-        register_counter[dept] = 1
+        register_counter[dept] = register_start
     
     for dept in departments:
         for year in years:
@@ -477,7 +348,7 @@ def create_students(departments, years, classes_data):
                     reg_no = f"{reg_year}{dept}{register_counter[dept]:03d}"
                     
                     student = {
-                        "_id": ObjectId(),
+                        "_id": new_id(),
                         "name": fake.name(),
                         "profileImg": None,
                         "email": f"{reg_no.lower()}@student.college.edu",
@@ -507,8 +378,8 @@ def create_students(departments, years, classes_data):
                             "classRef": class_obj["_id"]
                         }],
                         "achievements": [],
-                        "createdAt": datetime.datetime.now(),
-                        "updatedAt": datetime.datetime.now()
+                        "createdAt": current_time(),
+                        "updatedAt": current_time()
                     }
                     
                     # Add student to this class's student list
@@ -520,17 +391,24 @@ def create_students(departments, years, classes_data):
     
     return students
 
-def create_realistic_events(students, classes_data, faculty_data):
-    """Create realistic events where students apply and faculty approve/reject/leave pending"""
+def create_realistic_events(students, classes_data, faculty_data, progress=True):
+    """Yield realistic events where students apply and faculty approve/reject/leave pending"""
     print("Creating Events with realistic approval workflow...")
-    events = []
     
     # Current date for reference
-    now = datetime.datetime.now()
+    now = current_time()
     six_months_ago = now - datetime.timedelta(days=180)
     
+    # Resolve each student's class in constant time
+    class_by_id = build_class_index(
+        class_obj
+        for dept_classes in classes_data.values()
+        for year_classes in dept_classes.values()
+        for class_obj in year_classes
+    )
+    
     # Create events with realistic patterns
-    for student in tqdm(students, desc="Creating events for students"):
+    for student in tqdm(students, desc="Creating events for students", disable=not progress):
         # More active students have more events (realistic distribution)
         activity_level = random.choices(
             ['low', 'medium', 'high'], 
@@ -551,15 +429,9 @@ def create_realistic_events(students, classes_data, faculty_data):
         # Find faculty for this student
         student_class_id = student["class"]
         student_dept = student["department"]
-        student_year = student["year"]
         
         # Find the class object and its assigned faculty
-        class_obj = None
-        for cls in classes_data[student_dept][student_year]:
-            if cls["_id"] == student_class_id:
-                class_obj = cls
-                break
-        
+        class_obj = class_by_id.get(student_class_id)
         if not class_obj:
             continue
             
@@ -604,7 +476,7 @@ def create_realistic_events(students, classes_data, faculty_data):
             
             # Create event object
             event = {
-                "_id": ObjectId(),
+                "_id": new_id(),
                 "eventName": event_name,
                 "description": f"Participated in {event_name}",
                 "date": event_date,
@@ -619,15 +491,15 @@ def create_realistic_events(students, classes_data, faculty_data):
                 "department": student_dept,  # Add department for filtering
                 "customAnswers": custom_answers,  # Add custom answers for validation
                 "createdAt": submission_date,
-                "updatedAt": datetime.datetime.now() if status != "Pending" else submission_date
+                "updatedAt": current_time() if status != "Pending" else submission_date
             }
             
             # Add event-specific details
             for key, value in event_details.items():
                 event[key] = value
                 
-            # Add event to list
-            events.append(event)
+            # Hand the event to the caller as soon as it is built
+            yield event
             
             # Add event to student's participated events
             student["eventsParticipated"].append(event["_id"])
@@ -635,12 +507,9 @@ def create_realistic_events(students, classes_data, faculty_data):
             # Add points to student's total if approved
             if status == "Approved":
                 student["totalPoints"] += final_points
-    
-    return events
 
 def create_event_details(category):
     """Create realistic event details and calculate points based on category"""
-    points = 0
     event_details = {}
     custom_answers = {}
     
@@ -661,11 +530,6 @@ def create_event_details(category):
             'outcome': outcome
         }
         
-        points = (POINTS_CONFIG['Hackathon']['Level'][level] + 
-                 POINTS_CONFIG['Hackathon']['Organizer'][organizer_type] + 
-                 POINTS_CONFIG['Hackathon']['Mode'][participation_mode] + 
-                 POINTS_CONFIG['Hackathon']['Outcome'][outcome])
-        
         event_details = {
             'eventLevel': level,
             'organizer': organizer_type,
@@ -687,10 +551,6 @@ def create_event_details(category):
             'region': region
         }
         
-        points = (POINTS_CONFIG['Coding Competitions']['Platform'][platform] + 
-                 POINTS_CONFIG['Coding Competitions']['Result Percentile'][percentile] + 
-                 POINTS_CONFIG['Coding Competitions']['Region'][region])
-        
         event_details = {
             'platform': platform,
             'resultPercentile': percentile,
@@ -716,12 +576,6 @@ def create_event_details(category):
             'contributor_badge': contributor_badge
         }
         
-        points = (POINTS_CONFIG['Open Source']['Repo Forks'][repo_forks] + 
-                 POINTS_CONFIG['Open Source']['PR Status'][pr_status] + 
-                 POINTS_CONFIG['Open Source']['Type of Work'][work_type] + 
-                 POINTS_CONFIG['Open Source']['Lines of Code'][lines_of_code] + 
-                 POINTS_CONFIG['Open Source']['Contributor Badge'][contributor_badge])
-        
         event_details = {
             'repoForks': repo_forks,
             'prStatus': pr_status,
@@ -749,11 +603,6 @@ def create_event_details(category):
             'conference_level': conference_level
         }
         
-        points = (POINTS_CONFIG['Research']['Publisher'][publisher] + 
-                 POINTS_CONFIG['Research']['Authorship'][authorship] + 
-                 POINTS_CONFIG['Research']['Paper Type'][paper_type] + 
-                 POINTS_CONFIG['Research']['Level'][conference_level])
-        
         event_details = {
             'publisher': publisher,
             'authorship': authorship,
@@ -777,12 +626,6 @@ def create_event_details(category):
             'level': cert_level
         }
         
-        points = (POINTS_CONFIG['Certifications']['Provider'][provider] + 
-                 POINTS_CONFIG['Certifications']['Certification Level'][cert_level])
-        
-        if final_project == 'Yes':
-            points += POINTS_CONFIG['Certifications']['Final Project Required']['Yes']
-        
         event_details = {
             'provider': provider,
             'finalProject': final_project,
@@ -806,13 +649,6 @@ def create_event_details(category):
             'volunteer_hours': volunteer_hours
         }
         
-        points = (POINTS_CONFIG['NCC_NSS_YRC']['Camps Attended'][camp] + 
-                 POINTS_CONFIG['NCC_NSS_YRC']['Equivalent Rank'][rank] + 
-                 POINTS_CONFIG['NCC_NSS_YRC']['Volunteer Hours'][volunteer_hours])
-        
-        if award != 'None':
-            points += POINTS_CONFIG['NCC_NSS_YRC']['Award'][award]
-        
         event_details = {
             'campAttended': camp,
             'rank': rank,
@@ -835,10 +671,6 @@ def create_event_details(category):
             'type': sport_type
         }
         
-        points = (POINTS_CONFIG['Sports']['Level'][level] + 
-                 POINTS_CONFIG['Sports']['Position'][position] + 
-                 POINTS_CONFIG['Sports']['Type'][sport_type])
-        
         event_details = {
             'eventLevel': level,
             'positionSecured': position,
@@ -859,10 +691,6 @@ def create_event_details(category):
             'industry_organizer': industry_organizer
         }
         
-        points = (POINTS_CONFIG['Workshops']['Duration'][duration] + 
-                 POINTS_CONFIG['Workshops']['Role'][role] + 
-                 POINTS_CONFIG['Workshops']['Industry organizer'][industry_organizer])
-        
         event_details = {
             'duration': duration,
             'role': role,
@@ -884,12 +712,6 @@ def create_event_details(category):
             'organized_series': organized_series
         }
         
-        points = (POINTS_CONFIG['Student Leadership']['Role'][role] + 
-                 POINTS_CONFIG['Student Leadership']['Events Managed'][events_managed])
-        
-        if organized_series != 'None':
-            points += POINTS_CONFIG['Student Leadership']['Organized Series'][organized_series]
-        
         event_details = {
             'leadershipRole': role,
             'eventsManaged': events_managed,
@@ -909,26 +731,63 @@ def create_event_details(category):
             'hours_invested': hours_invested
         }
         
-        points = (POINTS_CONFIG['Social Work & Community Impact']['Type of Activity'][activity_type] + 
-                 POINTS_CONFIG['Social Work & Community Impact']['Hours Invested'][hours_invested])
-        
         event_details = {
             'activityType': activity_type,
             'hoursInvested': hours_invested,
             'positionSecured': 'Volunteer'
         }
     
+    points = POINTS_ENGINE.score(category, custom_answers)
     return event_name, points, event_details, custom_answers
 
-def seed_database():
-    """Main function to seed the database"""
-    start_time = time.time()
+def clear_output_dir():
+    """Remove the shard directories a previous file run left in OUTPUT_DIR"""
+    print(f"Clearing previous shards in {OUTPUT_DIR}...")
+    if not os.path.isdir(OUTPUT_DIR):
+        return
+    for name in os.listdir(OUTPUT_DIR):
+        if name.startswith('shard-'):
+            shutil.rmtree(os.path.join(OUTPUT_DIR, name))
+
+def write_documents(shard_number, mongo_db, teachers, classes, students, faculty, progress=True):
+    """Write teachers and classes, stream the events, then write students once their points are in
+
+    classes and faculty are the nested dept -> year -> list dicts the
+    create_* functions return. Returns the event status counts.
+    """
+    all_classes = [
+        class_obj
+        for dept_classes in classes.values()
+        for year_classes in dept_classes.values()
+        for class_obj in year_classes
+    ]
+    
+    with open_writer('teachers', shard_number, mongo_db) as writer:
+        writer.extend(teachers)
+    
+    with open_writer('classes', shard_number, mongo_db) as writer:
+        writer.extend(all_classes)
     
+    # Create realistic events, streaming them out as they are generated
+    status_counts = Counter()
+    with open_writer('events', shard_number, mongo_db) as writer:
+        for event in create_realistic_events(students, classes, faculty, progress):
+            status_counts[event['status']] += 1
+            writer.add(event)
+    
+    # Insert students last, once their events and points are filled in
+    with open_writer('students', shard_number, mongo_db) as writer:
+        writer.extend(students)
+    
+    return status_counts
+
+def seed_in_process():
+    """Build and write the whole dataset in this process; returns the document counts"""
     # Clear existing data
-    clear_database()
+    clear_output_dir() if OUTPUT_DIR else clear_database()
+    start_shard(0, 'all')
     
-    # Define years for BTech program
-    years = [1, 2, 3, 4]
+    years = YEARS
     
     # Create leadership roles
     chairperson = create_chairperson()
@@ -949,9 +808,6 @@ def seed_database():
     # Create students
     students = create_students(DEPARTMENTS, years, classes)
     
-    # Create realistic events
-    events = create_realistic_events(students, classes, faculty)
-    
     # Insert data into database
     print("Inserting data into database...")
     
@@ -968,28 +824,72 @@ def seed_database():
         for year in years:
             all_teachers.extend(faculty[dept][year])
     
-    # Insert teachers
-    db.teachers.insert_many(all_teachers)
-    print(f"Inserted {len(all_teachers)} teachers")
-    
-    # Flatten classes
-    all_classes = []
-    for dept in DEPARTMENTS:
-        for year in years:
-            all_classes.extend(classes[dept][year])
-    
-    # Insert classes
-    db['classes'].insert_many(all_classes)
-    print(f"Inserted {len(all_classes)} classes")
-    
-    # Insert students
-    db.students.insert_many(students)
-    print(f"Inserted {len(students)} students")
-    
-    # Insert events
-    if events:
-        db.events.insert_many(events)
-        print(f"Inserted {len(events)} events")
+    status_counts = write_documents(0, db, all_teachers, classes, students, faculty)
+    class_count = len(DEPARTMENTS) * len(years) * CLASSES_PER_YEAR_PER_DEPT
+    return len(all_teachers), class_count, len(students), status_counts
+
+def plan_shards():
+    """(shard_number, label, department, years) for every worker shard; shard 0 is the institution-wide staff"""
+    if SHARD_BY == 'department':
+        groups = [(dept, YEARS) for dept in DEPARTMENTS]
+    elif SHARD_BY == 'department_year':
+        groups = [(dept, [year]) for dept in DEPARTMENTS for year in YEARS]
+    else:
+        raise ValueError(f"Unknown SHARD_BY {SHARD_BY!r}; use 'department' or 'department_year'")
+    return [
+        (shard_number, f"{dept}-{'-'.join(str(year) for year in years)}", dept, years)
+        for shard_number, (dept, years) in enumerate(groups, 1)
+    ]
+
+def generate_shard(shard):
+    """Build and write one department or department-year shard - runs inside a worker process"""
+    shard_number, label, dept, years = shard
+    start_shard(shard_number, label)
+    # Forked workers must not share the parent's connection
+    mongo_db = None if OUTPUT_DIR else MongoClient(MONGO_URI)[DATABASE_NAME]
+    
+    # Counters continue from the shards before this one, so register numbers and emails match a single-process run
+    ordinal = DEPARTMENTS.index(dept) * len(YEARS) + YEARS.index(years[0])
+    advisors = create_academic_advisors([dept], years, counter_start=ordinal + 1)
+    faculty = create_faculty([dept], years, CLASSES_PER_YEAR_PER_DEPT,
+                             counter_start=ordinal * CLASSES_PER_YEAR_PER_DEPT + 1)
+    classes = create_classes([dept], years, faculty, advisors, SECTIONS)
+    students = create_students([dept], years, classes,
+                               register_start=YEARS.index(years[0]) * CLASSES_PER_YEAR_PER_DEPT * STUDENTS_PER_CLASS + 1)
+    
+    teachers = [advisor for year in years for advisor in advisors[dept][year]]
+    teachers += [teacher for year in years for teacher in faculty[dept][year]]
+    status_counts = write_documents(shard_number, mongo_db, teachers, classes, students, faculty, progress=False)
+    return label, len(teachers), len(years) * CLASSES_PER_YEAR_PER_DEPT, len(students), status_counts
+
+def seed_sharded():
+    """Build the dataset in worker processes, one shard per department or department-year"""
+    shards = plan_shards()
+    workers = min(SHARD_WORKERS or os.cpu_count() or 1, len(shards))
+    clear_output_dir() if OUTPUT_DIR else clear_database()
+    
+    # The few institution-wide staff are shard 0, built here
+    start_shard(0, 'institution')
+    leadership = [create_chairperson()] + create_associate_chairpersons() + list(create_hods().values())
+    with open_writer('teachers', 0, db) as writer:
+        writer.extend(leadership)
+    
+    print(f"Generating {len(shards)} shards by {SHARD_BY} on {workers} worker(s)...")
+    teacher_count, class_count, student_count = len(leadership), 0, 0
+    status_counts = Counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for label, teachers, classes, students, shard_statuses in tqdm(
+                executor.map(generate_shard, shards), total=len(shards), desc="Generating shards"):
+            teacher_count += teachers
+            class_count += classes
+            student_count += students
+            status_counts.update(shard_statuses)
+    return teacher_count, class_count, student_count, status_counts
+
+def print_summary(teacher_count, class_count, student_count, status_counts, start_time):
+    """Print what was generated"""
+    years = YEARS
+    total_events = sum(status_counts.values())
     
     # Print detailed summary
     print("\n" + "="*60)
@@ -997,7 +897,7 @@ def seed_database():
     print("="*60)
     
     print(f"\n📊 SUMMARY:")
-    print(f"   • Total Teachers: {len(all_teachers)}")
+    print(f"   • Total Teachers: {teacher_count}")
     print(f"     - 1 Chairperson")
     print(f"     - 2 Associate Chairpersons")
     print(f"     - {len(DEPARTMENTS)} HODs (one per department)")
@@ -1007,20 +907,20 @@ def seed_database():
     print(f"\n   • Departments: {', '.join(DEPARTMENTS)}")
     print(f"   • Classes per department per year: {CLASSES_PER_YEAR_PER_DEPT}")
     print(f"   • Students per class: {STUDENTS_PER_CLASS}")
-    print(f"   • Total Classes: {len(all_classes)}")
-    print(f"   • Total Students: {len(students)}")
-    print(f"   • Total Events: {len(events)}")
+    print(f"   • Total Classes: {class_count}")
+    print(f"   • Total Students: {student_count}")
+    print(f"   • Total Events: {total_events}")
     
     # Event status breakdown
-    if events:
-        pending = sum(1 for e in events if e['status'] == 'Pending')
-        approved = sum(1 for e in events if e['status'] == 'Approved')
-        rejected = sum(1 for e in events if e['status'] == 'Rejected')
+    if total_events:
+        pending = status_counts['Pending']
+        approved = status_counts['Approved']
+        rejected = status_counts['Rejected']
         
         print(f"\n   • Event Status Distribution:")
-        print(f"     - Pending: {pending} ({pending/len(events)*100:.1f}%)")
-        print(f"     - Approved: {approved} ({approved/len(events)*100:.1f}%)")
-        print(f"     - Rejected: {rejected} ({rejected/len(events)*100:.1f}%)")
+        print(f"     - Pending: {pending} ({pending/total_events*100:.1f}%)")
+        print(f"     - Approved: {approved} ({approved/total_events*100:.1f}%)")
+        print(f"     - Rejected: {rejected} ({rejected/total_events*100:.1f}%)")
     
     print(f"\n🔐 Login Credentials:")
     print(f"   • Password for all users: password123")
@@ -1031,5 +931,11 @@ def seed_database():
     print(f"\n⏱️  Total execution time: {time.time() - start_time:.2f} seconds")
     print("="*60)
 
+def seed_database():
+    """Main function to seed the database"""
+    start_time = time.time()
+    counts = seed_sharded() if SHARD_BY else seed_in_process()
+    print_summary(*counts, start_time)
+
 if __name__ == "__main__":
     seed_database()
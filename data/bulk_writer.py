@@ -0,0 +1,85 @@
+import time
+
+from pymongo.errors import BulkWriteError
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+class BulkWriter:
+    """Buffer documents and flush them to a collection in fixed-size unordered batches
+
+    Use as a context manager so the final partial batch is written on exit:
+
+        with BulkWriter(db.events) as writer:
+            for event in create_events(...):
+                writer.add(event)
+
+    At most batch_size documents are held in memory at any time.
+    """
+
+    def __init__(self, collection, batch_size=DEFAULT_BATCH_SIZE, verbose=False):
+        self.collection = collection
+        self.batch_size = batch_size
+        self.verbose = verbose  # Print timing for every batch, not just the summary
+        self.buffer = []
+        self.inserted = 0
+        self.failed = 0
+        self.batches = 0
+        self.write_time = 0.0
+        self.slowest_batch = 0.0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        if exc_type is None:
+            self.close()
+        return False
+
+    def add(self, document):
+        """Queue a document, flushing once a full batch is buffered"""
+        self.buffer.append(document)
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+
+    def extend(self, documents):
+        """Queue every document from an iterable"""
+        for document in documents:
+            self.add(document)
+
+    def flush(self):
+        """Write the buffered documents as one unordered insert_many"""
+        if not self.buffer:
+            return
+
+        batch_start = time.time()
+        try:
+            result = self.collection.insert_many(self.buffer, ordered=False)
+            inserted = len(result.inserted_ids)
+        except BulkWriteError as e:
+            # Unordered writes keep going past bad documents - record what failed
+            inserted = e.details.get('nInserted', 0)
+            errors = e.details.get('writeErrors', [])
+            self.failed += len(errors)
+            print(f"  - {len(errors)} write errors in {self.collection.name} batch {self.batches + 1}: "
+                  f"{errors[0].get('errmsg') if errors else e}")
+        elapsed = time.time() - batch_start
+
+        self.inserted += inserted
+        self.batches += 1
+        self.write_time += elapsed
+        self.slowest_batch = max(self.slowest_batch, elapsed)
+        if self.verbose:
+            print(f"  - {self.collection.name} batch {self.batches}: {inserted} documents in {elapsed:.3f} seconds")
+        self.buffer = []
+
+    def close(self):
+        """Flush the last partial batch and print a summary"""
+        self.flush()
+        if not self.batches:
+            return
+        print(f"Inserted {self.inserted} {self.collection.name} documents in {self.batches} batches "
+              f"({self.write_time:.2f} seconds writing, "
+              f"avg {self.write_time / self.batches:.3f}s, slowest {self.slowest_batch:.3f}s per batch)")
+        if self.failed:
+            print(f"WARNING: {self.failed} {self.collection.name} documents failed to insert")
@@ -1,12 +1,40 @@
 import os
-import pandas as pd
-import glob
+
+from csv_loader import find_csv_files, iter_csv_files
+
+def find_space_issues(df):
+    """Strip leading/trailing spaces from every cell in place and report each cell fixed."""
+    issues = []
+    for col in df.columns:
+        values = df[col]
+        stripped = values.str.strip()
+        mask = values.notna() & (values != stripped)
+        if not mask.any():
+            continue
+        
+        # Count the spaces only for the offending cells
+        bad = values[mask]
+        lengths = bad.str.len()
+        leading = lengths - bad.str.lstrip().str.len()
+        trailing = lengths - bad.str.rstrip().str.len()
+        
+        for idx, value, leading_spaces, trailing_spaces in zip(bad.index, bad, leading, trailing):
+            issue_type = []
+            if leading_spaces > 0:
+                issue_type.append(f"{leading_spaces} leading")
+            if trailing_spaces > 0:
+                issue_type.append(f"{trailing_spaces} trailing")
+            issues.append(f"Row {idx+1}, Column '{col}': '{value}' has {' and '.join(issue_type)} space(s)")
+        
+        df[col] = values.where(~mask, stripped)
+    
+    return issues
 
 def check_and_fix_spaces():
     """Check and fix leading/trailing spaces in all CSV files."""
     # Find all CSV files in the csv_output directory
     csv_path = "csv_output/*.csv"
-    csv_files = glob.glob(csv_path)
+    csv_files = find_csv_files(csv_path)
     
     print(f"Found {len(csv_files)} CSV files.\n")
     
@@ -14,44 +42,20 @@ def check_and_fix_spaces():
     files_with_issues = 0
     total_issues = 0
     
-    # Process each CSV file
-    for file in csv_files:
+    # Process each CSV file (read concurrently, as strings to catch spaces correctly)
+    for file, df in iter_csv_files(csv_files, normalise=False, dtype=str):
         file_name = os.path.basename(file)
         try:
-            # Read the CSV file
-            df = pd.read_csv(file, dtype=str)  # Read everything as string to catch spaces correctly
-            
             original_columns = df.columns.tolist()
             fixed_columns = [col.strip() for col in original_columns]
             
             # Fix column names
             df.columns = fixed_columns
             
-            # Track issues found in this file
-            issues_found = False
-            file_issues = []
-            
-            # Fix each cell
-            for col in df.columns:
-                for idx, value in df[col].items():
-                    if pd.isna(value):
-                        continue  # Skip NaN cells
-                    if value != value.strip():
-                        leading_spaces = len(value) - len(value.lstrip())
-                        trailing_spaces = len(value) - len(value.rstrip())
-                        issue_type = []
-                        if leading_spaces > 0:
-                            issue_type.append(f"{leading_spaces} leading")
-                        if trailing_spaces > 0:
-                            issue_type.append(f"{trailing_spaces} trailing")
-                        
-                        issue_info = f"Row {idx+1}, Column '{col}': '{value}' has {' and '.join(issue_type)} space(s)"
-                        file_issues.append(issue_info)
-                        issues_found = True
-                        total_issues += 1
-                        
-                        # Fix the cell value
-                        df.at[idx, col] = value.strip()
+            # Find and fix every cell with surrounding spaces, column by column
+            file_issues = find_space_issues(df)
+            issues_found = bool(file_issues)
+            total_issues += len(file_issues)
             
             if issues_found or original_columns != fixed_columns:
                 files_with_issues += 1
@@ -0,0 +1,107 @@
+import os
+
+from csv_loader import find_csv_files, iter_csv_files
+from check_column_spaces import find_space_issues
+from update_faculty_names import FACULTY_NAME_MAPPING
+from update_specialization import SPECIALIZATION_MAPPING
+
+# Runs the roster clean-up that fix_csv_columns.py, check_column_spaces.py,
+# update_faculty_names.py and update_specialization.py do separately, but
+# reads and writes each file only once. Every stage takes the DataFrame and
+# returns a list of human readable changes it made.
+
+
+def strip_headers(df):
+    """Remove leading/trailing spaces from column names"""
+    original_columns = list(df.columns)
+    df.columns = [col.strip() for col in original_columns]
+    return [f"Changed column '{old}' → '{new}'"
+            for old, new in zip(original_columns, df.columns) if old != new]
+
+
+def trim_cells(df):
+    """Remove leading/trailing spaces from every cell"""
+    return find_space_issues(df)
+
+
+def map_column(df, col, mapping, label):
+    """Replace values in one column using a mapping, reporting what changed"""
+    if col not in df.columns:
+        return []
+    mapped = df[col].replace(mapping)
+    changed = mapped != df[col]
+    if not changed.any():
+        return []
+    values = sorted(df.loc[changed, col].unique())
+    df[col] = mapped
+    return [f"Updated {label} in {int(changed.sum())} row(s): {', '.join(values)}"]
+
+
+def map_faculty_names(df):
+    """Replace faculty advisor name variants with their canonical spelling"""
+    return map_column(df, 'FACULTY ADVISOR', FACULTY_NAME_MAPPING, 'faculty advisor names')
+
+
+def map_specializations(df):
+    """Expand short specialization codes to full specialization names"""
+    return map_column(df, 'SPECIALAIZATION', SPECIALIZATION_MAPPING, 'specialization values')
+
+
+# Stages run in this order; trimming first lets the mappings see clean values
+STAGES = [strip_headers, trim_cells, map_faculty_names, map_specializations]
+
+
+# The same value mappings keyed by normalised column name (see csv_loader), for
+# rows streamed from sources that never pass through csv_output
+ROW_MAPPINGS = {
+    'FACULTY ADVISOR': FACULTY_NAME_MAPPING,
+    'SPECIALIZATION': SPECIALIZATION_MAPPING,
+}
+
+
+def clean_rows(columns, rows):
+    """Trim every cell and apply the value mappings to a stream of rows of cell text"""
+    mappings = [(columns.index(col), mapping) for col, mapping in ROW_MAPPINGS.items() if col in columns]
+    for row in rows:
+        row = [cell.strip() for cell in row]
+        for position, mapping in mappings:
+            row[position] = mapping.get(row[position], row[position])
+        yield tuple(row)
+
+
+def clean_rosters(csv_path="csv_output/*.csv", stages=STAGES, dry_run=False):
+    """Apply every clean-up stage to each CSV file, writing a file only if it changed"""
+    csv_files = find_csv_files(csv_path)
+    print(f"Found {len(csv_files)} CSV files to process.\n")
+
+    updated_files = 0
+    # Read everything as text so untouched cells are written back unchanged
+    for file, df in iter_csv_files(csv_files, normalise=False, dtype=str, keep_default_na=False):
+        file_name = os.path.basename(file)
+        try:
+            changes = []
+            for stage in stages:
+                changes.extend(stage(df))
+
+            if not changes:
+                print(f"No changes needed for: {file_name}")
+                continue
+
+            print(f"Cleaned: {file_name}")
+            for change in changes:
+                print(f"  - {change}")
+
+            if not dry_run:
+                df.to_csv(file, index=False)
+            updated_files += 1
+
+        except Exception as e:
+            print(f"Error processing {file_name}: {e}")
+
+    action = "would be updated" if dry_run else "updated"
+    print(f"\nSummary: {updated_files} out of {len(csv_files)} files {action}.")
+    return updated_files
+
+
+if __name__ == "__main__":
+    clean_rosters()
@@ -0,0 +1,83 @@
+import os
+import json
+
+import pandas as pd
+
+from csv_loader import normalise_headers
+
+DEFAULT_CATALOGUE_PATH = '.column_catalogue.json'
+
+
+class ColumnCatalogue:
+    """On-disk catalogue of CSV header rows keyed by file path, mtime and size
+
+    Headers are read with nrows=0 so the names match what a full pd.read_csv
+    would produce, and a file is only re-scanned once it changes on disk.
+    Use it to pick files and columns before parsing any data rows:
+
+        catalogue = ColumnCatalogue()
+        files = catalogue.select(csv_files, ['SECTION', 'FACULTY ADVISOR'])
+        catalogue.save()
+    """
+
+    def __init__(self, path=DEFAULT_CATALOGUE_PATH):
+        self.path = path  # None keeps the catalogue in memory only
+        self.entries = {}  # Absolute path -> {'mtime', 'size', 'columns'}
+        self.dirty = False
+        self._load()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r') as f:
+                self.entries = json.load(f)
+        except Exception as e:
+            print(f"Ignoring unreadable column catalogue {self.path}: {e}")
+            self.entries = {}
+
+    def headers(self, file):
+        """Return the raw header names of a CSV file, scanning it only if it changed"""
+        key = os.path.abspath(file)
+        stat = os.stat(file)
+        entry = self.entries.get(key)
+        if entry and entry['mtime'] == stat.st_mtime and entry['size'] == stat.st_size:
+            return entry['columns']
+
+        columns = [str(col) for col in pd.read_csv(file, nrows=0).columns]
+        self.entries[key] = {'mtime': stat.st_mtime, 'size': stat.st_size, 'columns': columns}
+        self.dirty = True
+        return columns
+
+    def columns(self, file):
+        """Return the header names of a CSV file, stripped and with alternatives resolved"""
+        return normalise_headers(self.headers(file))
+
+    def missing(self, file, required):
+        """Return the required (standard) column names a CSV file does not have"""
+        columns = set(self.columns(file))
+        return [col for col in required if col not in columns]
+
+    def select(self, csv_files, required):
+        """Return the files that have every required column, skipping unreadable ones"""
+        selected = []
+        for file in csv_files:
+            try:
+                if not self.missing(file, required):
+                    selected.append(file)
+            except Exception as e:
+                print(f"Error reading header of {file}: {e}")
+        return selected
+
+    def save(self):
+        """Write the catalogue back to disk if anything was re-scanned"""
+        if not self.path or not self.dirty:
+            return
+        try:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(self.entries, f)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except Exception as e:
+            print(f"Error saving column catalogue {self.path}: {e}")
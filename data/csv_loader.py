@@ -0,0 +1,122 @@
+import os
+import glob
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+DEFAULT_CSV_PATH = 'csv_output/*.csv'
+SOURCE_COLUMN = 'source_file'
+
+# Columns every student roster must provide (case-sensitive)
+STUDENT_COLUMNS = [
+    'REGISTER NO', 'STUDENT NAME', 'EMAILID', 'SECTION',
+    'YEAR OF STUDY', 'SPECIALIZATION', 'PROGRAM', 'DEPARTMENT', 'FACULTY ADVISOR'
+]
+
+# Alternative column names that might be used, in order of preference
+COLUMN_ALTERNATIVES = {
+    'EMAILID': ['EMAIL ID', 'EMAIL', 'E-MAIL', 'E MAIL', 'SRM Mail ID'],
+    'REGISTER NO': ['REGNO', 'REG NO', 'REGISTRATION NO', 'REGISTRATION NUMBER'],
+    'STUDENT NAME': ['NAME', 'FULL NAME'],
+    'SPECIALIZATION': ['SPECIALAIZATION', 'SPECIALISATION'],
+    'FACULTY ADVISOR': ['ADVISOR', 'FACULTY GUIDE']
+}
+
+# Alternative name -> standard name
+ALTERNATIVE_NAMES = {alt: col for col, alts in COLUMN_ALTERNATIVES.items() for alt in alts}
+
+
+def canonical_column(name):
+    """Return the standard name for a header, stripping spaces and resolving alternatives"""
+    name = str(name).strip()
+    return ALTERNATIVE_NAMES.get(name, name)
+
+
+def normalise_headers(columns):
+    """Strip header names and rename alternatives to their standard column name
+
+    A standard name already present wins over its alternatives; otherwise the
+    first alternative found (in COLUMN_ALTERNATIVES order) is renamed.
+    """
+    columns = [str(col).strip() for col in columns]
+    for standard, alternatives in COLUMN_ALTERNATIVES.items():
+        if standard in columns:
+            continue
+        for alt_name in alternatives:
+            if alt_name in columns:
+                columns[columns.index(alt_name)] = standard
+                break
+    return columns
+
+
+def find_csv_files(csv_path=DEFAULT_CSV_PATH):
+    """List the CSV files matching a glob in a stable order"""
+    return sorted(glob.glob(csv_path))
+
+
+def read_csv_file(path, normalise=True, **read_csv_kwargs):
+    """Read one CSV file, optionally normalising its headers"""
+    df = pd.read_csv(path, **read_csv_kwargs)
+    if normalise:
+        df.columns = normalise_headers(df.columns)
+    return df
+
+
+def iter_read_ahead(paths, read, workers=None):
+    """Yield (path, read(path)) in order, running read ahead in a thread pool
+
+    Up to two reads per worker run in the background, so only a bounded
+    number of results is held at once. Paths whose read fails are reported
+    and skipped.
+    """
+    workers = workers or min(32, (os.cpu_count() or 1) + 4)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        files = iter(paths)
+        pending = deque()
+
+        def submit_next():
+            path = next(files, None)
+            if path is not None:
+                pending.append((path, pool.submit(read, path)))
+
+        for _ in range(workers * 2):
+            submit_next()
+
+        while pending:
+            path, future = pending.popleft()
+            submit_next()
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"Error reading {path}: {e}")
+                continue
+            yield path, result
+
+
+def iter_csv_files(csv_files=None, csv_path=DEFAULT_CSV_PATH, workers=None, normalise=True, **read_csv_kwargs):
+    """Yield (path, DataFrame) for each CSV file, reading ahead in a thread pool
+
+    Files are yielded in order while up to two per worker are parsed in the
+    background (see iter_read_ahead). Files that fail to read are reported
+    and skipped. Extra keyword arguments are passed to pd.read_csv.
+    """
+    if csv_files is None:
+        csv_files = find_csv_files(csv_path)
+    return iter_read_ahead(csv_files, lambda path: read_csv_file(path, normalise, **read_csv_kwargs), workers)
+
+
+def load_csv_files(csv_files=None, csv_path=DEFAULT_CSV_PATH, workers=None, normalise=True, **read_csv_kwargs):
+    """Read every CSV file concurrently into one DataFrame
+
+    Each row is tagged with the name of the file it came from in the
+    source_file column. Returns an empty DataFrame if nothing could be read.
+    """
+    frames = []
+    for path, df in iter_csv_files(csv_files, csv_path, workers, normalise, **read_csv_kwargs):
+        frames.append(df.assign(**{SOURCE_COLUMN: os.path.basename(path)}))
+
+    if not frames:
+        return pd.DataFrame(columns=[SOURCE_COLUMN])
+    return pd.concat(frames, ignore_index=True)
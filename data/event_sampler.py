@@ -0,0 +1,44 @@
+import numpy as np
+
+
+def make_rng(seed=None):
+    """NumPy generator for bulk sampling; a fixed seed makes runs repeatable"""
+    return np.random.default_rng(seed)
+
+
+def sample_indices(rng, weights, size):
+    """Draw size indices into a weight table (weights need not sum to 1)"""
+    p = np.asarray(weights, dtype=float)
+    return rng.choice(len(p), size=size, p=p / p.sum())
+
+
+def sample_from(rng, values, size):
+    """Draw size values uniformly from a sequence, as an object array"""
+    return as_object_array(values)[rng.integers(len(values), size=size)]
+
+
+def sample_datetimes(rng, start, end, size):
+    """Uniform datetimes between start and end, as a list of datetime.datetime"""
+    start_us, end_us = np.array([start, end], dtype='datetime64[us]').astype(np.int64)
+    return rng.integers(start_us, end_us, size=size, endpoint=True).astype('datetime64[us]').tolist()
+
+
+def build_pool(factory, size):
+    """Call factory size times up front, so per-event values become array lookups"""
+    return as_object_array([factory() for _ in range(size)])
+
+
+def as_object_array(values):
+    """1-D object array of values (np.asarray would split tuples/lists into extra dimensions)"""
+    array = np.empty(len(values), dtype=object)
+    array[:] = list(values)
+    return array
+
+
+def group_positions(codes, n_groups):
+    """Yield (code, positions) for each code in 0..n_groups-1 that occurs in codes"""
+    order = np.argsort(codes, kind='stable')
+    bounds = np.searchsorted(codes[order], np.arange(n_groups + 1))
+    for code in range(n_groups):
+        if bounds[code] < bounds[code + 1]:
+            yield code, order[bounds[code]:bounds[code + 1]]
@@ -1,67 +1,55 @@
-import os
 import pandas as pd
-import glob
-from collections import defaultdict
 
-def get_faculty_section_mapping():
-    # Find all CSV files in the csv_output directory
-    csv_path = "csv_output/*.csv"
-    csv_files = glob.glob(csv_path)
+from csv_loader import find_csv_files
+from column_catalogue import ColumnCatalogue
+from roster_cache import iter_rosters
+
+MAPPING_COLUMNS = ['SECTION', 'FACULTY ADVISOR']
+
+def read_assignments(csv_files):
+    """Read the section and faculty advisor columns of every CSV into one DataFrame"""
+    # Only load the two columns we need, through the roster cache
+    frames = [df for _, df in iter_rosters(csv_files, columns=MAPPING_COLUMNS)]
     
-    print(f"Analyzing {len(csv_files)} CSV files...")
+    if not frames:
+        return pd.DataFrame(columns=MAPPING_COLUMNS), 0
     
-    # Dictionary to store faculty-section mappings
-    faculty_sections = defaultdict(set)
-    section_faculty = defaultdict(set)
-    section_student_count = defaultdict(int)
+    # The roster cache keeps empty cells as '' - treat them as missing too
+    assignments = pd.concat(frames, ignore_index=True).dropna().astype(str)
+    assignments = assignments[(assignments != '').all(axis=1)]
+    return assignments, len(frames)
+
+def build_faculty_section_mapping(assignments):
+    """Group (SECTION, FACULTY ADVISOR) rows into faculty/section lookups
     
-    # Track the number of processed files
-    processed_files = 0
+    Returns a dict with faculty_sections and section_faculty (sorted lists
+    keyed by name), section_student_count, and shared_sections - sections
+    with more than one faculty advisor.
+    """
+    pairs = assignments.groupby(['FACULTY ADVISOR', 'SECTION']).size()
+    advisors_per_section = assignments.groupby('SECTION')['FACULTY ADVISOR'].nunique()
     
-    # Process each CSV file
-    for file in csv_files:
-        try:
-            # Read the CSV file
-            df = pd.read_csv(file)
-            file_name = os.path.basename(file)
-            
-            # Find the section and faculty advisor columns
-            section_col = None
-            faculty_col = None
-            
-            for col in df.columns:
-                if col.strip() == 'SECTION':
-                    section_col = col
-                if col.strip() == 'FACULTY ADVISOR':
-                    faculty_col = col
-            
-            # If both columns exist, analyze the file
-            if section_col and faculty_col:
-                processed_files += 1
-                
-                # Group by faculty and section
-                for _, row in df.iterrows():
-                    faculty = row[faculty_col]
-                    section = row[section_col]
-                    
-                    if pd.notna(faculty) and pd.notna(section):
-                        faculty_sections[faculty].add(section)
-                        section_faculty[section].add(faculty)
-                        section_student_count[section] += 1
-            
-        except Exception as e:
-            print(f"Error processing {file}: {e}")
+    faculty_sections = {}
+    section_faculty = {}
+    for faculty, section in pairs.index:
+        faculty_sections.setdefault(faculty, []).append(section)
+        section_faculty.setdefault(section, []).append(faculty)
     
-    # Display the results
-    print(f"\nProcessed {processed_files} files containing faculty and section information.")
+    # groupby sorts its keys, so every list is already in order
+    return {
+        'faculty_sections': faculty_sections,
+        'section_faculty': dict(sorted(section_faculty.items())),
+        'section_student_count': assignments['SECTION'].value_counts().sort_index().to_dict(),
+        'shared_sections': advisors_per_section[advisors_per_section > 1].index.tolist(),
+    }
+
+def print_faculty_section_mapping(mapping):
+    """Print the faculty-to-section and section-to-faculty report"""
     print("\n" + "="*80)
     print(" FACULTY-TO-SECTION MAPPING ")
     print("="*80)
     
-    sorted_faculty = sorted(faculty_sections.keys())
-    
-    for faculty in sorted_faculty:
-        sections = sorted(faculty_sections[faculty])
+    for faculty, sections in mapping['faculty_sections'].items():
         section_list = ", ".join(sections)
         print(f"Faculty: {faculty}")
         print(f"Assigned Sections: {section_list}")
@@ -71,15 +59,38 @@ def get_faculty_section_mapping():
     print(" SECTION-TO-FACULTY MAPPING ")
     print("="*80)
     
-    sorted_sections = sorted(section_faculty.keys())
-    
-    for section in sorted_sections:
-        faculty_list = sorted(section_faculty[section])
+    for section, faculty_list in mapping['section_faculty'].items():
         faculty_str = ", ".join(faculty_list)
-        student_count = section_student_count[section]
+        student_count = mapping['section_student_count'][section]
         print(f"Section: {section} (Students: {student_count})")
         print(f"Faculty Advisors: {faculty_str}")
         print("-" * 40)
+    
+    if mapping['shared_sections']:
+        print(f"\nSections with more than one faculty advisor: {', '.join(mapping['shared_sections'])}")
+
+def get_faculty_section_mapping(csv_path="csv_output/*.csv", verbose=True):
+    """Map faculty advisors to sections across all CSV files, returning the mapping dict"""
+    # Find all CSV files in the csv_output directory
+    csv_files = find_csv_files(csv_path)
+    
+    if verbose:
+        print(f"Analyzing {len(csv_files)} CSV files...")
+    
+    # Skip files without both columns before parsing any rows
+    catalogue = ColumnCatalogue()
+    mapped_files = catalogue.select(csv_files, MAPPING_COLUMNS)
+    catalogue.save()
+    
+    assignments, processed_files = read_assignments(mapped_files)
+    mapping = build_faculty_section_mapping(assignments)
+    mapping['processed_files'] = processed_files
+    
+    if verbose:
+        print(f"\nProcessed {processed_files} files containing faculty and section information.")
+        print_faculty_section_mapping(mapping)
+    
+    return mapping
 
 if __name__ == "__main__":
-    get_faculty_section_mapping()
\ No newline at end of file
+    get_faculty_section_mapping()
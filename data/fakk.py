@@ -1,20 +1,26 @@
 import os
-import csv
-import json
-import glob
 import time
 import random
 import traceback
 import datetime
-import bcrypt
-import uuid
+from itertools import islice
+import numpy as np
+import pandas as pd
 from tqdm import tqdm
 from pymongo import MongoClient
 from bson import ObjectId
 from faker import Faker
-
-# Initialize faker
-fake = Faker('en_IN')
+from password_hashing import hash_passwords, PasswordHashCache, DEFAULT_ROUNDS, DEFAULT_CACHE_PATH
+from bulk_writer import BulkWriter
+from program_names import normalise_program
+from seed_indexes import FacultyIndex, in_faculty_order, build_teacher_id_index, build_class_index
+from csv_loader import find_csv_files
+from roster_cache import RosterCache, iter_rosters, load_faculty
+from roster_records import StudentRecord, FacultyRecord
+from points_engine import PointsEngine, ANSWER_PREFIX
+from form_configs import FormConfigIndex
+from text_pools import PooledFaker
+from event_sampler import make_rng, sample_indices, sample_from, sample_datetimes, build_pool, group_positions
 
 # Connect to MongoDB
 client = MongoClient('mongodb://localhost:27017/')
@@ -23,6 +29,25 @@ db = client['leaderboard_new_new_new']
 # Configuration
 CURRENT_YEAR = 2024
 ACADEMIC_YEAR = "2024-2025"
+BCRYPT_ROUNDS = DEFAULT_ROUNDS  # bcrypt cost factor for generated passwords
+HASH_WORKERS = None  # Worker processes for password hashing (None = all cores)
+HASH_CACHE_PATH = DEFAULT_CACHE_PATH  # data/.password_hash_cache.json; set to None to always re-hash
+WRITE_BATCH_SIZE = 1000  # Documents per unordered insert_many batch
+ROSTER_CACHE_DIR = '.roster_cache'  # Parsed CSV cache; set to None to always re-parse
+POINTS_CONFIG_VERSION = None  # pointsconfigs version used to score events (None = the active one)
+VECTORISED_EVENTS = False  # Sample events in bulk NumPy arrays instead of one at a time (for load-test datasets)
+EVENT_SEED = None  # Seed for the vectorised sampler; an int makes every event field repeat except the ObjectIds
+EVENT_REFERENCE_TIME = datetime.datetime(2025, 1, 1, 9, 0)  # Used as "now" by seeded vectorised runs
+TEXT_POOL_SIZE = 2000  # Faker values generated up front and reused by the vectorised sampler
+SAMPLE_CHUNK_SIZE = 10000  # Students whose events are sampled together by the vectorised sampler
+FAST_TEXT = False  # Draw names/phrases from pregenerated pools instead of calling Faker per document
+TEXT_POOL_DIR = '.text_pools'  # Where the pools are cached; set to None to rebuild them every run
+
+# Initialize faker
+fake = PooledFaker('en_IN', pool_dir=TEXT_POOL_DIR) if FAST_TEXT else Faker('en_IN')
+
+# Number of events per student (0-5) and how likely each is
+EVENT_COUNT_WEIGHTS = [0.2, 0.3, 0.25, 0.15, 0.05, 0.05]
 
 # Event statuses with weights for random selection
 EVENT_STATUSES = ['Pending', 'Approved', 'Rejected']
@@ -48,19 +73,16 @@ YEAR_TO_ACADEMIC_YEAR = {
 }
 
 def load_form_configs():
-    """Load form field configurations from JSON file"""
+    """Load form field configurations from JSON file, compiled per category"""
     print("Loading form field configurations...")
     try:
-        with open('leaderboard_db.formfieldconfigs.json', 'r') as f:
-            configs = json.load(f)
-            # Convert to dict with category as key for easier access
-            config_dict = {config['category']: config for config in configs}
-            print(f"Loaded {len(config_dict)} form field configurations")
-            return config_dict
+        form_configs = FormConfigIndex.from_file('leaderboard_db.formfieldconfigs.json')
+        print(f"Loaded {len(form_configs)} form field configurations")
+        return form_configs
     except Exception as e:
         print(f"Error loading form field configurations: {e}")
         traceback.print_exc()
-        return {}
+        return FormConfigIndex([])
 
 def clear_database():
     """Clear all collections before seeding"""
@@ -77,21 +99,20 @@ def read_faculty_data():
     faculty_data = []
     
     try:
-        with open('fa/faculty.csv', 'r') as csvfile:
-            reader = csv.DictReader(csvfile)
-            # Print header to debug
-            print(f"Faculty CSV headers: {reader.fieldnames}")
-            for row in reader:
-                faculty = {
-                    'name': row['Faculty Name'],  # Updated from 'Name' to 'Faculty Name'
-                    'email': row['Email ID'],      # Updated from 'Email' to 'Email ID'
-                    'faculty_id': row['Faculty ID'],
-                    'role': row['Role'],
-                    'department': row['department'],  # Note: lowercase 'department'
-                    'classes_type': row.get('classes', ''),  # Added to support class assignment
-                    'year_guide': row.get('Year-Guide', '')  # Added to support year guidance
-                }
-                faculty_data.append(faculty)
+        df = load_faculty(cache=RosterCache(ROSTER_CACHE_DIR))
+        # Print header to debug
+        print(f"Faculty CSV headers: {list(df.columns)}")
+        for row in df.to_dict('records'):
+            faculty = FacultyRecord(
+                name=row['Faculty Name'],  # Updated from 'Name' to 'Faculty Name'
+                email=row['Email ID'],      # Updated from 'Email' to 'Email ID'
+                faculty_id=row['Faculty ID'],
+                role=row['Role'],
+                department=row['department'],  # Note: lowercase 'department'
+                classes_type=row.get('classes', ''),  # Added to support class assignment
+                year_guide=row.get('Year-Guide', '')  # Added to support year guidance
+            )
+            faculty_data.append(faculty)
     except Exception as e:
         print(f"Error reading faculty data: {e}")
         traceback.print_exc()
@@ -106,86 +127,87 @@ def read_student_data():
     class_data = set()  # Set of (department, year, section) tuples
     
     # Get all CSV files in the csv_output directory
-    csv_files = glob.glob('csv_output/*.csv')
+    csv_files = find_csv_files()
     print(f"Found {len(csv_files)} CSV files")
     
     if not csv_files:
         print("WARNING: No CSV files found in the csv_output directory!")
         return [], []
     
-    for file_path in tqdm(csv_files, desc="Processing CSV files"):
+    # Unchanged files are read from the roster cache instead of being re-parsed
+    roster_cache = RosterCache(ROSTER_CACHE_DIR)
+    rosters = iter_rosters(csv_files, cache=roster_cache)
+    for file_path, df in tqdm(rosters, total=len(csv_files), desc="Processing CSV files"):
         try:
-            with open(file_path, 'r', encoding='utf-8') as csvfile:
-                reader = csv.reader(csvfile)
-                headers = next(reader)
+            headers = list(df.columns)
+            
+            print(f"Processing file: {file_path}")
+            print(f"Headers: {headers}")
+            
+            # For this specific format, map columns based on position
+            # Based on the error logs, columns appear to be:
+            # [id, regno, name, email, section, year, specialization, program, department, advisor]
+            for row in df.itertuples(index=False, name=None):
+                # Cells missing from short rows are NaN; drop them so row lengths match the file
+                row = list(row)
+                while row and not isinstance(row[-1], str):
+                    row.pop()
                 
-                print(f"Processing file: {file_path}")
-                print(f"Headers: {headers}")
+                if len(row) < 9:  # Ensure row has minimum required fields
+                    continue
                 
-                # For this specific format, map columns based on position
-                # Based on the error logs, columns appear to be:
-                # [id, regno, name, email, section, year, specialization, program, department, advisor]
-                for row in reader:
-                    if len(row) < 9:  # Ensure row has minimum required fields
-                        continue
+                try:
+                    # Extract values by position
+                    register_no = row[1].strip() if len(row) > 1 else ""
+                    name = row[2].strip() if len(row) > 2 else ""
+                    email = row[3].strip() if len(row) > 3 else ""
+                    section = row[4].strip() if len(row) > 4 else ""
                     
-                    try:
-                        # Extract values by position
-                        register_no = row[1].strip() if len(row) > 1 else ""
-                        name = row[2].strip() if len(row) > 2 else ""
-                        email = row[3].strip() if len(row) > 3 else ""
-                        section = row[4].strip() if len(row) > 4 else ""
-                        
-                        # Handle year parsing with explicit error handling
-                        if len(row) > 5:
-                            try:
-                                year = int(row[5].strip())
-                            except (ValueError, TypeError):
-                                year = 1
-                        else:
+                    # Handle year parsing with explicit error handling
+                    if len(row) > 5:
+                        try:
+                            year = int(row[5].strip())
+                        except (ValueError, TypeError):
                             year = 1
-                            
-                        specialization = row[6].strip() if len(row) > 6 else ""
-                        program = row[7].strip() if len(row) > 7 else "B.Tech"
-                        department = row[8].strip() if len(row) > 8 else ""
-                        faculty_advisor = row[9].strip() if len(row) > 9 else ""
-
-                        # Normalize program
-                        if 'mtech-integrated' in program.lower():
-                            program = 'MTech-Integrated'
-                        elif 'mtech' in program.lower():
-                            program = 'MTech'
-                        else:
-                            program = 'BTech'
-                        
-                        # Create student record
-                        student = {
-                            'register_no': register_no,
-                            'name': name,
-                            'email': email,
-                            'section': section,
-                            'year': year,
-                            'specialization': specialization,
-                            'program': program,
-                            'department': department,
-                            'faculty_advisor': faculty_advisor
-                        }
-                        
-                        # Ensure we have required fields
-                        if not register_no or not name:
-                            continue
-                            
-                        # Add to student data
-                        student_data.append(student)
+                    else:
+                        year = 1
                         
-                        # Add class tuple
-                        class_data.add((department, year, section))
-                        
-                    except Exception as e:
-                        print(f"Error processing row: {e}")
-                        print(f"Row data: {row}")
+                    specialization = row[6].strip() if len(row) > 6 else ""
+                    program = row[7].strip() if len(row) > 7 else "B.Tech"
+                    department = row[8].strip() if len(row) > 8 else ""
+                    faculty_advisor = row[9].strip() if len(row) > 9 else ""
+
+                    # Normalize program
+                    program, _ = normalise_program(program)
+                    
+                    # Create student record
+                    student = StudentRecord(
+                        register_no=register_no,
+                        name=name,
+                        email=email,
+                        section=section,
+                        year=year,
+                        specialization=specialization,
+                        program=program,
+                        department=department,
+                        faculty_advisor=faculty_advisor
+                    )
+                    
+                    # Ensure we have required fields
+                    if not register_no or not name:
                         continue
                         
+                    # Add to student data
+                    student_data.append(student)
+                    
+                    # Add class tuple
+                    class_data.add(student.class_key)
+                    
+                except Exception as e:
+                    print(f"Error processing row: {e}")
+                    print(f"Row data: {row}")
+                    continue
+                    
         except Exception as e:
             print(f"ERROR processing file {file_path}: {str(e)}")
             traceback.print_exc()
@@ -197,35 +219,25 @@ def read_student_data():
     
     return student_data, unique_classes
 
-def create_teachers(faculty_data):
+def create_teachers(faculty_data, hash_cache=None):
     """Create teacher documents from faculty data"""
     print("Creating teachers...")
     teachers = []
     teacher_map = {}  # Maps faculty_id to teacher document
     
-    for faculty in tqdm(faculty_data, desc="Creating teacher documents"):
-        # Hash password (using faculty ID as password)
-        password = faculty['faculty_id']
-        hashed_password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode()
-        
-        teacher = {
-            "_id": ObjectId(),
-            "name": faculty['name'],
-            "email": faculty['email'],
-            "password": hashed_password,
-            "rawPassword": password,
-            "profileImg": None,
-            "registerNo": faculty['faculty_id'],
-            "role": faculty['role'],
-            "department": faculty['department'],
-            "classes": [],
-            "isActive": True,
-            "createdAt": datetime.datetime.now(),
-            "updatedAt": datetime.datetime.now()
-        }
+    # Hash passwords (using faculty ID as password) in one parallel batch
+    hashed_passwords = hash_passwords(
+        [faculty.faculty_id for faculty in faculty_data],
+        rounds=BCRYPT_ROUNDS,
+        workers=HASH_WORKERS,
+        cache=hash_cache
+    )
+    
+    for faculty, hashed_password in tqdm(zip(faculty_data, hashed_passwords), total=len(faculty_data), desc="Creating teacher documents"):
+        teacher = faculty.to_document(hashed_password)
         
         teachers.append(teacher)
-        teacher_map[faculty['faculty_id']] = teacher
+        teacher_map[faculty.faculty_id] = teacher
     
     print(f"Created {len(teachers)} teacher documents")
     return teachers, teacher_map
@@ -236,39 +248,32 @@ def create_classes(class_tuples, teacher_map, faculty_data):
     classes = []
     class_map = {}  # Maps (dept, year, section) to class document
     
+    # Index faculty once instead of rescanning faculty_data for every class
+    faculty_index = FacultyIndex(faculty_data, teacher_map)
+    teacher_by_id = build_teacher_id_index(teacher_map)
+    
     for dept, year, section in tqdm(class_tuples, desc="Creating class documents"):
         class_name = f"{year}-{section}-{dept}"
         
-        # Find faculty advisors for this class
-        assigned_faculty_ids = []
-        academic_advisor_ids = []
+        # Faculty specifically assigned to this section
+        section_faculty = faculty_index.by_section[(dept, section)]
         
-        # Find faculty assigned to this class
-        for faculty in faculty_data:
-            if faculty['department'] == dept:
-                # Find faculty specifically assigned to this section
-                if faculty['classes_type'] == section:
-                    teacher = teacher_map.get(faculty['faculty_id'])
-                    if teacher:
-                        assigned_faculty_ids.append(teacher['_id'])
-                        
-                # Find academic advisors for this year
-                if faculty['role'] == 'Academic Advisor' and (faculty['year_guide'] == str(year) or faculty['year_guide'] == 'All'):
-                    teacher = teacher_map.get(faculty['faculty_id'])
-                    if teacher:
-                        academic_advisor_ids.append(teacher['_id'])
-                        
-                # Add HODs to all classes in their department
-                if faculty['role'] == 'HOD':
-                    teacher = teacher_map.get(faculty['faculty_id'])
-                    if teacher:
-                        academic_advisor_ids.append(teacher['_id'])
-                        
-                # If we still don't have faculty, add regular faculty from the department
-                if not assigned_faculty_ids and faculty['role'] == 'Faculty':
-                    teacher = teacher_map.get(faculty['faculty_id'])
-                    if teacher:
-                        assigned_faculty_ids.append(teacher['_id'])
+        # If the department's first regular faculty comes before any section
+        # member, it was picked up as a stand-in before the section was filled
+        dept_faculty = faculty_index.by_role[(dept, 'Faculty')]
+        fallback = []
+        if dept_faculty and (not section_faculty or dept_faculty[0][0] < section_faculty[0][0]):
+            fallback = dept_faculty[:1]
+        assigned_faculty_ids = [teacher['_id'] for teacher in in_faculty_order(fallback, section_faculty)]
+        
+        # Academic advisors for this year, plus HODs for all classes in their department
+        academic_advisor_ids = [
+            teacher['_id'] for teacher in in_faculty_order(
+                faculty_index.by_role[(dept, 'HOD')],
+                faculty_index.by_year_guide[(dept, 'Academic Advisor', str(year))],
+                faculty_index.by_year_guide[(dept, 'Academic Advisor', 'All')]
+            )
+        ]
         
         # Limit to reasonable number if we found too many
         if len(assigned_faculty_ids) > 3:
@@ -304,9 +309,7 @@ def create_classes(class_tuples, teacher_map, faculty_data):
         
         # Update teacher classes
         for faculty_id in assigned_faculty_ids + academic_advisor_ids:
-            for teacher in teacher_map.values():
-                if teacher['_id'] == faculty_id:
-                    teacher['classes'].append(class_obj['_id'])
+            teacher_by_id[faculty_id]['classes'].append(class_obj['_id'])
         
         classes.append(class_obj)
         class_map[(dept, year, section)] = class_obj
@@ -314,81 +317,66 @@ def create_classes(class_tuples, teacher_map, faculty_data):
     print(f"Created {len(classes)} class documents")
     return classes, class_map
 
-def create_students(student_data, class_map):
-    """Create student documents from CSV data"""
+def create_students(student_data, class_map, hash_cache=None):
+    """Yield student documents built from CSV data
+    
+    Passwords are hashed up front; the documents themselves are only built
+    as the caller asks for them.
+    """
     print("Creating students...")
-    students = []
+    created = 0
     problems = 0
-    student_map = {}  # Maps student register_no to student document
     
-    for student in tqdm(student_data, desc="Creating student documents"):
-        # Hash password (using register number as password)
-        password = student['register_no']
+    # Hash passwords (using register number as password) for every student
+    # that has a class in one parallel batch, keyed by position in student_data
+    placeable = [
+        idx for idx, student in enumerate(student_data)
+        if student.class_key in class_map
+    ]
+    hashed_passwords = dict(zip(placeable, hash_passwords(
+        [student_data[idx].register_no for idx in placeable],
+        rounds=BCRYPT_ROUNDS,
+        workers=HASH_WORKERS,
+        cache=hash_cache
+    )))
+    
+    for idx, student in enumerate(tqdm(student_data, desc="Creating student documents")):
         try:
-            hashed_password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode()
-            
             # Find the class for this student
-            class_key = (student['department'], student['year'], student['section'])
+            class_key = student.class_key
             if class_key not in class_map:
                 problems += 1
-                print(f"WARNING: No class found for student {student['name']} ({student['register_no']}) - {class_key}")
+                print(f"WARNING: No class found for student {student.name} ({student.register_no}) - {class_key}")
                 continue
             
             class_obj = class_map[class_key]
+            hashed_password = hashed_passwords[idx]
             
-            student_doc = {
-                "_id": ObjectId(),
-                "name": student['name'],
-                "profileImg": None,
-                "email": student['email'],
-                "registerNo": student['register_no'],
-                "password": hashed_password,
-                "rawPassword": password,
-                "class": class_obj["_id"],
-                "year": student['year'],
-                "course": f"{student['program']}-{student['department']}",
-                "totalPoints": 0,
-                "eventsParticipated": [],
-                "isActive": True,
-                "isGraduated": False,
-                "isArchived": False,
-                "registrationYear": YEAR_TO_REG.get(student['year'], CURRENT_YEAR),
-                "program": student['program'],
-                "department": student['department'],
-                "currentClass": {
-                    "year": student['year'],
-                    "section": student['section'],
-                    "ref": class_obj["_id"]
-                },
-                "classHistory": [{
-                    "year": student['year'],
-                    "section": student['section'],
-                    "academicYear": YEAR_TO_ACADEMIC_YEAR.get(student['year'], "Unknown"),
-                    "classRef": class_obj["_id"]
-                }],
-                "achievements": [],
-                "createdAt": datetime.datetime.now(),
-                "updatedAt": datetime.datetime.now()
-            }
+            student_doc = student.to_document(
+                class_obj["_id"],
+                hashed_password,
+                YEAR_TO_REG.get(student.year, CURRENT_YEAR),
+                YEAR_TO_ACADEMIC_YEAR.get(student.year, "Unknown"),
+                course=f"{student.program}-{student.department}"
+            )
             
             # Add student to class's student list
             class_obj["students"].append(student_doc["_id"])
-            
-            students.append(student_doc)
-            student_map[student['register_no']] = student_doc
         except Exception as e:
-            print(f"Error creating student {student['name']}: {e}")
+            print(f"Error creating student {student.name}: {e}")
             problems += 1
+            continue
+        
+        created += 1
+        yield student_doc
     
-    print(f"Created {len(students)} student documents")
+    print(f"Created {created} student documents")
     if problems > 0:
         print(f"Encountered {problems} problems while creating students")
-    
-    return students, student_map
 
 def generate_event_details(category, form_configs):
     """Generate event details based on category and form configuration"""
-    config = form_configs.get(category, {})
+    form = form_configs[category]
     
     # Base event details
     event_details = {
@@ -401,266 +389,307 @@ def generate_event_details(category, form_configs):
     custom_answers = {}
     dynamic_fields = {}
     
-    # Process custom questions from config
-    if "customQuestions" in config:
-        for question in config.get("customQuestions", []):
-            question_id = question.get("id")
-            options = question.get("options", [])
-            
-            if question_id and options:
-                answer = random.choice(options)
-                custom_answers[question_id] = answer
-                dynamic_fields[f"customAnswer_{question_id}"] = answer
+    # Answer each choice question from its precompiled options
+    for question_id, options in form.questions:
+        answer = random.choice(options)
+        custom_answers[question_id] = answer
+        dynamic_fields[f"customAnswer_{question_id}"] = answer
     
     # Add optional fields based on config
-    for field in config.get("optionalFields", []):
-        if random.random() > 0.3:  # 70% chance of including optional field
-            if field == "teamName":
-                dynamic_fields[field] = f"Team {fake.color_name().capitalize()}"
-            elif field == "eventLocation":
-                dynamic_fields[field] = random.choice(["College Campus", "Online", "Convention Center"])
-            elif field == "certificateLink":
-                dynamic_fields[field] = f"https://certificates.example.com/{uuid.uuid4()}"
-            elif field == "publicationLink":
-                dynamic_fields[field] = f"https://doi.org/10.1234/{uuid.uuid4().hex[:8]}"
-            elif field == "githubRepoUrl":
-                dynamic_fields[field] = f"https://github.com/user/{fake.word()}-{fake.word()}"
-            elif field == "organizationName":
-                dynamic_fields[field] = fake.company()
-            elif field == "role":
-                dynamic_fields[field] = random.choice(["Leader", "Coordinator", "Organizer", "Member"])
-            elif field == "sportName":
-                dynamic_fields[field] = random.choice(["Cricket", "Football", "Basketball", "Tennis", "Athletics"])
+    for field, generator in form.optional_fields:
+        if random.random() > 0.3 and generator:  # 70% chance of including optional field
+            dynamic_fields[field] = generator(fake)
     
     # Generate proof URLs based on the proof config
-    proof_config = config.get("proofConfig", {})
     proof_urls = []
-    
-    if proof_config and proof_config.get("requireCertificateImage", False):
-        max_certs = proof_config.get("maxCertificateSize", 1)
-        allow_multiple = proof_config.get("allowMultipleCertificates", False)
-        
-        if allow_multiple and max_certs > 1:
-            num_certs = random.randint(1, max_certs)
-        else:
-            num_certs = 1
-            
+    if form.require_certificate:
+        num_certs = random.randint(1, form.max_certificates) if form.max_certificates > 1 else 1
         for i in range(num_certs):
             proof_urls.append(f"/uploads/certificates/certificateImages-{int(time.time())}-{random.randint(100000000, 999999999)}.jpeg")
     
     # Generate PDF document if required
     pdf_document = None
-    if proof_config and proof_config.get("requirePdfProof", False):
+    if form.require_pdf:
         pdf_document = f"/uploads/documents/pdfDocument-{int(time.time())}-{random.randint(100000000, 999999999)}.pdf"
     
     return event_details, custom_answers, dynamic_fields, proof_urls, pdf_document
 
-def calculate_points(category, custom_answers, form_configs):
-    """Calculate points based on event category and custom answers"""
-    config = form_configs.get(category, {})
-    points = 0
-    
-    # Base points for different categories
-    category_base_points = {
-        "Hackathon": 15,
-        "Coding Competitions": 10,
-        "Research": 25,
-        "Open Source": 20,
-        "Certifications": 15,
-        "Workshops": 5,
-        "Sports": 10,
-        "NCC_NSS_YRC": 15,
-        "Student Leadership": 10,
-        "Social Work & Community Impact": 5
-    }
+def create_events(students, class_map, teacher_map, form_configs, points_engine, finished=None):
+    """Yield events for students with various statuses, updating each student as it goes
     
-    # Start with base points for the category
-    points = category_base_points.get(category, 5)
-    
-    # Add points based on specific answers
-    if category == "Hackathon":
-        # Level multiplier
-        level_multipliers = {
-            "International": 3.0,
-            "National": 2.0,
-            "Inter-College": 1.5,
-            "Intra-College": 1.0
-        }
-        
-        # Outcome multiplier
-        outcome_multipliers = {
-            "Winner (1st)": 3.0,
-            "Runner-up (2nd)": 2.0,
-            "3rd Place": 1.5,
-            "Finalist": 1.2,
-            "Participant": 1.0
-        }
-        
-        # Apply multipliers
-        level = custom_answers.get("level")
-        outcome = custom_answers.get("outcome")
+    students can be any iterable; finished, if given, is called with each
+    student once all of its events have been yielded.
+    """
+    print("Creating events...")
+    event_count = 0
+    
+    # Get event categories from form configs
+    event_categories = form_configs.categories
+    
+    # Resolve each student's class in constant time
+    class_by_id = build_class_index(class_map.values())
+    
+    # Create events for students
+    for student in tqdm(students, desc="Generating student events"):
+        for event in student_events(student, class_by_id, event_categories, form_configs, points_engine):
+            event_count += 1
+            yield event
+        if finished:
+            finished(student)
+    
+    print(f"Created {event_count} events")
+
+def student_events(student, class_by_id, event_categories, form_configs, points_engine):
+    """Yield one student's events, recording each on the student after it is handed over"""
+    # Randomly decide how many events this student has (0-5)
+    num_events = random.choices(range(len(EVENT_COUNT_WEIGHTS)), weights=EVENT_COUNT_WEIGHTS, k=1)[0]
+    
+    if num_events == 0:
+        return
         
-        if level in level_multipliers:
-            points *= level_multipliers[level]
+    # Get the class object for this student
+    class_obj = class_by_id.get(student["class"])
+    if not class_obj:
+        return
         
-        if outcome in outcome_multipliers:
-            points *= outcome_multipliers[outcome]
-    
-    elif category == "Certifications":
-        # Provider multiplier
-        provider_multipliers = {
-            "Stanford/MIT/AWS/Google/Top 500": 3.0,
-            "NPTEL": 2.0,
-            "Coursera/Udemy": 1.5,
-            "Other": 1.0
-        }
+    # Get faculty members for this class
+    faculty_id = None
+    if class_obj["assignedFaculty"]:
+        faculty_id = random.choice(class_obj["assignedFaculty"])
+    
+    # Generate events for this student
+    for _ in range(num_events):
+        # Select a random category, weighted towards more common categories
+        category = random.choice(event_categories)
         
-        # Project multiplier
-        project_multipliers = {
-            "Yes": 1.5,
-            "No": 1.0
-        }
+        # Generate event details based on category
+        event_details, custom_answers, dynamic_fields, proof_urls, pdf_document = generate_event_details(
+            category, form_configs
+        )
         
-        # Level multiplier
-        level_multipliers = {
-            "Advanced": 2.0,
-            "Intermediate": 1.5,
-            "Beginner": 1.0
-        }
+        # Determine status (pending, approved, rejected)
+        status = random.choices(EVENT_STATUSES, weights=STATUS_WEIGHTS, k=1)[0]
         
-        # Apply multipliers
-        provider = custom_answers.get("provider")
-        project = custom_answers.get("project_required")
-        level = custom_answers.get("level")
+        # Calculate points based on category and answers
+        points = points_engine.score(category, custom_answers) if status == 'Approved' else 0
         
-        if provider in provider_multipliers:
-            points *= provider_multipliers[provider]
-        
-        if project in project_multipliers:
-            points *= project_multipliers[project]
-            
-        if level in level_multipliers:
-            points *= level_multipliers[level]
-    
-    elif category == "Research":
-        # Publisher multiplier
-        publisher_multipliers = {
-            "IEEE/Springer/Elsevier(q1)": 3.0,
-            "Other Scopus/SCI Journals (Q2)": 2.0,
-            "Others": 1.0
+        # Create base event object
+        event = {
+            "_id": ObjectId(),
+            "eventName": event_details["eventName"],
+            "description": event_details["description"],
+            "date": event_details["date"],
+            "proofUrl": proof_urls,
+            "pdfDocument": pdf_document,
+            "status": status,
+            "category": category,
+            "customAnswers": custom_answers,
+            "dynamicFields": dynamic_fields,
+            "pointsEarned": points,
+            "submittedBy": student["_id"],
+            "createdAt": event_details["date"],
+            "updatedAt": datetime.datetime.now()
         }
         
-        # Authorship multiplier
-        authorship_multipliers = {
-            "1st Author": 2.0,
-            "2nd Author": 1.5,
-            "Co-author": 1.0
-        }
+        # Add approver if approved or rejected
+        if status != 'Pending' and faculty_id:
+            event["approvedBy"] = faculty_id
+            # Make update date after creation date
+            event["updatedAt"] = event["createdAt"] + datetime.timedelta(days=random.randint(1, 10))
         
-        # Apply multipliers
-        publisher = custom_answers.get("publisher")
-        authorship = custom_answers.get("authorship")
+        # Hand the event to the caller as soon as it is built
+        yield event
         
-        if publisher in publisher_multipliers:
-            points *= publisher_multipliers[publisher]
-            
-        if authorship in authorship_multipliers:
-            points *= authorship_multipliers[authorship]
-    
-    # Round points to nearest integer
-    return round(points)
+        # Add event to student's participated events and update points
+        add_event_to_student(student, event)
 
-def create_events(students, class_map, teacher_map, form_configs):
-    """Create events for students with various statuses"""
-    print("Creating events...")
-    events = []
-    
-    # Get event categories from form configs
-    event_categories = list(form_configs.keys())
-    
-    # Create events for students
-    for student in tqdm(students, desc="Generating student events"):
-        # Randomly decide how many events this student has (0-5)
-        num_events = random.choices([0, 1, 2, 3, 4, 5], weights=[0.2, 0.3, 0.25, 0.15, 0.05, 0.05], k=1)[0]
+def add_event_to_student(student, event):
+    """Record an event on its student, adding points and an achievement for approved events"""
+    student["eventsParticipated"].append(event["_id"])
+    points = event["pointsEarned"]
+    if event["status"] == 'Approved':
+        student["totalPoints"] += points
         
-        if num_events == 0:
+        # Add to achievements if significant points
+        if points >= 20:
+            achievement = {
+                "id": str(event["_id"]),
+                "title": event["eventName"],
+                "points": points,
+                "date": event["date"]
+            }
+            student["achievements"].append(achievement)
+
+def sample_category_events(form, category, size, rng, pools, points_engine, timestamp):
+    """Sample answers, optional fields, proofs and points for size events of one category
+    
+    Returns (custom_answers, dynamic_fields, proof_urls, pdf_documents, points) with
+    one entry per event; points are what the event earns if it is approved.
+    timestamp is the Unix time written into the proof file names.
+    """
+    answer_columns = {question_id: sample_from(rng, options, size) for question_id, options in form.questions}
+    custom_answers = [dict(zip(answer_columns, row)) for row in zip(*answer_columns.values())] or [{} for _ in range(size)]
+    dynamic_fields = [{f"customAnswer_{question_id}": answer for question_id, answer in answers.items()}
+                      for answers in custom_answers]
+    
+    # Optional fields are included 70% of the time, drawn from pools of generated values
+    for field, generator in form.optional_fields:
+        include = np.flatnonzero(rng.random(size) > 0.3)
+        if generator is None:
             continue
-            
-        # Get the class object for this student
-        class_obj = None
-        for cls in class_map.values():
-            if cls["_id"] == student["class"]:
-                class_obj = cls
-                break
-                
-        if not class_obj:
+        if field not in pools:
+            pools[field] = build_pool(lambda: generator(fake), TEXT_POOL_SIZE)
+        values = sample_from(rng, pools[field], len(include))
+        for position, value in zip(include, values):
+            dynamic_fields[position][field] = value
+    
+    # Proof URLs and PDFs follow the form's proof rules
+    proof_urls = [[] for _ in range(size)]
+    if form.require_certificate:
+        cert_counts = rng.integers(1, form.max_certificates + 1, size=size)
+        suffixes = iter(rng.integers(100000000, 1000000000, size=int(cert_counts.sum())).tolist())
+        proof_urls = [[f"/uploads/certificates/certificateImages-{timestamp}-{next(suffixes)}.jpeg" for _ in range(count)]
+                      for count in cert_counts.tolist()]
+    pdf_documents = [None] * size
+    if form.require_pdf:
+        pdf_documents = [f"/uploads/documents/pdfDocument-{timestamp}-{suffix}.pdf"
+                         for suffix in rng.integers(100000000, 1000000000, size=size).tolist()]
+    
+    # Score the whole batch with the points engine's vectorised path
+    frame = pd.DataFrame({ANSWER_PREFIX + question_id: column for question_id, column in answer_columns.items()},
+                         index=pd.RangeIndex(size))
+    frame['category'] = category
+    points = points_engine.score_frame(frame).to_numpy()
+    return custom_answers, dynamic_fields, proof_urls, pdf_documents, points
+
+def create_events_vectorised(students, class_map, teacher_map, form_configs, points_engine, seed=EVENT_SEED,
+                             finished=None):
+    """Yield events like create_events, sampling them in bulk NumPy arrays
+    
+    Students are processed SAMPLE_CHUNK_SIZE at a time: event counts,
+    categories, statuses, dates and answers are drawn for the whole chunk at
+    once from the same weight tables, event names and descriptions come from
+    pools of Faker text generated up front, and Python only assembles the
+    documents. The random stream differs from create_events, so the same
+    seed does not reproduce its events.
+    
+    A seed also seeds Faker and the random module before any pool is built
+    and pins "now" to EVENT_REFERENCE_TIME, so the same students and seed
+    give the same events field for field; only the ObjectIds differ.
+    students can be any iterable, and finished is called with each student
+    once all of its events have been yielded, as in create_events.
+    """
+    print("Creating events (vectorised)...")
+    event_count = 0
+    rng = make_rng(seed)
+    if seed is not None:
+        random.seed(seed)
+        fake.seed_instance(seed)
+    
+    categories = form_configs.categories
+    forms = [form_configs[category] for category in categories]
+    approved_code = EVENT_STATUSES.index('Approved')
+    pending_code = EVENT_STATUSES.index('Pending')
+    
+    # Resolve each student's class in constant time
+    class_by_id = build_class_index(class_map.values())
+    
+    # Faker is far too slow to call per event, so its output is pooled
+    event_names = build_pool(fake.catch_phrase, TEXT_POOL_SIZE)
+    descriptions = build_pool(fake.paragraph, TEXT_POOL_SIZE)
+    optional_pools = {}
+    
+    now = EVENT_REFERENCE_TIME if seed is not None else datetime.datetime.now()
+    one_year_ago = now - datetime.timedelta(days=365)
+    timestamp = int(now.timestamp())
+    
+    students = iter(students)
+    progress = tqdm(desc="Sampling student events", unit="student")
+    while chunk := list(islice(students, SAMPLE_CHUNK_SIZE)):
+        progress.update(len(chunk))
+        class_objs = [class_by_id.get(student["class"]) for student in chunk]
+        
+        # Event counts per student; students without a class get none
+        counts = sample_indices(rng, EVENT_COUNT_WEIGHTS, len(chunk))
+        counts[np.array([class_obj is None for class_obj in class_objs])] = 0
+        faculty_picks = rng.integers(1 << 30, size=len(chunk)).tolist()
+        faculty_ids = [
+            class_obj["assignedFaculty"][pick % len(class_obj["assignedFaculty"])]
+            if class_obj and class_obj["assignedFaculty"] else None
+            for class_obj, pick in zip(class_objs, faculty_picks)
+        ]
+        
+        owners = np.repeat(np.arange(len(chunk)), counts)
+        size = len(owners)
+        if size == 0:
+            finish_students(chunk, finished)
             continue
-            
-        # Get faculty members for this class
-        faculty_id = None
-        if class_obj["assignedFaculty"]:
-            faculty_id = random.choice(class_obj["assignedFaculty"])
         
-        # Generate events for this student
-        for _ in range(num_events):
-            # Select a random category, weighted towards more common categories
-            category = random.choice(event_categories)
-            
-            # Generate event details based on category
-            event_details, custom_answers, dynamic_fields, proof_urls, pdf_document = generate_event_details(
-                category, form_configs
-            )
-            
-            # Determine status (pending, approved, rejected)
-            status = random.choices(EVENT_STATUSES, weights=STATUS_WEIGHTS, k=1)[0]
-            
-            # Calculate points based on category and answers
-            points = calculate_points(category, custom_answers, form_configs) if status == 'Approved' else 0
-            
-            # Create base event object
+        # One draw per event attribute for the whole chunk
+        category_codes = rng.integers(len(categories), size=size)
+        status_codes = sample_indices(rng, STATUS_WEIGHTS, size)
+        dates = sample_datetimes(rng, one_year_ago, now, size)
+        names = sample_from(rng, event_names, size)
+        texts = sample_from(rng, descriptions, size)
+        approval_days = rng.integers(1, 11, size=size).tolist()
+        
+        custom_answers = [None] * size
+        dynamic_fields = [None] * size
+        proof_urls = [None] * size
+        pdf_documents = [None] * size
+        points = np.zeros(size, dtype=np.int64)
+        for code, positions in group_positions(category_codes, len(categories)):
+            sampled = sample_category_events(forms[code], categories[code], len(positions), rng, optional_pools, points_engine,
+                                             timestamp)
+            for position, answers, fields, urls, pdf in zip(positions.tolist(), *sampled[:4]):
+                custom_answers[position] = answers
+                dynamic_fields[position] = fields
+                proof_urls[position] = urls
+                pdf_documents[position] = pdf
+            points[positions] = sampled[4]
+        points[status_codes != approved_code] = 0
+        
+        # Materialise the documents from the sampled arrays
+        updated_at = now if seed is not None else datetime.datetime.now()
+        for i, (owner, category_code, status_code) in enumerate(zip(owners.tolist(), category_codes.tolist(), status_codes.tolist())):
+            student = chunk[owner]
+            category = categories[category_code]
             event = {
                 "_id": ObjectId(),
-                "eventName": event_details["eventName"],
-                "description": event_details["description"],
-                "date": event_details["date"],
-                "proofUrl": proof_urls,
-                "pdfDocument": pdf_document,
-                "status": status,
+                "eventName": f"{category} - {names[i]}",
+                "description": texts[i],
+                "date": dates[i],
+                "proofUrl": proof_urls[i],
+                "pdfDocument": pdf_documents[i],
+                "status": EVENT_STATUSES[status_code],
                 "category": category,
-                "customAnswers": custom_answers,
-                "dynamicFields": dynamic_fields,
-                "pointsEarned": points,
+                "customAnswers": custom_answers[i],
+                "dynamicFields": dynamic_fields[i],
+                "pointsEarned": int(points[i]),
                 "submittedBy": student["_id"],
-                "createdAt": event_details["date"],
-                "updatedAt": datetime.datetime.now()
+                "createdAt": dates[i],
+                "updatedAt": updated_at
             }
             
             # Add approver if approved or rejected
-            if status != 'Pending' and faculty_id:
+            faculty_id = faculty_ids[owner]
+            if status_code != pending_code and faculty_id:
                 event["approvedBy"] = faculty_id
-                # Make update date after creation date
-                event["updatedAt"] = event["createdAt"] + datetime.timedelta(days=random.randint(1, 10))
-            
-            # Add to events list
-            events.append(event)
+                event["updatedAt"] = dates[i] + datetime.timedelta(days=approval_days[i])
             
-            # Add event to student's participated events and update points
-            student["eventsParticipated"].append(event["_id"])
-            if status == 'Approved':
-                student["totalPoints"] += points
-                
-                # Add to achievements if significant points
-                if points >= 20:
-                    achievement = {
-                        "id": str(event["_id"]),
-                        "title": event["eventName"],
-                        "points": points,
-                        "date": event["date"]
-                    }
-                    student["achievements"].append(achievement)
-    
-    print(f"Created {len(events)} events")
-    return events
+            event_count += 1
+            yield event
+            add_event_to_student(student, event)
+        finish_students(chunk, finished)
+    progress.close()
+    
+    print(f"Created {event_count} events")
+
+def finish_students(students, finished):
+    """Pass each student to the finished callback, if there is one"""
+    if finished:
+        for student in students:
+            finished(student)
 
 def seed_database():
     """Main function to seed the database"""
@@ -672,6 +701,7 @@ def seed_database():
     
     # Load form field configurations
     form_configs = load_form_configs()
+    points_engine = PointsEngine.from_dump(version=POINTS_CONFIG_VERSION)
     print(f"Time after loading configs: {time.time() - start_time:.2f} seconds")
     
     # Read faculty data
@@ -682,56 +712,44 @@ def seed_database():
     student_data, class_tuples = read_student_data()
     print(f"Time after reading students: {time.time() - start_time:.2f} seconds")
     
+    # Reuse password hashes from earlier runs over the same roster
+    hash_cache = PasswordHashCache(HASH_CACHE_PATH) if HASH_CACHE_PATH else None
+    
     # Create teachers
-    teachers, teacher_map = create_teachers(faculty_data)
+    teachers, teacher_map = create_teachers(faculty_data, hash_cache)
     print(f"Time after creating teachers: {time.time() - start_time:.2f} seconds")
     
     # Create classes
     classes, class_map = create_classes(class_tuples, teacher_map, faculty_data)
     print(f"Time after creating classes: {time.time() - start_time:.2f} seconds")
     
-    # Create students
-    students, student_map = create_students(student_data, class_map)
-    print(f"Time after creating students: {time.time() - start_time:.2f} seconds")
-    
-    # Create events
-    events = create_events(students, class_map, teacher_map, form_configs)
-    print(f"Time after creating events: {time.time() - start_time:.2f} seconds")
-    
-    # Insert data into database
+    # Students are built lazily and written once their events are out, so
+    # only a batch of student and event documents is held at a time; the
+    # roster rows, password hashes, teachers and classes stay in memory
     print("\nInserting data into database...")
-    
-    # Insert teachers
-    if teachers:
-        print(f"Inserting {len(teachers)} teacher documents into MongoDB...")
-        db.teachers.insert_many(teachers)
-        print(f"Inserted {len(teachers)} teachers")
-    
-    # Insert classes
-    if classes:
-        print(f"Inserting {len(classes)} class documents into MongoDB...")
-        db['classes'].insert_many(classes)
-        print(f"Inserted {len(classes)} classes")
-    
-    # Insert students
-    if students:
-        print(f"Inserting {len(students)} student documents into MongoDB...")
-        db.students.insert_many(students)
-        print(f"Inserted {len(students)} students")
-    
-    # Insert events
-    if events:
-        print(f"Inserting {len(events)} event documents into MongoDB...")
-        db.events.insert_many(events)
-        print(f"Inserted {len(events)} events")
+    with BulkWriter(db.teachers, WRITE_BATCH_SIZE) as writer:
+        writer.extend(teachers)
+    
+    # Stream events and students straight into MongoDB as they are generated
+    students = create_students(student_data, class_map, hash_cache)
+    with BulkWriter(db.students, WRITE_BATCH_SIZE) as students_writer, \
+            BulkWriter(db.events, WRITE_BATCH_SIZE) as events_writer:
+        generate_events = create_events_vectorised if VECTORISED_EVENTS else create_events
+        events_writer.extend(generate_events(students, class_map, teacher_map, form_configs, points_engine,
+                                             finished=students_writer.add))
+    print(f"Time after creating students and events: {time.time() - start_time:.2f} seconds")
+    
+    # Insert classes last, once every student has been added to one
+    with BulkWriter(db['classes'], WRITE_BATCH_SIZE) as writer:
+        writer.extend(classes)
     
     # Print summary
     total_time = time.time() - start_time
     print("\nDatabase seeding completed!")
     print(f"- {len(teachers)} teachers created")
     print(f"- {len(classes)} classes created")
-    print(f"- {len(students)} students created")
-    print(f"- {len(events)} events created")
+    print(f"- {students_writer.inserted} students created")
+    print(f"- {events_writer.inserted} events created")
     print(f"Total time: {total_time:.2f} seconds")
 
 if __name__ == "__main__":
@@ -1,46 +1,60 @@
 import os
-import pandas as pd
-import glob
+
+from csv_loader import find_csv_files, iter_csv_files
+from column_catalogue import ColumnCatalogue
 
 def find_files_with_sections(target_sections=["A", "B"]):
     # Find all CSV files in the csv_output directory
     csv_path = "csv_output/*.csv"
-    csv_files = glob.glob(csv_path)
+    csv_files = find_csv_files(csv_path)
     
     # Dictionary to store files for each section
     section_files = {section: [] for section in target_sections}
     
-    # Process each CSV file
+    # Find the section column of each file from its header alone
+    catalogue = ColumnCatalogue()
+    section_cols = {}
     for file in csv_files:
         try:
-            df = pd.read_csv(file)
-            # Look for section column
-            section_col = None
-            for col in df.columns:
-                if col.strip() == "SECTION":  # Fixed: removed trailing space
+            headers = catalogue.headers(file)
+        except Exception as e:
+            print(f"Error processing {file}: {e}")
+            continue
+        
+        # Look for section column
+        section_col = None
+        for col in headers:
+            if col.strip() == "SECTION":  # Fixed: removed trailing space
+                section_col = col
+                break
+        
+        # If section column not found, try another approach
+        if not section_col:
+            for col in headers:
+                if "SECTION" in col:  # Alternative: look for any column containing "SECTION"
                     section_col = col
                     break
+        
+        if section_col:
+            section_cols[file] = section_col
+    catalogue.save()
+    
+    # Parse only the files with a section column, and only that column
+    for file, df in iter_csv_files(list(section_cols), normalise=False, usecols=lambda col: "SECTION" in col):
+        try:
+            section_col = section_cols[file]
+            # Get all unique sections in this file
+            sections_in_file = df[section_col].unique()
             
-            # If section column not found, try another approach
-            if not section_col:
-                for col in df.columns:
-                    if "SECTION" in col:  # Alternative: look for any column containing "SECTION"
-                        section_col = col
-                        break
+            # Output for debugging
+            file_name = os.path.basename(file)
+            print(f"Checking file: {file_name}, found sections: {sections_in_file}")
             
-            if section_col:
-                # Get all unique sections in this file
-                sections_in_file = df[section_col].unique()
-                
-                # Output for debugging
-                file_name = os.path.basename(file)
-                print(f"Checking file: {file_name}, found sections: {sections_in_file}")
-                
-                # Check if target sections exist in this file
-                for section in target_sections:
-                    if section in sections_in_file:
-                        section_files[section].append(file_name)
-                        print(f"Found section '{section}' in file: {file_name}")
+            # Check if target sections exist in this file
+            for section in target_sections:
+                if section in sections_in_file:
+                    section_files[section].append(file_name)
+                    print(f"Found section '{section}' in file: {file_name}")
         
         except Exception as e:
             print(f"Error processing {file}: {e}")
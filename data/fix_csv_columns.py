@@ -1,22 +1,19 @@
 import os
-import pandas as pd
-import glob
+
+from csv_loader import find_csv_files, iter_csv_files
 
 def fix_csv_column_names():
     """Fix CSV files by removing trailing spaces from column names."""
     # Find all CSV files in the csv_output directory
     csv_path = "csv_output/*.csv"
-    csv_files = glob.glob(csv_path)
+    csv_files = find_csv_files(csv_path)
     
     print(f"Found {len(csv_files)} CSV files to process.")
     
     # Process each CSV file
     fixed_files = 0
-    for file in csv_files:
+    for file, df in iter_csv_files(csv_files, normalise=False):
         try:
-            # Read the CSV file
-            df = pd.read_csv(file)
-            
             # Get original column names for comparison
             original_columns = list(df.columns)
             
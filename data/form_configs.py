@@ -0,0 +1,172 @@
+import os
+import json
+import random
+from dataclasses import dataclass, field
+
+import bson
+
+DEFAULT_FORM_CONFIG_PATH = 'leaderboard_db.formfieldconfigs.json'
+
+# How fake values are made for each optional form field; they take a Faker instance and
+# draw only from it and the random module, so seeding both makes them repeatable
+OPTIONAL_FIELD_GENERATORS = {
+    "teamName": lambda fake: f"Team {fake.color_name().capitalize()}",
+    "eventLocation": lambda fake: random.choice(["College Campus", "Online", "Convention Center"]),
+    "certificateLink": lambda fake: f"https://certificates.example.com/{fake.uuid4()}",
+    "publicationLink": lambda fake: f"https://doi.org/10.1234/{fake.uuid4()[:8]}",
+    "githubRepoUrl": lambda fake: f"https://github.com/user/{fake.word()}-{fake.word()}",
+    "organizationName": lambda fake: fake.company(),
+    "role": lambda fake: random.choice(["Leader", "Coordinator", "Organizer", "Member"]),
+    "sportName": lambda fake: random.choice(["Cricket", "Football", "Basketball", "Tennis", "Athletics"])
+}
+
+# Answers that count as not given for a required question
+EMPTY_ANSWERS = (None, '', [])
+
+
+def _check_single_choice(value, options):
+    if not isinstance(value, str):
+        return 'expected a single choice'
+    return None if value in options or not options else 'not an option'
+
+
+def _check_multiple_choice(value, options):
+    if not isinstance(value, list) or not all(isinstance(choice, str) for choice in value):
+        return 'expected a list of choices'
+    return None if not options or options.issuperset(value) else 'not an option'
+
+
+def _check_text(value, options):
+    return None if isinstance(value, str) else 'expected text'
+
+
+def _check_number(value, options):
+    # Numbers arrive as JSON numbers or as the text of a form input
+    if isinstance(value, bool):
+        return 'expected a number'
+    if isinstance(value, (int, float)):
+        return None
+    if isinstance(value, str):
+        try:
+            float(value)
+            return None
+        except ValueError:
+            pass
+    return 'expected a number'
+
+
+# Question type -> check returning a problem description, or None if the answer fits
+ANSWER_CHECKS = {
+    'singleChoice': _check_single_choice,
+    'multipleChoice': _check_multiple_choice,
+    'text': _check_text,
+    'number': _check_number
+}
+
+
+@dataclass(slots=True, frozen=True)
+class CategoryForm:
+    """One category's form configuration, compiled into ready-to-use tables
+
+    questions holds (question_id, options) for the questions that can be
+    answered by picking an option, in form order; optional_fields holds
+    (field, generator) with generator None for fields nothing is generated
+    for. max_certificates is 1 unless the form allows several certificates.
+    """
+    category: str
+    questions: tuple = ()
+    optional_fields: tuple = ()
+    required_fields: frozenset = frozenset()
+    question_types: dict = field(default_factory=dict)
+    question_options: dict = field(default_factory=dict)  # question_id -> frozenset of allowed options
+    required_questions: frozenset = frozenset()
+    require_certificate: bool = False
+    max_certificates: int = 1
+    require_pdf: bool = False
+
+    @classmethod
+    def compile(cls, config):
+        """Build a CategoryForm from one formfieldconfigs document"""
+        custom_questions = [question for question in config.get("customQuestions") or [] if question.get("id")]
+        proof_config = config.get("proofConfig") or {}
+        allow_multiple = proof_config.get("allowMultipleCertificates", False)
+        max_certificates = proof_config.get("maxCertificateSize", 1)
+
+        return cls(
+            category=config["category"],
+            questions=tuple((question["id"], tuple(question["options"]))
+                            for question in custom_questions if question.get("options")),
+            optional_fields=tuple((name, OPTIONAL_FIELD_GENERATORS.get(name))
+                                  for name in config.get("optionalFields") or []),
+            required_fields=frozenset(config.get("requiredFields") or []),
+            question_types={question["id"]: question.get("type") for question in custom_questions},
+            question_options={question["id"]: frozenset(question.get("options") or [])
+                              for question in custom_questions},
+            required_questions=frozenset(question["id"] for question in custom_questions if question.get("required")),
+            require_certificate=bool(proof_config.get("requireCertificateImage", False)),
+            max_certificates=max_certificates if allow_multiple and max_certificates > 1 else 1,
+            require_pdf=bool(proof_config.get("requirePdfProof", False))
+        )
+
+    def check_answers(self, custom_answers):
+        """Yield (question_id, problem, value) for every answer that does not fit this form"""
+        custom_answers = custom_answers or {}
+        for question_id, value in custom_answers.items():
+            options = self.question_options.get(question_id)
+            if options is None:
+                yield question_id, 'unknown question', value
+                continue
+            check = ANSWER_CHECKS.get(self.question_types[question_id], _check_text)
+            problem = check(value, options)
+            if problem:
+                yield question_id, problem, value
+
+        for question_id in self.required_questions:
+            if custom_answers.get(question_id, None) in EMPTY_ANSWERS:
+                yield question_id, 'missing required answer', None
+
+
+def from_template(template):
+    """The form configuration held by a templates document"""
+    return {**template['config'], 'category': template['category']}
+
+
+class FormConfigIndex:
+    """Compiled form configurations keyed by category
+
+    Categories without a configuration get an empty form, so lookups never
+    need a fallback at the call site.
+    """
+
+    def __init__(self, configs):
+        self.forms = {}
+        for config in configs:
+            form = CategoryForm.compile(config)
+            self.forms[form.category] = form
+        self.categories = list(self.forms)
+
+    @classmethod
+    def from_file(cls, path=DEFAULT_FORM_CONFIG_PATH):
+        """Compile the configurations in a formfieldconfigs JSON export"""
+        with open(path, 'r') as f:
+            return cls(json.load(f))
+
+    @classmethod
+    def from_dump(cls, dump_dir, collection='formfieldconfigs'):
+        """Compile the formfieldconfigs (or templates) collection of a mongodump directory
+
+        Templates keep their form under config; when a category has several
+        templates the last one dumped is used.
+        """
+        with open(os.path.join(dump_dir, f"{collection}.bson"), 'rb') as f:
+            return cls(from_template(doc) if 'config' in doc else doc for doc in bson.decode_file_iter(f))
+
+    def __getitem__(self, category):
+        form = self.forms.get(category)
+        return form if form is not None else CategoryForm(category)
+
+    def __contains__(self, category):
+        return category in self.forms
+
+    def __len__(self):
+        return len(self.forms)
@@ -1,13 +1,14 @@
 import os
-import pandas as pd
-import glob
 import json
 
+from csv_loader import find_csv_files
+from column_catalogue import ColumnCatalogue
+
 def list_columns_by_file():
     """List column names for each CSV file in the csv_output directory."""
     # Find all CSV files
     csv_path = "csv_output/*.csv"
-    csv_files = glob.glob(csv_path)
+    csv_files = find_csv_files(csv_path)
     
     if not csv_files:
         print("No CSV files found in the csv_output directory.")
@@ -15,17 +16,17 @@ def list_columns_by_file():
     
     print(f"Found {len(csv_files)} CSV files. Analyzing column names...\n")
     
+    # Header rows are cached, so unchanged files are not opened again
+    catalogue = ColumnCatalogue()
+    
     # Process each CSV file
     for file in csv_files:
         try:
             # Get just the filename without the path
             filename = os.path.basename(file)
             
-            # Read only the header row for efficiency
-            df = pd.read_csv(file, nrows=0)
-            
             # Get column names and strip any whitespace
-            columns = [col.strip() for col in df.columns]
+            columns = [col.strip() for col in catalogue.headers(file)]
             
             # Print the filename and column names in the requested format
             print(f"{filename}")
@@ -34,6 +35,8 @@ def list_columns_by_file():
                 
         except Exception as e:
             print(f"Error reading {os.path.basename(file)}: {e}\n")
+    
+    catalogue.save()
 
 if __name__ == "__main__":
     list_columns_by_file()
\ No newline at end of file
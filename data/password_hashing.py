@@ -0,0 +1,206 @@
+import os
+import hmac
+import json
+import time
+import hashlib
+import secrets
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+import bcrypt
+
+# Same cost factor bcrypt.gensalt() uses when called without arguments
+DEFAULT_ROUNDS = 12
+
+# Persistent hash cache defaults; the cache sits next to this module wherever the scripts are run from
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.password_hash_cache.json')
+DEFAULT_CACHE_SIZE = 200000  # Maximum cached credentials before the oldest are evicted
+CACHE_FORMAT_VERSION = 3  # Older files are discarded: version 1 used unsalted sha256 keys, version 2 held its own secret
+
+# The secret the cache keys are HMACed with is kept out of the cache file: it is read from
+# this environment variable (hex) if set, otherwise from a key file readable only by its owner
+KEY_ENV_VAR = 'PASSWORD_HASH_CACHE_KEY'
+DEFAULT_KEY_PATH = os.path.join(os.path.expanduser('~'), '.password_hash_cache.key')
+KEY_CHECK_MESSAGE = b'password-hash-cache'  # HMACed to tell whether a cache file was written with the current secret
+
+BCRYPT_PREFIXES = ('$2a$', '$2b$', '$2y$')
+
+
+def _hash_password(job):
+    """Hash a single (password, rounds) job - runs inside a worker process"""
+    password, rounds = job
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds)).decode()
+
+
+def is_compatible_hash(hashed, rounds):
+    """Check that a stored hash is a well-formed bcrypt hash with the given cost factor"""
+    return (
+        isinstance(hashed, str)
+        and len(hashed) == 60
+        and hashed[:4] in BCRYPT_PREFIXES
+        and hashed[4:7] == f"{rounds:02d}$"
+    )
+
+
+def load_cache_key(key_path=DEFAULT_KEY_PATH):
+    """Return the cache's HMAC secret from KEY_ENV_VAR or key_path, creating the key file on first use"""
+    if os.environ.get(KEY_ENV_VAR):
+        return bytes.fromhex(os.environ[KEY_ENV_VAR])
+    if os.path.exists(key_path):
+        with open(key_path, 'r') as f:
+            return bytes.fromhex(f.read().strip())
+    secret = secrets.token_bytes(32)
+    with os.fdopen(os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), 'w') as f:
+        f.write(secret.hex())
+    print(f"Created password hash cache key {key_path}")
+    return secret
+
+
+class PasswordHashCache:
+    """On-disk LRU cache of bcrypt hashes keyed by an HMAC of the raw credential
+
+    The HMAC secret lives outside the cache file (see load_cache_key), so the
+    file alone gives no way to test candidate passwords (register numbers,
+    dates of birth) against its keys. Anyone holding both the file and the
+    secret can, so protect the key like a credential. A cache written with a
+    different secret is discarded. Both files are written readable by their
+    owner only.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_entries=DEFAULT_CACHE_SIZE, verify=False, key_path=DEFAULT_KEY_PATH):
+        self.path = path
+        self.max_entries = max_entries
+        self.verify = verify  # Re-check cached hashes with bcrypt.checkpw (costs as much as hashing)
+        self.entries = OrderedDict()  # Credential digest -> hash, least recently used first
+        self.dirty = False
+        try:
+            self.secret = load_cache_key(key_path)
+        except Exception as e:
+            # Without a stored secret this run still caches in memory, but nothing is reusable later
+            print(f"Error loading password hash cache key: {e}")
+            self.secret = secrets.token_bytes(32)
+        self._load()
+
+    def _key(self, password):
+        # Store a keyed digest rather than the credential itself
+        return hmac.new(self.secret, password.encode('utf-8'), hashlib.sha256).hexdigest()
+
+    def _key_check(self):
+        return hmac.new(self.secret, KEY_CHECK_MESSAGE, hashlib.sha256).hexdigest()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            if not isinstance(data, dict) or data.get('version') != CACHE_FORMAT_VERSION:
+                # Older formats are dropped; saving rewrites the file in the current one
+                print(f"Discarding outdated password hash cache {self.path}")
+                self.dirty = True
+                return
+            if not hmac.compare_digest(data.get('keyCheck', ''), self._key_check()):
+                print(f"Discarding password hash cache {self.path}: it was written with a different key")
+                self.dirty = True
+                return
+            for key, hashed in data['entries']:
+                self.entries[key] = hashed
+            self._evict()
+            print(f"Loaded {len(self.entries)} cached password hashes from {self.path}")
+        except Exception as e:
+            print(f"Ignoring unreadable password hash cache {self.path}: {e}")
+            self.entries.clear()
+
+    def _evict(self):
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.dirty = True
+
+    def get(self, password, rounds=DEFAULT_ROUNDS):
+        """Return the cached hash for a credential, or None if missing or incompatible"""
+        key = self._key(password)
+        hashed = self.entries.get(key)
+        if hashed is not None and is_compatible_hash(hashed, rounds):
+            if not self.verify or bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8')):
+                self.entries.move_to_end(key)
+                return hashed
+        return None
+
+    def put(self, password, hashed):
+        """Store a freshly computed hash, evicting the least recently used entries"""
+        key = self._key(password)
+        self.entries[key] = hashed
+        self.entries.move_to_end(key)
+        self.dirty = True
+        self._evict()
+
+    def save(self):
+        """Write the cache back to disk if anything changed"""
+        if not self.dirty:
+            return
+        try:
+            tmp_path = f"{self.path}.tmp"
+            data = {
+                'version': CACHE_FORMAT_VERSION,
+                'keyCheck': self._key_check(),
+                'entries': list(self.entries.items())
+            }
+            with os.fdopen(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except Exception as e:
+            print(f"Error saving password hash cache {self.path}: {e}")
+            traceback.print_exc()
+
+
+def hash_passwords(passwords, rounds=DEFAULT_ROUNDS, workers=None, cache=None):
+    """Hash all passwords across a process pool, returning hashes in input order"""
+    passwords = list(passwords)
+    if not passwords:
+        return []
+
+    # Reuse cached hashes and hash each distinct remaining credential once
+    hashes = [None] * len(passwords)
+    pending = OrderedDict()  # Password -> positions still waiting for a hash
+    for position, password in enumerate(passwords):
+        cached = cache.get(password, rounds) if cache is not None else None
+        if cached is not None:
+            hashes[position] = cached
+        else:
+            pending.setdefault(password, []).append(position)
+
+    reused = len(passwords) - sum(len(positions) for positions in pending.values())
+    if reused:
+        print(f"Reused {reused} cached password hashes")
+    if not pending:
+        return hashes
+
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, len(pending))
+    jobs = [(password, rounds) for password in pending]
+
+    start_time = time.time()
+    if workers == 1:
+        computed = [_hash_password(job) for job in jobs]
+    else:
+        # A few chunks per worker keeps every core busy without paying
+        # inter-process overhead for each individual hash
+        chunksize = max(1, len(jobs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            computed = list(executor.map(_hash_password, jobs, chunksize=chunksize))
+    elapsed = time.time() - start_time
+
+    for (password, positions), hashed in zip(pending.items(), computed):
+        for position in positions:
+            hashes[position] = hashed
+        if cache is not None:
+            cache.put(password, hashed)
+    if cache is not None:
+        cache.save()
+
+    rate = len(computed) / elapsed if elapsed > 0 else float('inf')
+    print(f"Hashed {len(computed)} passwords (cost {rounds}) on {workers} worker(s) "
+          f"in {elapsed:.2f} seconds - {rate:.1f} hashes/sec")
+    return hashes
@@ -0,0 +1,292 @@
+import os
+
+import bson
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_string_dtype
+
+DEFAULT_POINTS_CONFIG_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'dbdump', 'leaderboard_db_final', 'leaderboard_new', 'pointsconfigs.bson'
+)
+CONFIG_TYPE = 'categoryRules'
+ANSWER_PREFIX = 'customAnswers.'  # Column prefix for answers in a flattened events table
+APPROVED_STATUS = 'Approved'
+
+# Event attributes that index the nested (version 1/2) rule tables, by table depth
+NESTED_DIMENSIONS = {
+    2: ('eventScope', 'positionSecured'),
+    3: ('participationType', 'eventScope', 'positionSecured'),
+    4: ('participationType', 'eventScope', 'eventOrganizer', 'positionSecured')
+}
+
+# Event values spelled differently in the nested rule tables
+NESTED_ALIASES = {'Participant': 'Participated'}
+
+# The generators' original position x scope points, as a scope -> position rules table;
+# pass it as fallback to score events the configuration has no entry for
+LEGACY_POSITION_POINTS = {
+    'International': {'First': 100, 'Second': 75, 'Third': 50, 'Participated': 25, 'None': 10},
+    'National': {'First': 75, 'Second': 50, 'Third': 30, 'Participated': 15, 'None': 5},
+    'State': {'First': 50, 'Second': 30, 'Third': 20, 'Participated': 10, 'None': 3}
+}
+
+
+def load_points_config(path=DEFAULT_POINTS_CONFIG_PATH, version=None):
+    """Return the category rules configuration from a pointsconfigs.bson dump
+
+    version None picks the active configuration (the highest active version,
+    as the backend does); otherwise the last document with that version.
+    """
+    with open(path, 'rb') as f:
+        documents = [doc for doc in bson.decode_all(f.read()) if doc.get('configType') == CONFIG_TYPE]
+
+    if version is None:
+        candidates = [doc for doc in documents if doc.get('isActive')] or documents
+        candidates = sorted(candidates, key=lambda doc: doc.get('version', 0))
+    else:
+        candidates = [doc for doc in documents if doc.get('version') == version]
+    if not candidates:
+        raise ValueError(f"No {CONFIG_TYPE} points configuration (version {version}) in {path}")
+    return candidates[-1]['configuration']
+
+
+def normalise_field(name):
+    """Lower-case a field or answer key and replace whitespace with underscores"""
+    return '_'.join(str(name).lower().split())
+
+
+def answer_key(value):
+    """Render an answer the way it is looked up in a rules table (a JS object key)"""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, (list, tuple)):
+        return ','.join(answer_key(item) for item in value)
+    return str(value)
+
+
+def _lookup_points(values, table):
+    """Map a column of answers to points through a rules table (0 where unmatched)"""
+    if not is_string_dtype(values):
+        values = values.map(answer_key, na_action='ignore')
+    return values.map(table).fillna(0).to_numpy(dtype=float)
+
+
+def _is_points_table(rules):
+    return all(isinstance(points, (int, float)) for points in rules.values())
+
+
+def _flatten(rules, path=()):
+    """Yield (path, points) for every leaf of a nested rules table"""
+    for key, value in rules.items():
+        if isinstance(value, dict):
+            yield from _flatten(value, path + (key,))
+        else:
+            yield path + (key,), value
+
+
+class FieldRules:
+    """Additive rules: each field maps an answer to points (the current scheme)
+
+    Fields are resolved like the backend's PointsCalculationService: a truthy
+    event attribute of the same name, then the customAnswers key of the same
+    name, then the first customAnswers key whose normalised form contains the
+    field's (or is contained in it). The fields an answer key matches are
+    worked out once per key, so scoring is linear in the number of answers.
+    """
+
+    def __init__(self, rules):
+        self.fields = [(field, {value: points for value, points in table.items() if points})
+                       for field, table in rules.items()]
+        self._normalised = [normalise_field(field) for field, _ in self.fields]
+        self._matches = {}  # Answer key -> indices of the fields it matches
+
+    def _matching_fields(self, key):
+        matches = self._matches.get(key)
+        if matches is None:
+            normalised_key = normalise_field(key)
+            matches = tuple(idx for idx, field in enumerate(self._normalised)
+                            if field in normalised_key or normalised_key in field)
+            self._matches[key] = matches
+        return matches
+
+    def score(self, custom_answers=None, event=None):
+        custom_answers = custom_answers or {}
+        matched = {}
+        for key, value in custom_answers.items():
+            for idx in self._matching_fields(key):
+                matched.setdefault(idx, value)
+
+        total = 0
+        for idx, (field, table) in enumerate(self.fields):
+            value = event.get(field) if event else None
+            if not value:
+                value = custom_answers[field] if field in custom_answers else matched.get(idx)
+            if value:
+                total += table.get(answer_key(value), 0)
+        return total
+
+    def score_frame(self, frame):
+        """Vectorised score: one array of points for the rows of a flattened events table
+
+        An answer is present where its customAnswers.<key> cell is not null,
+        and fuzzy matches are tried in column order.
+        """
+        answer_columns = [col for col in frame.columns if col.startswith(ANSWER_PREFIX)]
+        total = np.zeros(len(frame))
+        for idx, (field, table) in enumerate(self.fields):
+            candidates = []
+            if field in frame.columns:
+                candidates.append(frame[field].where(frame[field].astype(bool)))
+            if ANSWER_PREFIX + field in frame.columns:
+                candidates.append(frame[ANSWER_PREFIX + field])
+            candidates.extend(frame[col] for col in answer_columns
+                              if idx in self._matching_fields(col[len(ANSWER_PREFIX):]))
+            if not candidates:
+                continue
+
+            values = candidates[0]
+            for candidate in candidates[1:]:
+                values = values.combine_first(candidate)
+            total += _lookup_points(values, table)
+        return total
+
+
+class NestedRules:
+    """Position tables nested by participation type, scope and organizer (versions 1/2)
+
+    A table nested by scope alone (like LEGACY_POSITION_POINTS) is scored the
+    same way.
+
+    The nested tables are flattened into one dict keyed by the tuple of event
+    attributes in NESTED_DIMENSIONS, so scoring is a single lookup.
+    """
+
+    def __init__(self, rules):
+        self.table = dict(_flatten(rules))
+        depth = len(next(iter(self.table), ()))
+        if depth not in NESTED_DIMENSIONS:
+            raise ValueError(f"Unsupported points table depth {depth}")
+        self.dimensions = NESTED_DIMENSIONS[depth]
+        self.series = None  # pandas view of table, built on first score_frame
+
+    def _key(self, event):
+        return tuple(NESTED_ALIASES.get(event.get(dim), event.get(dim)) for dim in self.dimensions)
+
+    def covers(self, event=None):
+        """Whether the table has an entry for this event's attributes"""
+        return bool(event) and self._key(event) in self.table
+
+    def score(self, custom_answers=None, event=None):
+        if not event:
+            return 0
+        return self.table.get(self._key(event), 0)
+
+    def _frame_keys(self, frame):
+        return pd.MultiIndex.from_arrays([
+            frame[dim].replace(NESTED_ALIASES) if dim in frame.columns else pd.Series(None, index=frame.index, dtype=object)
+            for dim in self.dimensions
+        ])
+
+    def covers_frame(self, frame):
+        """covers() for every row of a flattened events table, as a boolean array"""
+        return self._frame_keys(frame).isin(list(self.table))
+
+    def score_frame(self, frame):
+        """Vectorised score: one MultiIndex lookup for all rows of a flattened events table"""
+        if self.series is None:
+            self.series = pd.Series(self.table)
+        return self.series.reindex(self._frame_keys(frame)).fillna(0).to_numpy(dtype=float)
+
+
+class PointsEngine:
+    """Score events against a points configuration compiled once into lookup tables
+
+    fallback is an optional nested rules table (e.g. LEGACY_POSITION_POINTS)
+    applied to events of any category that the configuration has no entry for.
+    """
+
+    def __init__(self, configuration, fallback=None):
+        self.categories = {
+            category: FieldRules(rules) if all(_is_points_table(table) for table in rules.values()) else NestedRules(rules)
+            for category, rules in configuration.items()
+        }
+        self.fallback = NestedRules(fallback) if fallback else None
+
+    @classmethod
+    def from_dump(cls, path=DEFAULT_POINTS_CONFIG_PATH, version=None, fallback=None):
+        """Compile the configuration stored in a pointsconfigs.bson dump"""
+        return cls(load_points_config(path, version), fallback)
+
+    def score(self, category, custom_answers=None, event=None):
+        """Points for an event of this category; 0 for events no rule (or fallback) covers
+
+        custom_answers is the event's customAnswers; event supplies top-level
+        attributes (eventScope, positionSecured, ...) for rules that use them.
+        """
+        if self.covers(category, event):
+            return self.categories[category].score(custom_answers, event)
+        return self.fallback.score(custom_answers, event) if self.fallback else 0
+
+    def covers(self, category, event=None):
+        """Whether the configuration has an entry for this event (any event, for additive field rules)
+
+        Events it does not cover are scored by the fallback table, if any.
+        """
+        rules = self.categories.get(category)
+        if rules is None:
+            return False
+        return rules.covers(event) if isinstance(rules, NestedRules) else True
+
+    def score_event(self, event):
+        """Points for an event document, ignoring its approval status"""
+        return self.score(event.get('category'), event.get('customAnswers'), event)
+
+    def score_frame(self, frame, category_column='category'):
+        """Points for every row of a flattened events table (see events_frame), ignoring status"""
+        points = np.zeros(len(frame))
+        for category, positions in frame.groupby(category_column, sort=False).indices.items():
+            rows = frame.iloc[positions]
+            rules = self.categories.get(category)
+            if rules:
+                points[positions] = rules.score_frame(rows)
+            if self.fallback is None or isinstance(rules, FieldRules):
+                continue
+            uncovered = ~rules.covers_frame(rows) if rules else np.ones(len(positions), dtype=bool)
+            if uncovered.any():
+                points[positions[uncovered]] = self.fallback.score_frame(rows[uncovered])
+        if np.array_equal(points, np.round(points)):
+            points = points.astype(np.int64)  # Rules are usually whole points, as stored on events
+        return pd.Series(points, index=frame.index)
+
+
+def events_frame(events):
+    """Flatten event documents into a table with one customAnswers.<key> column per answer key"""
+    events = list(events)
+    frame = pd.DataFrame(events)
+    answers = pd.DataFrame([event.get('customAnswers') or {} for event in events], index=frame.index)
+    return pd.concat([frame.drop(columns='customAnswers', errors='ignore'), answers.add_prefix(ANSWER_PREFIX)], axis=1)
+
+
+def rescore_events(frame, engine, student_column='submittedBy'):
+    """Re-score the approved events of a flattened events table with engine
+
+    Like the backend's recalculation, only approved events change. Returns
+    (events, students): events gains newPoints and delta columns, students
+    has the old/new totals and delta per student, for students whose points
+    change.
+    """
+    old_points = pd.to_numeric(frame['pointsEarned'], errors='coerce').fillna(0) if 'pointsEarned' in frame.columns \
+        else pd.Series(0.0, index=frame.index)
+    approved = frame['status'].eq(APPROVED_STATUS)
+    new_points = engine.score_frame(frame).where(approved, old_points)
+
+    events = frame.assign(newPoints=new_points, delta=new_points - old_points)
+    students = pd.DataFrame({
+        'oldPoints': old_points.where(approved, 0),
+        'newPoints': new_points.where(approved, 0),
+        'delta': events['delta'],
+        student_column: frame[student_column]
+    }).groupby(student_column, sort=False).sum()
+    return events, students[students['delta'] != 0]
@@ -0,0 +1,142 @@
+import os
+import json
+import time
+
+import bson
+import pandas as pd
+
+from points_engine import PointsEngine, events_frame, rescore_events
+
+# Configuration
+DUMP_DIR = '../dbdump/leaderboard_db/leaderboard_new_new_new'  # mongodump directory with events/students/classes
+PROPOSED_CONFIG_PATH = 'proposed_points_config.json'  # {category: {field: {answer: points}}}, or a pointsconfigs document
+OUTPUT_DIR = 'points_impact'
+TOP_STUDENTS = 10  # Most impacted students listed in the summary
+
+
+def read_dump(dump_dir, collection):
+    """Read every document of a collection from a mongodump directory ([] if it was not dumped)"""
+    path = os.path.join(dump_dir, f"{collection}.bson")
+    if not os.path.exists(path):
+        print(f"No {collection} dump in {dump_dir}")
+        return []
+    with open(path, 'rb') as f:
+        return list(bson.decode_file_iter(f))
+
+
+def load_proposed_config(path):
+    """Load the proposed category rules; only the categories it lists are re-scored"""
+    with open(path) as f:
+        proposed = json.load(f)
+    return proposed.get('configuration', proposed)
+
+
+def add_ranks(table):
+    """Rank rows by old and new points (1 = most points); a positive rankShift means moving up"""
+    table['oldRank'] = table['oldPoints'].rank(method='min', ascending=False).astype(int)
+    table['newRank'] = table['newPoints'].rank(method='min', ascending=False).astype(int)
+    table['rankShift'] = table['oldRank'] - table['newRank']
+    return table
+
+
+def student_table(students, classes, deltas):
+    """Old/new totals, deltas and leaderboard ranks for every student in the dump"""
+    class_names = {class_obj['_id']: class_obj.get('className') for class_obj in classes}
+    table = pd.DataFrame({
+        'studentId': [str(student['_id']) for student in students],
+        'name': [student.get('name') for student in students],
+        'registerNo': [student.get('registerNo') for student in students],
+        'className': [class_names.get(student.get('class'), str(student.get('class'))) for student in students],
+        'department': [student.get('department') for student in students],
+        'oldPoints': [student.get('totalPoints') or 0 for student in students]
+    })
+    delta = deltas['delta'].rename(index=str)
+    table['delta'] = table['studentId'].map(delta).fillna(0).astype(int)
+    table['newPoints'] = table['oldPoints'] + table['delta']
+    return add_ranks(table)
+
+
+def group_table(students, key):
+    """Totals, deltas and ranks per class or department"""
+    table = students.groupby(key, dropna=False).agg(
+        students=('studentId', 'size'),
+        studentsAffected=('delta', lambda delta: int((delta != 0).sum())),
+        oldPoints=('oldPoints', 'sum'),
+        newPoints=('newPoints', 'sum'),
+        delta=('delta', 'sum')
+    ).reset_index()
+    return add_ranks(table)
+
+
+def summarise(events, students, categories):
+    """Headline numbers in the shape of the backend's impact analysis"""
+    changed = events[events['delta'] != 0]
+    affected = students[students['delta'] != 0]
+    most_impacted = affected.reindex(affected['delta'].abs().sort_values(ascending=False).index).head(TOP_STUDENTS)
+    return {
+        'categories': categories,
+        'totalEventsRescored': len(events),
+        'totalEventsAffected': len(changed),
+        'totalStudentsAffected': len(affected),
+        'totalPointsChange': int(changed['delta'].sum()),
+        'studentsGainingPoints': int((affected['delta'] > 0).sum()),
+        'studentsLosingPoints': int((affected['delta'] < 0).sum()),
+        'categoryImpacts': {
+            category: {'eventsAffected': len(group), 'totalChange': int(group['delta'].sum())}
+            for category, group in changed.groupby('category')
+        },
+        'mostImpactedStudents': most_impacted[
+            ['studentId', 'name', 'registerNo', 'className', 'delta', 'oldRank', 'newRank', 'rankShift']
+        ].to_dict('records')
+    }
+
+
+def analyse_impact(dump_dir=DUMP_DIR, proposed_path=PROPOSED_CONFIG_PATH, output_dir=OUTPUT_DIR):
+    """Preview a points rule change against a dump and write per-student/class/department impact tables"""
+    start_time = time.time()
+    proposed = load_proposed_config(proposed_path)
+    categories = sorted(proposed)
+    print(f"Proposed rules for {len(categories)} categories: {categories}")
+
+    events = [event for event in read_dump(dump_dir, 'events') if event.get('category') in proposed]
+    students = read_dump(dump_dir, 'students')
+    classes = read_dump(dump_dir, 'classes')
+    print(f"Loaded {len(events)} events in those categories, {len(students)} students, {len(classes)} classes "
+          f"in {time.time() - start_time:.2f} seconds")
+    if not events or not students:
+        print("Nothing to analyse")
+        return None
+
+    # Like the backend, only approved events in the changed categories are re-scored
+    rescored, deltas = rescore_events(events_frame(events), PointsEngine(proposed))
+    rescored = rescored[rescored['status'] == 'Approved']
+    student_impact = student_table(students, classes, deltas)
+    class_impact = group_table(student_impact, 'className')
+    department_impact = group_table(student_impact, 'department')
+    summary = summarise(rescored, student_impact, categories)
+    print(f"Re-scored {len(rescored)} approved events in {time.time() - start_time:.2f} seconds")
+
+    os.makedirs(output_dir, exist_ok=True)
+    student_impact.sort_values('delta').to_csv(os.path.join(output_dir, 'students.csv'), index=False)
+    class_impact.to_csv(os.path.join(output_dir, 'classes.csv'), index=False)
+    department_impact.to_csv(os.path.join(output_dir, 'departments.csv'), index=False)
+    with open(os.path.join(output_dir, 'summary.json'), 'w') as f:
+        json.dump(summary, f, indent=2, default=str)
+
+    print(f"\n{summary['totalEventsAffected']} events and {summary['totalStudentsAffected']} students affected, "
+          f"{summary['totalPointsChange']:+d} points in total "
+          f"({summary['studentsGainingPoints']} gaining, {summary['studentsLosingPoints']} losing)")
+    print(f"Students changing rank: {int((student_impact['rankShift'] != 0).sum())}")
+    print("\nClasses:")
+    print(class_impact.sort_values('newRank').to_string(index=False))
+    print("\nDepartments:")
+    print(department_impact.sort_values('newRank').to_string(index=False))
+    print(f"\nImpact tables written to {output_dir}/")
+    return summary
+
+
+if __name__ == "__main__":
+    try:
+        analyse_impact()
+    except Exception as e:
+        print(f"Error analysing points impact: {e}")
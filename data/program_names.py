@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+
+VALID_PROGRAMS = ['BTech', 'MTech', 'MTech-Integrated']
+DEFAULT_PROGRAM = 'BTech'
+
+# Memoised results for every raw PROGRAM string seen so far
+_program_cache = {}         # Raw value -> canonical program
+_unknown_programs = set()   # Raw values that matched no known format
+
+
+def _learn_programs(raw_values):
+    """Normalise raw program strings not seen before and remember the results"""
+    raw = pd.Series(list(raw_values), dtype=object).astype(str)
+    compact = raw.str.lower().str.replace(r'[.\- ]', '', regex=True)
+
+    is_valid = raw.isin(VALID_PROGRAMS)
+    is_btech = compact.str.contains('btech', regex=False)
+    is_integrated = (compact.str.contains('mtechintegrated', regex=False)
+                     | compact.str.contains('integratedmtech', regex=False))
+    is_mtech = compact.str.contains('mtech', regex=False)
+
+    # Conditions are checked in order: exact names first, then BTech before
+    # MTech-Integrated before plain MTech. Dots are stripped before matching,
+    # so 'M.Tech' is MTech; fakk.py used to miss it and fall back to BTech
+    # (83 students in csv_output)
+    programs = np.select(
+        [is_valid, is_btech, is_integrated, is_mtech],
+        [raw, 'BTech', 'MTech-Integrated', 'MTech'],
+        default=DEFAULT_PROGRAM
+    )
+    known = is_valid | is_btech | is_integrated | is_mtech
+
+    for value, program, is_known in zip(raw_values, programs, known):
+        _program_cache[value] = str(program)
+        if not is_known:
+            _unknown_programs.add(value)
+
+
+def normalise_programs(programs):
+    """Normalise a pandas Series of raw PROGRAM values to BTech/MTech/MTech-Integrated
+
+    Only the distinct values not seen before are normalised; everything else
+    is a cached lookup. Returns the normalised Series and a boolean mask of
+    values that matched no known program (these default to BTech).
+    """
+    programs = programs.fillna('').astype(str)
+    unseen = [value for value in programs.unique() if value not in _program_cache]
+    if unseen:
+        _learn_programs(unseen)
+
+    return programs.map(_program_cache), programs.isin(_unknown_programs)
+
+
+def normalise_program(program):
+    """Normalise a single raw PROGRAM value, returning (program, is_known)"""
+    if program not in _program_cache:
+        _learn_programs([program])
+    return _program_cache[program], program not in _unknown_programs
@@ -0,0 +1,162 @@
+import os
+import csv
+import hashlib
+import threading
+
+import numpy as np
+import pandas as pd
+
+from csv_loader import DEFAULT_CSV_PATH, SOURCE_COLUMN, find_csv_files, read_csv_file, iter_read_ahead
+
+try:
+    import pyarrow  # noqa: F401 - Parquet engine for the cache
+    CACHE_FORMAT = 'parquet'
+except ImportError:
+    # pandas can always pickle frames (categoricals included); Parquet needs pyarrow
+    CACHE_FORMAT = 'pickle'
+
+DEFAULT_CACHE_DIR = '.roster_cache'
+DEFAULT_FACULTY_PATH = 'fa/faculty.csv'
+CACHE_VERSION = 2  # Bump when the parsing below changes so old entries are ignored
+
+# Low-cardinality columns stored as categoricals
+ROSTER_CATEGORIES = ['SECTION', 'YEAR OF STUDY', 'SPECIALIZATION', 'PROGRAM', 'DEPARTMENT', 'FACULTY ADVISOR']
+FACULTY_CATEGORIES = ['Designation', 'Role', 'department', 'classes', 'Year-Guide']
+
+
+def file_hash(path):
+    """Return the sha256 hex digest of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def row_field_counts(path):
+    """Number of fields csv.reader finds on each non-blank data row of a CSV file"""
+    with open(path, newline='', encoding='utf-8') as f:
+        rows = csv.reader(f)
+        next(rows, None)  # Header
+        return [len(row) for row in rows if row]
+
+
+def read_roster_file(path, normalise=True, categories=ROSTER_CATEGORIES):
+    """Parse one CSV as text, with NaN only for the cells missing from short rows
+
+    pandas fills cells missing from short rows with the same '' as empty
+    cells, so the field count of every row is taken from csv.reader and the
+    cells beyond it are set back to NaN.
+    """
+    df = read_csv_file(path, normalise, dtype=str, keep_default_na=False)
+    counts = np.array(row_field_counts(path))
+    if len(counts) != len(df):
+        print(f"Could not match the rows of {path} to their field counts; short rows are not marked")
+    elif (counts < len(df.columns)).any():
+        for position, column in enumerate(df.columns):
+            missing = counts <= position
+            if missing.any():
+                df.loc[missing, column] = np.nan
+    return categorise(df, categories)
+
+
+def categorise(df, columns):
+    """Convert the given columns (where present) to the category dtype in place"""
+    for col in columns:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return df
+
+
+class RosterCache:
+    """Typed columnar copies of roster CSVs keyed by the sha256 of each source file
+
+    Cells are kept as text exactly as written (empty cells are '', never NaN,
+    while cells missing from short rows are NaN), headers can be normalised
+    with csv_loader, and the repetitive columns are categoricals. An entry is
+    used only while the source file's hash matches, so editing a CSV
+    invalidates it automatically.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir  # None parses every file without touching the cache
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()  # read() may run in several threads at once (see iter_rosters)
+
+    def _entry_path(self, path, normalise, categories):
+        key = f"{CACHE_VERSION}:{int(normalise)}:{','.join(categories)}:{file_hash(path)}"
+        name = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{name}.{CACHE_FORMAT}")
+
+    def _load_entry(self, entry_path, columns):
+        if CACHE_FORMAT == 'parquet':
+            return pd.read_parquet(entry_path, columns=columns)
+        df = pd.read_pickle(entry_path)
+        return df[columns] if columns is not None else df
+
+    def _save_entry(self, df, entry_path):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{entry_path}.tmp"
+        if CACHE_FORMAT == 'parquet':
+            df.to_parquet(tmp_path, index=False)
+        else:
+            df.to_pickle(tmp_path)
+        os.replace(tmp_path, entry_path)
+
+    def read(self, path, normalise=True, categories=ROSTER_CATEGORIES, columns=None):
+        """Return the parsed CSV at path, from the cache when its hash is unchanged
+
+        columns limits the result to those (post-normalisation) columns; they
+        must exist in the file.
+        """
+        entry_path = self._entry_path(path, normalise, categories) if self.cache_dir else None
+        if entry_path and os.path.exists(entry_path):
+            try:
+                df = self._load_entry(entry_path, columns)
+                with self._lock:
+                    self.hits += 1
+                return df
+            except Exception as e:
+                print(f"Ignoring unreadable roster cache entry {entry_path}: {e}")
+
+        with self._lock:
+            self.misses += 1
+        df = read_roster_file(path, normalise, categories)
+        if entry_path:
+            try:
+                self._save_entry(df, entry_path)
+            except Exception as e:
+                print(f"Error caching {path}: {e}")
+        return df[columns] if columns is not None else df
+
+
+def iter_rosters(csv_files=None, csv_path=DEFAULT_CSV_PATH, cache=None, columns=None, workers=None):
+    """Yield (path, DataFrame) for each student roster, reading through the cache
+
+    Rosters are read ahead in csv_loader's thread pool, so files missing from
+    a cold or invalidated cache are parsed concurrently. Headers are
+    normalised (see csv_loader.COLUMN_ALTERNATIVES). Files that fail to read
+    are reported and skipped.
+    """
+    if csv_files is None:
+        csv_files = find_csv_files(csv_path)
+    cache = cache or RosterCache()
+    return iter_read_ahead(csv_files, lambda path: cache.read(path, columns=columns), workers)
+
+
+def load_rosters(csv_files=None, csv_path=DEFAULT_CSV_PATH, cache=None, columns=None):
+    """Read every student roster through the cache into one DataFrame tagged with source_file"""
+    frames = [df.assign(**{SOURCE_COLUMN: os.path.basename(path)})
+              for path, df in iter_rosters(csv_files, csv_path, cache, columns)]
+    if not frames:
+        return pd.DataFrame(columns=[SOURCE_COLUMN])
+
+    # Categories differ between files, so re-apply them to the combined frame
+    return categorise(pd.concat(frames, ignore_index=True), ROSTER_CATEGORIES + [SOURCE_COLUMN])
+
+
+def load_faculty(path=DEFAULT_FACULTY_PATH, cache=None):
+    """Read the faculty list through the cache, keeping its headers as written"""
+    cache = cache or RosterCache()
+    return cache.read(path, normalise=False, categories=FACULTY_CATEGORIES)
@@ -0,0 +1,121 @@
+import sys
+import datetime
+from dataclasses import dataclass
+
+from bson import ObjectId
+
+
+def _intern(value):
+    """Share one copy of a repeated string value across all records"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(slots=True)
+class StudentRecord:
+    """One student row from a roster
+
+    department, section, program and specialization repeat across hundreds of
+    rows, so they are interned; year is a small int and is shared already.
+    """
+    register_no: str
+    name: str
+    email: str
+    section: str
+    year: int
+    specialization: str
+    program: str
+    department: str
+    faculty_advisor: str
+
+    def __post_init__(self):
+        self.section = _intern(self.section)
+        self.specialization = _intern(self.specialization)
+        self.program = _intern(self.program)
+        self.department = _intern(self.department)
+        self.faculty_advisor = _intern(self.faculty_advisor)
+
+    @property
+    def class_key(self):
+        """The (department, year, section) tuple used to look up the student's class"""
+        return (self.department, self.year, self.section)
+
+    def to_document(self, class_id, hashed_password, registration_year, academic_year, course=None):
+        """Build the students collection document for this record
+
+        course defaults to the specialization; the password is the register number.
+        """
+        now = datetime.datetime.now()
+        return {
+            "_id": ObjectId(),
+            "name": self.name,
+            "profileImg": None,
+            "email": self.email,
+            "registerNo": self.register_no,
+            "password": hashed_password,
+            "rawPassword": self.register_no,
+            "class": class_id,
+            "year": self.year,
+            "course": course if course is not None else self.specialization,
+            "totalPoints": 0,
+            "eventsParticipated": [],
+            "isActive": True,
+            "isGraduated": False,
+            "isArchived": False,
+            "registrationYear": registration_year,
+            "program": self.program,
+            "department": self.department,
+            "currentClass": {
+                "year": self.year,
+                "section": self.section,
+                "ref": class_id
+            },
+            "classHistory": [{
+                "year": self.year,
+                "section": self.section,
+                "academicYear": academic_year,
+                "classRef": class_id
+            }],
+            "achievements": [],
+            "createdAt": now,
+            "updatedAt": now
+        }
+
+
+@dataclass(slots=True)
+class FacultyRecord:
+    """One faculty member from fa/faculty.csv, with the repeated fields interned"""
+    faculty_id: str
+    name: str
+    email: str
+    role: str
+    department: str
+    classes_type: str = ''
+    year_guide: str = ''
+    designation: str = ''
+    mobile: str = ''
+
+    def __post_init__(self):
+        self.role = _intern(self.role)
+        self.department = _intern(self.department)
+        self.classes_type = _intern(self.classes_type)
+        self.year_guide = _intern(self.year_guide)
+        self.designation = _intern(self.designation)
+
+    def to_document(self, hashed_password):
+        """Build the teachers collection document for this record (password is the faculty ID)"""
+        now = datetime.datetime.now()
+        return {
+            "_id": ObjectId(),
+            "name": self.name,
+            "email": self.email,
+            "password": hashed_password,
+            "rawPassword": self.faculty_id,
+            "profileImg": None,
+            "registerNo": self.faculty_id,
+            "role": self.role,
+            "department": self.department,
+            "classes": [],
+            "isActive": True,
+            "createdAt": now,
+            "updatedAt": now
+        }
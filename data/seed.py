@@ -1,13 +1,21 @@
 import pymongo
 from pymongo import MongoClient
-import bcrypt
 import datetime
 from bson import ObjectId
 import time
-import csv
 import os
-import glob
-import traceback
+import json
+import logging
+from tqdm import tqdm
+from password_hashing import hash_passwords, PasswordHashCache, DEFAULT_ROUNDS, DEFAULT_CACHE_PATH
+from bulk_writer import BulkWriter
+from program_names import normalise_program
+from seed_indexes import FacultyIndex, in_faculty_order, build_teacher_id_index
+from csv_loader import STUDENT_COLUMNS, find_csv_files, normalise_headers
+from roster_cache import RosterCache, iter_rosters, load_faculty
+from workbook_reader import iter_workbook_sheets
+from clean_rosters import clean_rows
+from roster_records import StudentRecord, FacultyRecord
 
 # Connect to MongoDB
 client = MongoClient('mongodb://localhost:27017/')
@@ -16,6 +24,22 @@ db = client['leaderboard_new_new']
 # Configuration
 CURRENT_YEAR = 2024
 ACADEMIC_YEAR = "2024-2025"
+BCRYPT_ROUNDS = DEFAULT_ROUNDS  # bcrypt cost factor for generated passwords
+HASH_WORKERS = None  # Worker processes for password hashing (None = all cores)
+HASH_CACHE_PATH = DEFAULT_CACHE_PATH  # data/.password_hash_cache.json; set to None to always re-hash
+ROSTER_CACHE_DIR = '.roster_cache'  # Parsed CSV cache; set to None to always re-parse
+STUDENT_WORKBOOKS = None  # e.g. ['ex-1.xlsx', 'ex-2.xlsx', 'ex-3.xlsx'] to read rosters from the workbooks instead of csv_output
+FACULTY_WORKBOOK = None  # e.g. 'faculty.ods' to read the faculty list from the workbook instead of fa/faculty.csv
+WRITE_BATCH_SIZE = 1000  # Documents per unordered insert_many batch
+LOG_LEVEL = logging.INFO  # logging.DEBUG adds a line for every faculty member, student and class
+SHOW_PROGRESS = True  # tqdm progress bars for the per-row loops
+SUMMARY_PATH = 'seed_summary.json'  # Machine-readable run summary; set to None to skip it
+
+logger = logging.getLogger('seed')
+
+# Faculty columns that only fa/faculty.csv has; the faculty.ods export stops
+# at Email ID, so a workbook without them reads these fields as empty
+FACULTY_ASSIGNMENT_COLUMNS = ['Role', 'department', 'classes', 'Year-Guide']
 
 # Year to registration year mapping
 YEAR_TO_REG = {
@@ -35,292 +59,295 @@ YEAR_TO_ACADEMIC_YEAR = {
 
 def clear_database():
     """Clear all collections before seeding"""
-    print("Clearing existing database...")
+    logger.info("Clearing existing database...")
     db.teachers.drop()
     db.students.drop()
     db['classes'].drop()
-    print("Database cleared successfully")
+    logger.info("Database cleared successfully")
+
+def add_faculty_from_rows(source, rows, faculty_data):
+    """Build faculty records from rows given as dicts keyed by the faculty headers"""
+    for idx, row in enumerate(rows):
+        try:
+            faculty_data.append(FacultyRecord(
+                faculty_id=row['Faculty ID'],
+                name=row['Faculty Name'],
+                designation=row['Designation'],
+                mobile=row['Mobile No'],
+                email=row['Email ID'],
+                role=row['Role'],
+                department=row['department'],
+                classes_type=row['classes'],
+                year_guide=row['Year-Guide']
+            ))
+            logger.debug("Added faculty #%d: %s, Role: %s, Dept: %s",
+                         idx + 1, row['Faculty Name'], row['Role'], row['department'])
+        except KeyError as ke:
+            logger.error("Missing key %s in %s row %d (available keys: %s)", ke, source, idx + 1, list(row.keys()))
 
 def read_faculty_data():
-    """Read faculty data from CSV file"""
-    print("Reading faculty data...")
+    """Read faculty data from fa/faculty.csv, or from FACULTY_WORKBOOK if it is set"""
+    if FACULTY_WORKBOOK:
+        return read_workbook_faculty_data(FACULTY_WORKBOOK)
+    
+    logger.info("Reading faculty data from fa/faculty.csv...")
     faculty_data = []
     
     try:
-        print("Opening fa/faculty.csv...")
-        with open('fa/faculty.csv', 'r') as csvfile:
-            reader = csv.DictReader(csvfile)
-            print(f"CSV header: {reader.fieldnames}")
-            for idx, row in enumerate(reader):
-                print(f"Processing faculty #{idx+1}: {row.get('Faculty Name', 'Unknown')}")
-                try:
-                    faculty_data.append({
-                        'faculty_id': row['Faculty ID'],
-                        'name': row['Faculty Name'],
-                        'designation': row['Designation'],
-                        'mobile': row['Mobile No'],
-                        'email': row['Email ID'],
-                        'role': row['Role'],
-                        'department': row['department'],
-                        'classes_type': row['classes'],
-                        'year_guide': row['Year-Guide']
-                    })
-                    print(f"  - Added faculty: {row['Faculty Name']}, Role: {row['Role']}, Dept: {row['department']}")
-                except KeyError as ke:
-                    print(f"  - ERROR: Missing key in faculty CSV: {ke}")
-                    print(f"  - Available keys: {list(row.keys())}")
+        df = load_faculty(cache=RosterCache(ROSTER_CACHE_DIR))
+        logger.debug("CSV header: %s", list(df.columns))
+        add_faculty_from_rows("faculty CSV", df.to_dict('records'), faculty_data)
     except Exception as e:
-        print(f"Error reading faculty data: {e}")
-        traceback.print_exc()
+        logger.exception(f"Error reading faculty data: {e}")
     
-    print(f"Successfully loaded {len(faculty_data)} faculty members")
+    logger.info(f"Successfully loaded {len(faculty_data)} faculty members")
     return faculty_data
 
-def read_student_data():
-    """Read student data from all CSV files in csv_output directory"""
-    print("Reading student data...")
-    student_data = []
-    class_data = set()  # Set of (department, year, section) tuples
+def read_workbook_faculty_data(workbook_path):
+    """Read faculty data straight from a faculty workbook (.xlsx/.ods), one sheet at a time"""
+    logger.info(f"Reading faculty data from {workbook_path}...")
+    faculty_data = []
     
-    # List of required columns (case-sensitive)
-    required_columns = [
-        'REGISTER NO', 'STUDENT NAME', 'EMAILID', 'SECTION', 
-        'YEAR OF STUDY', 'SPECIALIZATION', 'PROGRAM', 'DEPARTMENT', 'FACULTY ADVISOR'
-    ]
+    try:
+        for sheet_name, header, rows in iter_workbook_sheets(workbook_path):
+            source = f"{workbook_path} [{sheet_name}]"
+            logger.debug("Sheet '%s' header: %s", sheet_name, header)
+            missing_columns = [col for col in FACULTY_ASSIGNMENT_COLUMNS if col not in header]
+            if missing_columns:
+                logger.warning(f"{source} has no {missing_columns} columns; those fields are left empty, "
+                               f"so its faculty get no class assignments")
+            # Cells are trimmed the way fa/faculty.csv was cleaned up
+            records = ({**dict.fromkeys(missing_columns, ''), **dict(zip(header, (cell.strip() for cell in row)))}
+                       for row in rows)
+            add_faculty_from_rows(source, records, faculty_data)
+    except Exception as e:
+        logger.exception(f"Error reading faculty workbook {workbook_path}: {e}")
+    
+    logger.info(f"Successfully loaded {len(faculty_data)} faculty members")
+    return faculty_data
+
+def add_students_from_rows(source, columns, rows, student_data, class_data):
+    """Validate and normalise roster rows into student records
     
-    # Alternative column names that might be used
-    column_alternatives = {
-        'EMAILID': ['EMAIL ID', 'EMAIL', 'E-MAIL', 'E MAIL'],
-        'REGISTER NO': ['REGNO', 'REG NO', 'REGISTRATION NO', 'REGISTRATION NUMBER'],
-        'STUDENT NAME': ['NAME', 'FULL NAME'],
-        'SPECIALIZATION': ['SPECIALAIZATION', 'SPECIALISATION'],
-        'FACULTY ADVISOR': ['ADVISOR', 'FACULTY GUIDE']
+    columns are the normalised header names and rows yields tuples of cell
+    text in that order; a cell that is not text (NaN/None) means the row was
+    shorter than its header. Returns a dict of counters for the roster.
+    """
+    stats = {
+        'source': source, 'rows': 0, 'added': 0, 'short_rows': 0,
+        'empty_register_no': 0, 'invalid_year': 0, 'unknown_program': 0, 'missing_columns': []
     }
     
-    # Get all CSV files in the csv_output directory
-    print("Searching for CSV files in csv_output directory...")
-    csv_files = glob.glob('csv_output/*.csv')
-    print(f"Found {len(csv_files)} CSV files: {csv_files}")
+    # If we didn't find all required columns, skip this roster
+    missing_columns = [col for col in STUDENT_COLUMNS if col not in columns]
+    if missing_columns:
+        logger.error(f"Required columns not found in {source}: {missing_columns} (available: {list(columns)}), skipping it")
+        stats['missing_columns'] = missing_columns
+        return stats
+    positions = [columns.index(col) for col in STUDENT_COLUMNS]
     
-    if not csv_files:
-        print("WARNING: No CSV files found in the csv_output directory!")
-        return [], []
+    # Now process the data in STUDENT_COLUMNS order
+    for row_idx, row in enumerate(rows):
+        stats['rows'] += 1
+        # Skip rows that don't have enough columns
+        if not all(isinstance(cell, str) for cell in row):
+            logger.debug("Skipping row %d of %s: insufficient data", row_idx + 1, source)
+            stats['short_rows'] += 1
+            continue
+        
+        register_no, name, email, section, year_of_study, specialization, raw_program, department, faculty_advisor = (
+            row[position] for position in positions
+        )
+        
+        # Skip rows with empty register number
+        if not register_no.strip():
+            logger.debug("Skipping row %d of %s: empty register number", row_idx + 1, source)
+            stats['empty_register_no'] += 1
+            continue
+        
+        # Convert year from string to int
+        try:
+            year = int(year_of_study)
+        except (ValueError, TypeError):
+            logger.debug("Invalid year for student %s in row %d, defaulting to 1", register_no, row_idx + 1)
+            stats['invalid_year'] += 1
+            year = 1
+        
+        # Program matching algorithm (memoised per distinct raw value)
+        program, known_program = normalise_program(raw_program)
+        if not known_program:
+            logger.debug("Unknown program format '%s' for student %s, defaulting to '%s'", raw_program, register_no, program)
+            stats['unknown_program'] += 1
+        
+        student = StudentRecord(
+            register_no=register_no,
+            name=name,
+            email=email,
+            section=section,
+            year=year,
+            specialization=specialization,
+            program=program,  # Use normalized program value
+            department=department,
+            faculty_advisor=faculty_advisor
+        )
+        
+        stats['added'] += 1
+        student_data.append(student)
+        
+        # Add to class data
+        class_data.add(student.class_key)
+        logger.debug("Added student: %s (%s), Year %d, Section %s", name, register_no, year, section)
     
-    for file_idx, file_path in enumerate(csv_files):
-        print(f"\nProcessing file {file_idx+1}/{len(csv_files)}: {file_path}")
+    # Problems are counted per roster rather than printed per row
+    problems = stats['short_rows'] + stats['empty_register_no'] + stats['invalid_year'] + stats['unknown_program']
+    log = logger.warning if problems else logger.info
+    log(f"{source}: {stats['added']} students added from {stats['rows']} rows "
+        f"({stats['short_rows']} short, {stats['empty_register_no']} without register number, "
+        f"{stats['invalid_year']} invalid years, {stats['unknown_program']} unknown programs)")
+    return stats
+
+def read_workbook_student_data(workbook_paths, file_stats=None):
+    """Read student data straight from roster workbooks (.xlsx/.ods), one sheet at a time"""
+    logger.info("Reading student data from workbooks...")
+    student_data = []
+    class_data = set()  # Set of (department, year, section) tuples
+    
+    sheet_count = 0
+    for workbook_path in tqdm(workbook_paths, desc="Workbooks", unit="file", disable=not SHOW_PROGRESS):
+        logger.debug("Processing workbook: %s", workbook_path)
         try:
-            with open(file_path, 'r', encoding='utf-8') as csvfile:
-                # First read the header to check for required columns
-                reader = csv.reader(csvfile)
-                header = next(reader, None)
-                
-                if not header:
-                    print(f"WARNING: Empty or invalid header in file {file_path}")
-                    continue
-                
-                print(f"CSV header: {header}")
-                
-                # Create a mapping from standard column name to actual column index
-                column_map = {}
-                for required_col in required_columns:
-                    # Check for exact match
-                    if required_col in header:
-                        column_map[required_col] = header.index(required_col)
-                        print(f"  - Found column '{required_col}' at index {column_map[required_col]}")
-                    else:
-                        # Check for alternative names
-                        found = False
-                        if required_col in column_alternatives:
-                            for alt_name in column_alternatives[required_col]:
-                                if alt_name in header:
-                                    column_map[required_col] = header.index(alt_name)
-                                    print(f"  - Using '{alt_name}' instead of '{required_col}' at index {column_map[required_col]}")
-                                    found = True
-                                    break
-                        
-                        if not found:
-                            print(f"ERROR: Required column '{required_col}' not found in {file_path}")
-                            print(f"Available columns: {header}")
-                            print(f"Skipping file {file_path}")
-                            break
-                
-                # If we didn't find all required columns, skip this file
-                if len(column_map) != len(required_columns):
-                    print(f"Missing columns: {set(required_columns) - set(column_map.keys())}")
-                    print(f"Complete column map: {column_map}")
-                    continue
-                
-                print(f"Successfully mapped all required columns: {column_map}")
-                
-                # Reset file pointer and skip header
-                csvfile.seek(0)
-                reader = csv.reader(csvfile)
-                next(reader)  # Skip header
-                
-                # Now process the data with our column mapping
-                students_in_file = 0
-                for row_idx, row in enumerate(reader):
-                    # Skip empty rows or rows that don't have enough columns
-                    if not row or len(row) < len(header):
-                        print(f"  - Skipping row {row_idx+1}: insufficient data")
-                        continue
-                    
-                    # Skip rows with empty register number
-                    if not row[column_map['REGISTER NO']].strip():
-                        print(f"  - Skipping row {row_idx+1}: empty register number")
-                        continue
-                    
-                    # Convert year from string to int
-                    try:
-                        year = int(row[column_map['YEAR OF STUDY']])
-                    except (ValueError, TypeError):
-                        print(f"  - Warning: Invalid year for student {row[column_map['REGISTER NO']]} in row {row_idx+1}, defaulting to 1")
-                        year = 1
-                    
-                    # Program matching algorithm
-                    valid_programs = ['BTech', 'MTech', 'MTech-Integrated']
-                    program = row[column_map['PROGRAM']]
-                    
-                    if program not in valid_programs:
-                        program_lower = program.lower().replace('.', '').replace('-', '').replace(' ', '')
-                        
-                        if 'btech' in program_lower:
-                            program = 'BTech'
-                        elif 'mtechintegrated' in program_lower or 'integratedmtech' in program_lower:
-                            program = 'MTech-Integrated'
-                        elif 'mtech' in program_lower:
-                            program = 'MTech'
-                        else:
-                            print(f"  - Warning: Unknown program format '{program}' for student {row[column_map['REGISTER NO']]}, defaulting to 'BTech'")
-                            program = 'BTech'
-                    
-                    student = {
-                        'register_no': row[column_map['REGISTER NO']],
-                        'name': row[column_map['STUDENT NAME']],
-                        'email': row[column_map['EMAILID']],
-                        'section': row[column_map['SECTION']],
-                        'year': year,
-                        'specialization': row[column_map['SPECIALIZATION']],
-                        'program': program,  # Use normalized program value
-                        'department': row[column_map['DEPARTMENT']],
-                        'faculty_advisor': row[column_map['FACULTY ADVISOR']]
-                    }
-                    
-                    students_in_file += 1
-                    student_data.append(student)
-                    
-                    # Add to class data
-                    class_key = (row[column_map['DEPARTMENT']], year, row[column_map['SECTION']])
-                    class_data.add(class_key)
-                    
-                    # Print occasional debug info
-                    if students_in_file <= 2 or students_in_file % 50 == 0:
-                        print(f"  - Added student #{students_in_file}: {student['name']} ({student['register_no']}), Year {year}, Section {student['section']}")
-                
-                print(f"  - Successfully processed {students_in_file} students from file {file_path}")
-                    
+            # Rows are streamed from each sheet; nothing is written to CSV
+            for sheet_name, header, rows in iter_workbook_sheets(workbook_path):
+                sheet_count += 1
+                logger.debug("Sheet '%s' header: %s", sheet_name, header)
+                columns = normalise_headers(header)
+                # Apply the clean-up csv_output gets from clean_rosters.py
+                stats = add_students_from_rows(f"{workbook_path} [{sheet_name}]", columns, clean_rows(columns, rows),
+                                               student_data, class_data)
+                if file_stats is not None:
+                    file_stats.append(stats)
         except Exception as e:
-            print(f"ERROR processing file {file_path}: {str(e)}")
-            traceback.print_exc()
+            logger.exception(f"Error processing workbook {workbook_path}: {e}")
     
     unique_classes = list(class_data)
-    print(f"\nSummary: Processed {len(student_data)} students across {len(csv_files)} files")
-    print(f"Found {len(unique_classes)} unique classes:")
-    for dept, year, section in sorted(unique_classes):
-        print(f"  - {dept}, Year {year}, Section {section}")
+    logger.info(f"Processed {len(student_data)} students across {sheet_count} sheets")
+    return student_data, unique_classes
+
+def read_student_data(file_stats=None):
+    """Read student data from all CSV files in csv_output directory
+    
+    Per-file counters from add_students_from_rows are appended to file_stats if given.
+    """
+    if STUDENT_WORKBOOKS:
+        student_data, unique_classes = read_workbook_student_data(STUDENT_WORKBOOKS, file_stats)
+    else:
+        student_data, unique_classes = read_csv_student_data(file_stats)
     
+    logger.info(f"Found {len(unique_classes)} unique classes")
+    for dept, year, section in sorted(unique_classes):
+        logger.debug("Class: %s, Year %s, Section %s", dept, year, section)
     return student_data, unique_classes
 
-def create_teachers(faculty_data):
+def read_csv_student_data(file_stats=None):
+    """Read student data from the csv_output rosters through the roster cache"""
+    logger.info("Reading student data from csv_output...")
+    student_data = []
+    class_data = set()  # Set of (department, year, section) tuples
+    
+    csv_files = find_csv_files()
+    logger.info(f"Found {len(csv_files)} CSV files")
+    logger.debug("CSV files: %s", csv_files)
+    
+    if not csv_files:
+        logger.warning("No CSV files found in the csv_output directory!")
+        return [], []
+    
+    # Unchanged files are read from the roster cache instead of being re-parsed
+    roster_cache = RosterCache(ROSTER_CACHE_DIR)
+    rosters = iter_rosters(csv_files, cache=roster_cache)
+    for file_path, df in tqdm(rosters, total=len(csv_files), desc="Rosters", unit="file", disable=not SHOW_PROGRESS):
+        try:
+            logger.debug("Columns of %s: %s", file_path, list(df.columns))
+            # Cells missing from rows shorter than the header are NaN
+            stats = add_students_from_rows(f"file {file_path}", list(df.columns), df.itertuples(index=False, name=None),
+                                           student_data, class_data)
+            if file_stats is not None:
+                file_stats.append(stats)
+        except Exception as e:
+            logger.exception(f"Error processing file {file_path}: {e}")
+    
+    logger.info(f"Roster cache: {roster_cache.hits} files reused, {roster_cache.misses} parsed")
+    logger.info(f"Processed {len(student_data)} students across {len(csv_files)} files")
+    return student_data, list(class_data)
+
+def create_teachers(faculty_data, hash_cache=None):
     """Create teacher documents from faculty data"""
-    print("\nCreating teachers...")
+    logger.info("Creating teachers...")
     teachers = []
     teacher_map = {}  # Maps faculty_id to teacher document
     
-    for idx, faculty in enumerate(faculty_data):
-        print(f"Processing teacher #{idx+1}: {faculty['name']}")
-        
-        # Hash password (using faculty ID as password)
-        password = faculty['faculty_id']
-        print(f"  - Hashing password for {faculty['name']} (using faculty ID as password)")
+    # Hash every password up front (using faculty ID as password) so the
+    # bcrypt work is spread across all cores instead of one row at a time
+    logger.info(f"Hashing passwords for {len(faculty_data)} teachers (using faculty ID as password)...")
+    hashed_passwords = hash_passwords(
+        [faculty.faculty_id for faculty in faculty_data],
+        rounds=BCRYPT_ROUNDS,
+        workers=HASH_WORKERS,
+        cache=hash_cache
+    )
+    
+    for faculty, hashed_password in zip(faculty_data, hashed_passwords):
         try:
-            hashed_password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode()
-            
-            teacher = {
-                "_id": ObjectId(),
-                "name": faculty['name'],
-                "email": faculty['email'],
-                "password": hashed_password,
-                "rawPassword": password,
-                "profileImg": None,
-                "registerNo": faculty['faculty_id'],
-                "role": faculty['role'],
-                "department": faculty['department'],
-                "classes": [],
-                "isActive": True,
-                "createdAt": datetime.datetime.now(),
-                "updatedAt": datetime.datetime.now()
-            }
+            teacher = faculty.to_document(hashed_password)
             
             teachers.append(teacher)
-            teacher_map[faculty['faculty_id']] = teacher
-            print(f"  - Created teacher document with ID: {teacher['_id']}")
-            print(f"  - Role: {faculty['role']}, Department: {faculty['department']}")
+            teacher_map[faculty.faculty_id] = teacher
+            logger.debug("Created teacher %s (%s, %s) with ID: %s",
+                         faculty.name, faculty.role, faculty.department, teacher['_id'])
         except Exception as e:
-            print(f"  - ERROR creating teacher {faculty['name']}: {e}")
+            logger.error(f"Error creating teacher {faculty.name}: {e}")
     
-    print(f"Created {len(teachers)} teacher documents")
+    logger.info(f"Created {len(teachers)} teacher documents")
     return teachers, teacher_map
 
 def create_classes(class_tuples, teacher_map, faculty_data):
-    """Create class documents based on unique department/year/section combinations"""
-    print("\nCreating Classes...")
+    """Create class documents based on unique department/year/section combinations
+    
+    Returns (classes, class_map, unassigned) where unassigned lists the names
+    of classes that got no section faculty.
+    """
+    logger.info("Creating classes...")
     classes = []
     class_map = {}  # Maps (dept, year, section) to class document
+    unassigned = []
+    
+    # Index faculty once instead of rescanning faculty_data for every class
+    faculty_index = FacultyIndex(faculty_data, teacher_map)
+    teacher_by_id = build_teacher_id_index(teacher_map)
     
-    for idx, (dept, year, section) in enumerate(class_tuples):
-        print(f"Processing class #{idx+1}: Dept={dept}, Year={year}, Section={section}")
+    for dept, year, section in tqdm(class_tuples, desc="Classes", unit="class", disable=not SHOW_PROGRESS):
         class_name = f"{year}-{section}-{dept}"
+        year_guides = (str(year), "All")  # Only assign to matching year or "All" years
         
-        # Find faculty advisors for this class
-        assigned_faculty_ids = []
-        academic_advisor_ids = []
+        # HODs advise all classes in their department, Academic Advisors the
+        # classes of the year they guide
+        academic_advisors = in_faculty_order(
+            faculty_index.by_role[(dept, 'HOD')],
+            *(faculty_index.by_year_guide[(dept, 'Academic Advisor', year_guide)] for year_guide in year_guides)
+        )
         
-        print(f"  - Finding faculty members for {class_name}...")
+        # Faculty must guide this year and be assigned to this section
+        assigned_faculty = []
+        if section:
+            assigned_faculty = in_faculty_order(
+                *(faculty_index.by_year_guide_section[(dept, 'Faculty', year_guide, section)] for year_guide in year_guides)
+            )
         
-        # Find faculty assigned to this class
-        for faculty in faculty_data:
-            if faculty['department'] == dept:
-                # Get faculty member ID
-                faculty_id = faculty['faculty_id']
-                if faculty_id not in teacher_map:
-                    continue
-                
-                # HOD assignment - assign to all classes in their department
-                if faculty['role'] == 'HOD':
-                    academic_advisor_ids.append(teacher_map[faculty_id]["_id"])
-                    print(f"    - Assigned HOD: {faculty['name']}")
-                    continue
-                
-                # Check year guide (for Academic Advisors)
-                year_guide = faculty['year_guide']
-                if not year_guide:  # Skip if year_guide is empty
-                    continue
-                    
-                # Only assign to matching year or "All" years
-                if year_guide == str(year) or year_guide == "All":
-                    if faculty['role'] == 'Academic Advisor':
-                        academic_advisor_ids.append(teacher_map[faculty_id]["_id"])
-                        print(f"    - Assigned Academic Advisor: {faculty['name']}")
-                    elif faculty['role'] == 'Faculty':
-                        # For faculty, also check class assignment
-                        assigned_class = faculty['classes_type']
-                        if assigned_class and (assigned_class == section):
-                            assigned_faculty_ids.append(teacher_map[faculty_id]["_id"])
-                            print(f"    - Assigned faculty: {faculty['name']} to section {section}")
+        assigned_faculty_ids = [teacher["_id"] for teacher in assigned_faculty]
+        academic_advisor_ids = [teacher["_id"] for teacher in academic_advisors]
         
         if not assigned_faculty_ids:
-            print(f"  - WARNING: No faculty members assigned to class {class_name}")
+            unassigned.append(class_name)
         
         class_obj = {
             "_id": ObjectId(),
@@ -337,168 +364,181 @@ def create_classes(class_tuples, teacher_map, faculty_data):
             "updatedAt": datetime.datetime.now()
         }
         
-        print(f"  - Created class document with ID: {class_obj['_id']}")
-        print(f"  - Faculty count: {len(assigned_faculty_ids)}, Advisor count: {len(academic_advisor_ids)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Created class %s with ID: %s, faculty: %s, advisors: %s", class_name, class_obj['_id'],
+                         [teacher['name'] for teacher in assigned_faculty],
+                         [f"{teacher['name']} ({teacher['role']})" for teacher in academic_advisors])
         
         # Update teacher classes
         for faculty_id in assigned_faculty_ids + academic_advisor_ids:
-            for teacher in teacher_map.values():
-                if teacher["_id"] == faculty_id:
-                    teacher["classes"].append(class_obj["_id"])
+            teacher_by_id[faculty_id]["classes"].append(class_obj["_id"])
         
         classes.append(class_obj)
         class_map[(dept, year, section)] = class_obj
     
-    print(f"Created {len(classes)} class documents")
-    return classes, class_map
+    logger.info(f"Created {len(classes)} class documents")
+    if unassigned:
+        logger.warning(f"{len(unassigned)} classes have no faculty members assigned: {sorted(unassigned)}")
+    return classes, class_map, unassigned
 
-def create_students(student_data, class_map):
-    """Create student documents from CSV data"""
-    print("\nCreating Students...")
-    students = []
+def create_students(student_data, class_map, writer, hash_cache=None):
+    """Create student documents from CSV data and hand each one to writer as it is built
+    
+    Returns (created, problems) where problems counts the students that
+    could not be placed in a class or failed to build.
+    """
+    logger.info("Creating students...")
+    created = 0
     problems = 0
     
-    for idx, student in enumerate(student_data):
-        # Print progress
-        if idx < 5 or idx % 100 == 0:
-            print(f"Processing student #{idx+1}/{len(student_data)}: {student['name']}")
-        
-        # Hash password (using register number as password)
-        password = student['register_no']
+    # Hash passwords (using register number as password) for every student
+    # that has a class in one parallel batch, keyed by position in student_data
+    placeable = [
+        idx for idx, student in enumerate(student_data)
+        if student.class_key in class_map
+    ]
+    logger.info(f"Hashing passwords for {len(placeable)} students (using register number as password)...")
+    hashed_passwords = dict(zip(placeable, hash_passwords(
+        [student_data[idx].register_no for idx in placeable],
+        rounds=BCRYPT_ROUNDS,
+        workers=HASH_WORKERS,
+        cache=hash_cache
+    )))
+    
+    for idx, student in enumerate(tqdm(student_data, desc="Students", unit="student", disable=not SHOW_PROGRESS)):
         try:
-            hashed_password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode()
-            
             # Find the class for this student
-            class_key = (student['department'], student['year'], student['section'])
+            class_key = student.class_key
             if class_key not in class_map:
-                print(f"WARNING: No class found for student {student['register_no']} with class {class_key}")
+                logger.debug("No class found for student %s with class %s", student.register_no, class_key)
                 problems += 1
                 continue
             
             class_obj = class_map[class_key]
+            hashed_password = hashed_passwords[idx]
             
             # Create student document
-            student_obj = {
-                "_id": ObjectId(),
-                "name": student['name'],
-                "profileImg": None,
-                "email": student['email'],
-                "registerNo": student['register_no'],
-                "password": hashed_password,
-                "rawPassword": password,
-                "class": class_obj["_id"],
-                "year": student['year'],
-                "course": student['specialization'],
-                "totalPoints": 0,
-                "eventsParticipated": [],
-                "isActive": True,
-                "isGraduated": False,
-                "isArchived": False,
-                "registrationYear": YEAR_TO_REG.get(student['year'], 2024),
-                "program": student['program'],
-                "department": student['department'],
-                "currentClass": {
-                    "year": student['year'],
-                    "section": student['section'],
-                    "ref": class_obj["_id"]
-                },
-                "classHistory": [{
-                    "year": student['year'],
-                    "section": student['section'],
-                    "academicYear": YEAR_TO_ACADEMIC_YEAR.get(student['year'], "Unknown"),
-                    "classRef": class_obj["_id"]
-                }],
-                "achievements": [],
-                "createdAt": datetime.datetime.now(),
-                "updatedAt": datetime.datetime.now()
-            }
+            student_obj = student.to_document(
+                class_obj["_id"],
+                hashed_password,
+                YEAR_TO_REG.get(student.year, 2024),
+                YEAR_TO_ACADEMIC_YEAR.get(student.year, "Unknown")
+            )
             
             # Add student to this class's student list
             class_obj["students"].append(student_obj["_id"])
-            students.append(student_obj)
-            
-            # Print occasional debug info
-            if idx < 2 or (idx % 500 == 0 and idx > 0):
-                print(f"  - Created student document for {student['name']} ({student['register_no']})")
-                print(f"  - Assigned to class: {class_obj['className']}")
-                print(f"  - Registration year: {student_obj['registrationYear']}")
-                print(f"  - Academic year: {student_obj['classHistory'][0]['academicYear']}")
+            writer.add(student_obj)
+            created += 1
+            logger.debug("Created student document for %s (%s) in class %s",
+                         student.name, student.register_no, class_obj['className'])
         
         except Exception as e:
-            print(f"ERROR creating student {student['register_no']}: {e}")
+            logger.error(f"Error creating student {student.register_no}: {e}")
             problems += 1
     
-    print(f"Created {len(students)} student documents")
+    logger.info(f"Created {created} student documents")
     if problems > 0:
-        print(f"Encountered {problems} problems while creating students")
-    
-    # Print class distribution
-    print("\nClass distribution:")
-    class_count = {}
-    for class_key, class_obj in class_map.items():
-        class_count[class_obj['className']] = len(class_obj['students'])
+        logger.warning(f"Encountered {problems} problems while creating students")
     
-    for class_name, count in sorted(class_count.items()):
-        print(f"  - {class_name}: {count} students")
+    # Class distribution
+    for class_obj in sorted(class_map.values(), key=lambda class_obj: class_obj['className']):
+        logger.debug("Class %s: %d students", class_obj['className'], len(class_obj['students']))
     
-    return students
+    return created, problems
+
+def write_summary(summary, path):
+    """Write the run summary as JSON, replacing any earlier summary atomically"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(summary, f, indent=2, default=str)
+    os.replace(tmp_path, path)
 
 def seed_database():
-    """Main function to seed the database"""
+    """Main function to seed the database
+    
+    Returns the run summary (timings, document counts, per-file counters)
+    that is also written to SUMMARY_PATH.
+    """
     start_time = time.time()
+    timings = {}
+    
+    def checkpoint(stage):
+        timings[stage] = round(time.time() - start_time, 3)
+        logger.info(f"Time after {stage.replace('_', ' ')}: {timings[stage]:.2f} seconds")
     
     # Clear existing data
     clear_database()
-    print(f"Time after clearing: {time.time() - start_time:.2f} seconds")
+    checkpoint('clearing')
     
     # Read faculty data
     faculty_data = read_faculty_data()
-    print(f"Time after reading faculty: {time.time() - start_time:.2f} seconds")
+    checkpoint('reading_faculty')
     
     # Read student data
-    student_data, class_tuples = read_student_data()
-    print(f"Time after reading students: {time.time() - start_time:.2f} seconds")
+    file_stats = []
+    student_data, class_tuples = read_student_data(file_stats)
+    checkpoint('reading_students')
+    
+    # Reuse password hashes from earlier runs over the same roster
+    hash_cache = PasswordHashCache(HASH_CACHE_PATH) if HASH_CACHE_PATH else None
     
     # Create teachers
-    teachers, teacher_map = create_teachers(faculty_data)
-    print(f"Time after creating teachers: {time.time() - start_time:.2f} seconds")
+    teachers, teacher_map = create_teachers(faculty_data, hash_cache)
+    checkpoint('creating_teachers')
     
     # Create classes
-    classes, class_map = create_classes(class_tuples, teacher_map, faculty_data)
-    print(f"Time after creating classes: {time.time() - start_time:.2f} seconds")
-    
-    # Create students
-    students = create_students(student_data, class_map)
-    print(f"Time after creating students: {time.time() - start_time:.2f} seconds")
-    
-    # Insert data into database
-    print("\nInserting data into database...")
-    
-    # Insert teachers
-    if teachers:
-        print(f"Inserting {len(teachers)} teacher documents into MongoDB...")
-        db.teachers.insert_many(teachers)
-        print(f"Inserted {len(teachers)} teachers")
-    
-    # Insert classes
-    if classes:
-        print(f"Inserting {len(classes)} class documents into MongoDB...")
-        db['classes'].insert_many(classes)
-        print(f"Inserted {len(classes)} classes")
-    
-    # Insert students
-    if students:
-        print(f"Inserting {len(students)} student documents into MongoDB...")
-        db.students.insert_many(students)
-        print(f"Inserted {len(students)} students")
-    
-    # Print summary
+    classes, class_map, unassigned_classes = create_classes(class_tuples, teacher_map, faculty_data)
+    checkpoint('creating_classes')
+    
+    # Insert data into database in fixed-size unordered batches. Student
+    # documents go straight to their writer as they are built, so only one
+    # batch of them is held at a time; the roster rows, password hashes,
+    # teachers and classes stay in memory until the run ends. Classes are
+    # written last, once every student has been added to its class.
+    logger.info("Inserting data into database...")
+    writes = {}
+    with BulkWriter(db.teachers, WRITE_BATCH_SIZE) as writer:
+        writer.extend(teachers)
+    writes['teachers'] = {'inserted': writer.inserted, 'failed': writer.failed, 'batches': writer.batches}
+    
+    # Create and insert students
+    with BulkWriter(db.students, WRITE_BATCH_SIZE) as writer:
+        students_created, student_problems = create_students(student_data, class_map, writer, hash_cache)
+    writes['students'] = {'inserted': writer.inserted, 'failed': writer.failed, 'batches': writer.batches}
+    checkpoint('creating_students')
+    
+    with BulkWriter(db['classes'], WRITE_BATCH_SIZE) as writer:
+        writer.extend(classes)
+    writes['classes'] = {'inserted': writer.inserted, 'failed': writer.failed, 'batches': writer.batches}
+    checkpoint('inserting')
+    
     total_time = time.time() - start_time
-    print("\nDatabase seeding completed!")
-    print(f"- {len(teachers)} teachers created")
-    print(f"- {len(classes)} classes created")
-    print(f"- {len(students)} students created")
-    print(f"Total time: {total_time:.2f} seconds")
+    summary = {
+        'database': db.name,
+        'started_at': datetime.datetime.fromtimestamp(start_time).isoformat(),
+        'total_seconds': round(total_time, 3),
+        'timings': timings,
+        'faculty_read': len(faculty_data),
+        'students_read': len(student_data),
+        'teachers': len(teachers),
+        'classes': len(classes),
+        'students': students_created,
+        'student_problems': student_problems,
+        'classes_without_faculty': sorted(unassigned_classes),
+        'writes': writes,
+        'files': file_stats
+    }
+    if SUMMARY_PATH:
+        try:
+            write_summary(summary, SUMMARY_PATH)
+        except Exception as e:
+            logger.error(f"Error writing summary to {SUMMARY_PATH}: {e}")
+    
+    logger.info("Database seeding completed!")
+    logger.info(f"{len(teachers)} teachers, {len(classes)} classes, {students_created} students created")
+    logger.info(f"Total time: {total_time:.2f} seconds")
+    return summary
 
 if __name__ == "__main__":
-    seed_database()
\ No newline at end of file
+    logging.basicConfig(level=LOG_LEVEL, format='%(asctime)s - %(levelname)s - %(message)s')
+    seed_database()
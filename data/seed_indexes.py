@@ -0,0 +1,47 @@
+from collections import defaultdict
+from itertools import chain
+from operator import itemgetter
+
+
+class FacultyIndex:
+    """Lookup tables over faculty_data, built once per seeding run
+
+    Every table maps a key to a list of (position, teacher) entries, where
+    position is the faculty member's row in faculty_data and teacher is the
+    matching document from teacher_map. Faculty without a teacher document
+    are left out, exactly as the old nested scans skipped them.
+    """
+
+    def __init__(self, faculty_data, teacher_map):
+        self.by_role = defaultdict(list)                # (dept, role)
+        self.by_section = defaultdict(list)             # (dept, classes_type)
+        self.by_year_guide = defaultdict(list)          # (dept, role, year_guide)
+        self.by_year_guide_section = defaultdict(list)  # (dept, role, year_guide, classes_type)
+
+        for position, faculty in enumerate(faculty_data):
+            teacher = teacher_map.get(faculty.faculty_id)
+            if teacher is None:
+                continue
+
+            entry = (position, teacher)
+            dept = faculty.department
+            role = faculty.role
+            self.by_role[(dept, role)].append(entry)
+            self.by_section[(dept, faculty.classes_type)].append(entry)
+            self.by_year_guide[(dept, role, faculty.year_guide)].append(entry)
+            self.by_year_guide_section[(dept, role, faculty.year_guide, faculty.classes_type)].append(entry)
+
+
+def in_faculty_order(*groups):
+    """Merge index entries back into faculty_data order and return the teacher documents"""
+    return [teacher for _, teacher in sorted(chain.from_iterable(groups), key=itemgetter(0))]
+
+
+def build_teacher_id_index(teacher_map):
+    """Map each teacher's _id to its document"""
+    return {teacher['_id']: teacher for teacher in teacher_map.values()}
+
+
+def build_class_index(classes):
+    """Map each class's _id to its document"""
+    return {class_obj['_id']: class_obj for class_obj in classes}
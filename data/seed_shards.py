@@ -0,0 +1,95 @@
+import os
+import random
+import hashlib
+import calendar
+from itertools import count
+
+import bson
+import bcrypt
+from bson import ObjectId
+
+# bcrypt's base64 alphabet; a 22-character salt only uses the top 2 bits of its last character
+BCRYPT_ALPHABET = './ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789'
+BCRYPT_SALT_ENDINGS = '.Oeu'
+
+MAX_SHARDS = 1 << 16  # Shard numbers fill two bytes of every ObjectId
+MAX_IDS_PER_SHARD = 1 << 24  # ObjectId counters are three bytes
+
+
+def derive_seed(master_seed, *key):
+    """Stable 64-bit seed for one part of a run, derived from the master seed and a key like a shard label
+
+    Unlike hash(), the result is the same in every process and every run.
+    """
+    text = ':'.join(str(part) for part in (master_seed,) + key)
+    return int.from_bytes(hashlib.sha256(text.encode('utf-8')).digest()[:8], 'big')
+
+
+class ShardObjectIds:
+    """Deterministic ObjectId factory for one shard of a seeded run
+
+    Ids are laid out like real ObjectIds: a 4-byte timestamp, then 3 bytes
+    taken from the master seed and 2 bytes of shard number in place of the
+    random process value, then a 3-byte counter. Shards of the same run can
+    therefore never hand out the same id, and a rerun with the same master
+    seed hands out exactly the same ones.
+    """
+
+    def __init__(self, master_seed, shard_number, timestamp):
+        if not 0 <= shard_number < MAX_SHARDS:
+            raise ValueError(f"Shard number {shard_number} does not fit in an ObjectId")
+        seconds = calendar.timegm(timestamp.utctimetuple())
+        seed_bytes = derive_seed(master_seed, 'objectid').to_bytes(8, 'big')[:3]
+        self.prefix = seconds.to_bytes(4, 'big') + seed_bytes + shard_number.to_bytes(2, 'big')
+        self.counter = count()
+
+    def __call__(self):
+        value = next(self.counter)
+        if value >= MAX_IDS_PER_SHARD:
+            raise OverflowError("Shard produced more ObjectIds than fit in the counter; use smaller shards")
+        return ObjectId(self.prefix + value.to_bytes(3, 'big'))
+
+
+def seeded_bcrypt_hash(password, seed, rounds=12):
+    """bcrypt hash of password with a salt drawn from seed instead of os.urandom
+
+    Only for generated test data: the hash stays valid for bcrypt.checkpw,
+    but the same seed always gives the same salt.
+    """
+    rng = random.Random(seed)
+    salt = ''.join(rng.choice(BCRYPT_ALPHABET) for _ in range(21)) + rng.choice(BCRYPT_SALT_ENDINGS)
+    return bcrypt.hashpw(password.encode('utf-8'), f"$2b${rounds:02d}${salt}".encode()).decode()
+
+
+class BsonFileWriter:
+    """Append documents to a .bson file; same add/extend/context manager interface as BulkWriter
+
+    The files have the layout mongodump produces, so a directory of them can
+    be loaded with mongorestore.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.name = os.path.splitext(os.path.basename(path))[0]
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.file = open(path, 'wb')
+        self.inserted = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+        return False
+
+    def add(self, document):
+        self.file.write(bson.encode(document))
+        self.inserted += 1
+
+    def extend(self, documents):
+        for document in documents:
+            self.add(document)
+
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
@@ -0,0 +1,93 @@
+import os
+import json
+import uuid
+import random
+import datetime
+from functools import partial
+
+from faker import Faker
+from faker.providers.date_time import Provider as DateTimeProvider
+
+DEFAULT_POOL_DIR = '.text_pools'
+DEFAULT_POOL_SIZE = 10000  # Values generated per pooled method
+POOL_SEED = 0  # Faker seed used to build the pools, so a rebuilt pool has the same contents
+POOL_VERSION = 1  # Bump when POOLED_METHODS or the pool format changes so old files are ignored
+
+# Faker methods served from pregenerated pools; everything else still goes to Faker
+POOLED_METHODS = ('name', 'paragraph', 'catch_phrase', 'bs', 'company', 'word', 'color_name')
+
+
+def pool_path(pool_dir, locale, size):
+    """Where the pools for a locale and size are cached"""
+    return os.path.join(pool_dir, f"{locale}-{size}-v{POOL_VERSION}.json")
+
+
+def build_pools(locale, size):
+    """Call each pooled Faker method size times with a fixed seed"""
+    faker = Faker(locale)
+    faker.seed_instance(POOL_SEED)
+    return {method: [getattr(faker, method)() for _ in range(size)] for method in POOLED_METHODS}
+
+
+def load_pools(locale='en_IN', size=DEFAULT_POOL_SIZE, pool_dir=DEFAULT_POOL_DIR):
+    """Return the pools for a locale, building and caching them on the first run
+
+    pool_dir None builds the pools in memory every time.
+    """
+    path = pool_path(pool_dir, locale, size) if pool_dir else None
+    if path and os.path.exists(path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"Ignoring unreadable text pool cache {path}: {e}")
+
+    print(f"Building {locale} text pools ({size} values per method)...")
+    pools = build_pools(locale, size)
+    if path:
+        os.makedirs(pool_dir, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(pools, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    return pools
+
+
+class PooledFaker:
+    """Stand-in for a Faker instance that samples its slow methods from pools
+
+    The methods in POOLED_METHODS pick a random pregenerated value, uuid4
+    and date_time_between are computed directly from the random module, and
+    any other attribute is passed through to a real Faker. Every draw goes
+    through the random module, so random.seed makes a run repeatable.
+    """
+
+    def __init__(self, locale='en_IN', size=DEFAULT_POOL_SIZE, pool_dir=DEFAULT_POOL_DIR):
+        self.faker = Faker(locale)
+        self.pools = load_pools(locale, size, pool_dir)
+        self._timestamps = {}  # Relative dates like '-1y' are resolved once per run
+        for method, pool in self.pools.items():
+            setattr(self, method, partial(random.choice, pool))
+
+    def __getattr__(self, name):
+        # Only called for attributes not set above
+        if name == 'faker':
+            raise AttributeError(name)
+        return getattr(self.faker, name)
+
+    def uuid4(self):
+        return str(uuid.UUID(int=random.getrandbits(128), version=4))
+
+    def _timestamp(self, value):
+        if not isinstance(value, str):
+            return DateTimeProvider._parse_date_time(value)
+        if value not in self._timestamps:
+            self._timestamps[value] = DateTimeProvider._parse_date_time(value)
+        return self._timestamps[value]
+
+    def date_time_between(self, start_date='-30y', end_date='now', tzinfo=None):
+        if tzinfo is not None:
+            return self.faker.date_time_between(start_date=start_date, end_date=end_date, tzinfo=tzinfo)
+        timestamp = random.uniform(self._timestamp(start_date), self._timestamp(end_date))
+        # Faker's timestamps are UTC-based; converting like Faker keeps naive dates in their own frame
+        return datetime.datetime(1970, 1, 1) + datetime.timedelta(seconds=timestamp)
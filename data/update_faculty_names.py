@@ -1,40 +1,41 @@
 import os
 import pandas as pd
-import glob
+
+from csv_loader import find_csv_files, iter_csv_files
+
+# Mapping of faculty advisor name variants to their canonical spelling
+FACULTY_NAME_MAPPING = {
+    "Dr. S. Raguvaran": "Dr. S. Raguvaran",
+    "Dr. S. Raguvaran ": "Dr. S. Raguvaran",
+    "Dr. Vinston Raja R": "Dr. R.Vinston Raja Retnakumar",
+    "Dr.A.K.Reshmy": "Dr.A.K. Reshmy",
+    "Dr.AR.Arunarani": "Dr.AR.Aruna Rani",
+    "Dr.AR.Arunarani ": "Dr.AR.Aruna Rani",
+    "Dr.G.Sumathy": "Dr.G. Sumathy",
+    "Dr.K.Babu": "Dr.K. Babu",
+    "Dr.K.Babu ": "Dr.K. Babu",
+    "Dr.Kaavya Kanagaraj": "Dr.Kaavya Kanagaraj",
+    "Dr.Kanipriya": "Dr.Kanipriya .M",
+    "Dr.Kanipriya ": "Dr.Kanipriya .M",
+    "Dr.Nagendra Prabhu": "Dr. S. Nagendra Prabhu",
+    "Dr.Nagendra Prabhu  ": "Dr. S. Nagendra Prabhu",
+    "Dr.P.V. Gopi Rajan": "Dr.Gopirajan PV",
+    "Dr.P.V. Gopi Rajan ": "Dr.Gopirajan PV",
+    "Dr.Prithi": "Dr.S. Prithi",
+    "Dr.Prithi  ": "Dr.S. Prithi",
+    "Dr.Salomi": "Dr. M.Salomi",
+    "Dr.Salomi ": "Dr. M.Salomi",
+    "Dr.Sherin Shibi": "Dr.C.Sherin Shibi",
+    "Dr.Sherin Shibi ": "Dr.C.Sherin Shibi",
+    "Dr.Siva Sankar": "Dr.G.Sivashankar",
+    "Dr.U.Sakthi": "Dr.U.Sakthi",
+    "Dr.U.Sakthi ": "Dr.U.Sakthi"
+}
 
 def update_faculty_names():
     # Find all CSV files in the csv_output directory
     csv_path = "csv_output/*.csv"
-    csv_files = glob.glob(csv_path)
-    
-    # Define the mapping for faculty advisor names
-    faculty_mapping = {
-        "Dr. S. Raguvaran": "Dr. S. Raguvaran",
-        "Dr. S. Raguvaran ": "Dr. S. Raguvaran",
-        "Dr. Vinston Raja R": "Dr. R.Vinston Raja Retnakumar",
-        "Dr.A.K.Reshmy": "Dr.A.K. Reshmy",
-        "Dr.AR.Arunarani": "Dr.AR.Aruna Rani",
-        "Dr.AR.Arunarani ": "Dr.AR.Aruna Rani",
-        "Dr.G.Sumathy": "Dr.G. Sumathy",
-        "Dr.K.Babu": "Dr.K. Babu",
-        "Dr.K.Babu ": "Dr.K. Babu",
-        "Dr.Kaavya Kanagaraj": "Dr.Kaavya Kanagaraj",
-        "Dr.Kanipriya": "Dr.Kanipriya .M",
-        "Dr.Kanipriya ": "Dr.Kanipriya .M",
-        "Dr.Nagendra Prabhu": "Dr. S. Nagendra Prabhu",
-        "Dr.Nagendra Prabhu  ": "Dr. S. Nagendra Prabhu",
-        "Dr.P.V. Gopi Rajan": "Dr.Gopirajan PV",
-        "Dr.P.V. Gopi Rajan ": "Dr.Gopirajan PV",
-        "Dr.Prithi": "Dr.S. Prithi",
-        "Dr.Prithi  ": "Dr.S. Prithi",
-        "Dr.Salomi": "Dr. M.Salomi",
-        "Dr.Salomi ": "Dr. M.Salomi",
-        "Dr.Sherin Shibi": "Dr.C.Sherin Shibi",
-        "Dr.Sherin Shibi ": "Dr.C.Sherin Shibi",
-        "Dr.Siva Sankar": "Dr.G.Sivashankar",
-        "Dr.U.Sakthi": "Dr.U.Sakthi",
-        "Dr.U.Sakthi ": "Dr.U.Sakthi"
-    }
+    csv_files = find_csv_files(csv_path)
     
     # Track processed files
     processed_files = 0
@@ -43,10 +44,8 @@ def update_faculty_names():
     print(f"Found {len(csv_files)} CSV files to process.")
     
     # Process each CSV file
-    for file in csv_files:
+    for file, df in iter_csv_files(csv_files, normalise=False):
         try:
-            # Read the CSV file
-            df = pd.read_csv(file)
             file_name = os.path.basename(file)
             
             # Find the faculty advisor column (with or without trailing spaces)
@@ -64,7 +63,7 @@ def update_faculty_names():
                 original_values = df[faculty_col].copy()
                 
                 # Update the faculty advisor names
-                df[faculty_col] = df[faculty_col].apply(lambda x: faculty_mapping.get(x, x) if pd.notna(x) else x)
+                df[faculty_col] = df[faculty_col].apply(lambda x: FACULTY_NAME_MAPPING.get(x, x) if pd.notna(x) else x)
                 
                 # Check if any values were changed
                 if not original_values.equals(df[faculty_col]):
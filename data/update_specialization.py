@@ -1,19 +1,20 @@
 import os
 import pandas as pd
-import glob
+
+from csv_loader import find_csv_files, iter_csv_files
+
+# Mapping of short specialization codes to full specialization names
+SPECIALIZATION_MAPPING = {
+    'AI': 'BTech-CSE-AI',
+    'AIML': 'BTech-CSE-AIML',
+    'CC': 'MTech-Integrated-CSE-ws-CC',
+    'SWE': 'MTech-Integrated-CSE-ws-SWE'
+}
 
 def update_specialization_values():
     # Find all CSV files in the csv_output directory
     csv_path = "csv_output/*.csv"
-    csv_files = glob.glob(csv_path)
-    
-    # Define the mapping for specialization values
-    specialization_mapping = {
-        'AI': 'BTech-CSE-AI',
-        'AIML': 'BTech-CSE-AIML',
-        'CC': 'MTech-Integrated-CSE-ws-CC',
-        'SWE': 'MTech-Integrated-CSE-ws-SWE'
-    }
+    csv_files = find_csv_files(csv_path)
     
     # Track processed files
     processed_files = 0
@@ -22,10 +23,8 @@ def update_specialization_values():
     print(f"Found {len(csv_files)} CSV files to process.")
     
     # Process each CSV file
-    for file in csv_files:
+    for file, df in iter_csv_files(csv_files, normalise=False):
         try:
-            # Read the CSV file
-            df = pd.read_csv(file)
             file_name = os.path.basename(file)
             
             # Find the specialization column (with or without trailing spaces)
@@ -38,14 +37,14 @@ def update_specialization_values():
             if specialization_col is not None:
                 # Check if we need to update any values
                 original_values = set(df[specialization_col].dropna().unique())
-                needs_update = any(val in specialization_mapping for val in original_values)
+                needs_update = any(val in SPECIALIZATION_MAPPING for val in original_values)
                 
                 if needs_update:
                     # Create a function to map values
                     def map_specialization(val):
                         if pd.isna(val):
                             return val
-                        return specialization_mapping.get(val, val)
+                        return SPECIALIZATION_MAPPING.get(val, val)
                     
                     # Apply the mapping
                     df[specialization_col] = df[specialization_col].apply(map_specialization)
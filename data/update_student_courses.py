@@ -1,8 +1,11 @@
 import os
-import pandas as pd
-import glob
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import BulkWriteError
 import logging
+from program_names import normalise_programs
+from csv_loader import find_csv_files
+from column_catalogue import ColumnCatalogue
+from roster_cache import iter_rosters
 
 # Set up logging
 logging.basicConfig(
@@ -14,9 +17,40 @@ logging.basicConfig(
     ]
 )
 
+BATCH_SIZE = 1000  # UpdateOne operations per bulk_write round-trip
+
+def write_course_updates(students_collection, updates, summary):
+    """
+    Sends one batch of (register_no, specialization, program) updates as a single
+    unordered bulk_write and adds the outcome to the running summary.
+    """
+    register_nos = [register_no for register_no, _, _ in updates]
+    
+    # One query tells us which register numbers have no student document
+    existing = set(students_collection.distinct("registerNo", {"registerNo": {"$in": register_nos}}))
+    missing = [register_no for register_no in register_nos if register_no not in existing]
+    for register_no in missing:
+        logging.warning(f"Student not found: {register_no}")
+    summary["missing"].extend(missing)
+    
+    operations = [
+        UpdateOne({"registerNo": register_no}, {"$set": {"course": specialization, "program": program}})
+        for register_no, specialization, program in updates
+    ]
+    try:
+        result = students_collection.bulk_write(operations, ordered=False)
+        summary["matched"] += result.matched_count
+        summary["modified"] += result.modified_count
+    except BulkWriteError as e:
+        logging.error(f"Error updating {len(e.details.get('writeErrors', []))} students: {e}")
+        summary["matched"] += e.details.get("nMatched", 0)
+        summary["modified"] += e.details.get("nModified", 0)
+        summary["failed"] += len(e.details.get("writeErrors", []))
+
 def update_student_courses():
     """
     Updates student course and program information in MongoDB based on CSV data.
+    Returns a summary of matched, modified and missing students.
     """
     # MongoDB connection settings - update these with your actual connection details
     mongo_uri = "mongodb://localhost:27017/"
@@ -35,94 +69,66 @@ def update_student_courses():
 
     # Find all CSV files in the csv_output directory
     csv_path = "csv_output/*.csv"
-    csv_files = glob.glob(csv_path)
+    csv_files = find_csv_files(csv_path)
     
     logging.info(f"Found {len(csv_files)} CSV files to process")
     
+    # Check headers first so files without the columns we need are never parsed
+    required_columns = ['REGISTER NO', 'SPECIALIZATION', 'PROGRAM']
+    catalogue = ColumnCatalogue()
+    update_files = []
+    for file in csv_files:
+        try:
+            missing_columns = catalogue.missing(file, required_columns)
+        except Exception as e:
+            logging.error(f"Error reading header of {file}: {e}")
+            continue
+        if missing_columns:
+            logging.warning(f"Required columns not found in {os.path.basename(file)}: {', '.join(missing_columns)}")
+        else:
+            update_files.append(file)
+    catalogue.save()
+    
     # Track updates
-    total_students = 0
-    updated_students = 0
-    failed_updates = 0
+    summary = {"total": 0, "matched": 0, "modified": 0, "failed": 0, "missing": []}
+    pending = []
     
-    # Process each CSV file
-    for file in csv_files:
+    # Process each CSV file through the roster cache, loading only the required
+    # columns; headers are normalised (SPECIALAIZATION -> SPECIALIZATION)
+    for file, df in iter_rosters(update_files, columns=required_columns):
         file_name = os.path.basename(file)
         logging.info(f"Processing file: {file_name}")
         
         try:
-            # Read the CSV file
-            df = pd.read_csv(file)
+            register_col, specialization_col, program_col = required_columns
             
-            # Find the specialization column (with or without trailing spaces)
-            specialization_col = None
-            program_col = None
-            register_col = None
+            # Program validation and normalization for the whole file at once
+            programs, unknown = normalise_programs(df[program_col])
+            for register_no, program in zip(df.loc[unknown, register_col], df.loc[unknown, program_col]):
+                logging.warning(f"Unknown program format '{program}' for student {register_no}, defaulting to 'BTech'")
             
-            for col in df.columns:
-                if col.strip() == 'SPECIALAIZATION':
-                    specialization_col = col
-                if col.strip() == 'PROGRAM':
-                    program_col = col
-                if col.strip() == 'REGISTER NO':
-                    register_col = col
+            summary["total"] += len(df)
+            pending.extend(zip(df[register_col], df[specialization_col], programs))
             
-            if not all([specialization_col, program_col, register_col]):
-                logging.warning(f"Required columns not found in {file_name}. "
-                               f"Found: SPECIALAIZATION={specialization_col is not None}, "
-                               f"PROGRAM={program_col is not None}, "
-                               f"REGISTER NO={register_col is not None}")
-                continue
-            
-            # Process each student in the CSV
-            for _, row in df.iterrows():
-                total_students += 1
-                register_no = row[register_col]
-                specialization = row[specialization_col]
-                
-                # Program validation and normalization
-                valid_programs = ['BTech', 'MTech', 'MTech-Integrated']
-                program = row[program_col]
-                
-                if program not in valid_programs:
-                    program_lower = program.lower().replace('.', '').replace('-', '').replace(' ', '')
-                    
-                    if 'btech' in program_lower:
-                        program = 'BTech'
-                    elif 'mtechintegrated' in program_lower or 'integratedmtech' in program_lower:
-                        program = 'MTech-Integrated'
-                    elif 'mtech' in program_lower:
-                        program = 'MTech'
-                    else:
-                        logging.warning(f"Unknown program format '{program}' for student {register_no}, defaulting to 'BTech'")
-                        program = 'BTech'
-                
-                try:
-                    # Update the student record in MongoDB
-                    result = students_collection.update_one(
-                        {"registerNo": register_no},
-                        {"$set": {"course": specialization, "program": program}}
-                    )
-                    
-                    if result.matched_count > 0:
-                        if result.modified_count > 0:
-                            updated_students += 1
-                            logging.debug(f"Updated student {register_no}: course={specialization}, program={program}")
-                    else:
-                        logging.warning(f"Student not found: {register_no}")
-                        failed_updates += 1
-                        
-                except Exception as e:
-                    logging.error(f"Error updating student {register_no}: {e}")
-                    failed_updates += 1
+            # Send full batches as soon as they are ready
+            while len(pending) >= BATCH_SIZE:
+                write_course_updates(students_collection, pending[:BATCH_SIZE], summary)
+                pending = pending[BATCH_SIZE:]
                     
         except Exception as e:
             logging.error(f"Error processing file {file}: {e}")
     
+    if pending:
+        write_course_updates(students_collection, pending, summary)
+    
     # Print summary
     logging.info(f"Update complete!")
-    logging.info(f"Total students processed: {total_students}")
-    logging.info(f"Students successfully updated: {updated_students}")
-    logging.info(f"Failed updates: {failed_updates}")
+    logging.info(f"Total students processed: {summary['total']}")
+    logging.info(f"Students matched: {summary['matched']}")
+    logging.info(f"Students successfully updated: {summary['modified']}")
+    logging.info(f"Students not found: {len(summary['missing'])}")
+    logging.info(f"Failed updates: {summary['failed']}")
+    return summary
 
 if __name__ == "__main__":
     update_student_courses()
@@ -0,0 +1,135 @@
+import os
+import json
+import time
+from collections import Counter, defaultdict
+
+import bson
+from pymongo import MongoClient
+
+from form_configs import FormConfigIndex, from_template
+
+# Configuration
+DUMP_DIR = '../dbdump/leaderboard_db/leaderboard_new_new_new'  # mongodump directory; set to None to read from MongoDB
+MONGO_URI = 'mongodb://localhost:27017/'
+DATABASE = 'leaderboard_new_new_new'
+SCHEMAS = ('formfieldconfigs', 'templates')  # Collections whose forms the answers are checked against
+READ_BATCH_SIZE = 1000  # Events fetched per round trip when reading from MongoDB
+SAMPLE_LIMIT = 5  # Example events kept per violation
+REPORT_PATH = 'answer_violations.json'
+
+
+def load_forms(dump_dir=DUMP_DIR):
+    """Compile each schema collection from the dump, or from MongoDB when dump_dir is None"""
+    if dump_dir:
+        return {schema: FormConfigIndex.from_dump(dump_dir, schema) for schema in SCHEMAS}
+    db = MongoClient(MONGO_URI)[DATABASE]
+    return {
+        schema: FormConfigIndex(from_template(doc) if 'config' in doc else doc for doc in db[schema].find())
+        for schema in SCHEMAS
+    }
+
+
+def iter_events(dump_dir=DUMP_DIR):
+    """Stream events one at a time from the dump or from MongoDB, never holding the collection"""
+    if dump_dir:
+        with open(os.path.join(dump_dir, 'events.bson'), 'rb') as f:
+            yield from bson.decode_file_iter(f)
+        return
+    db = MongoClient(MONGO_URI)[DATABASE]
+    yield from db.events.find({}, {'category': 1, 'customAnswers': 1}, batch_size=READ_BATCH_SIZE)
+
+
+class ViolationReport:
+    """Violation counts keyed by (schema, category, question, problem), with a few examples each
+
+    Memory grows with the number of distinct violations, not with the
+    number of events checked.
+    """
+
+    def __init__(self, sample_limit=SAMPLE_LIMIT):
+        self.sample_limit = sample_limit
+        self.counts = Counter()
+        self.samples = defaultdict(list)
+        self.events_checked = 0
+        self.events_with_violations = Counter()  # schema -> events with at least one violation
+
+    def add(self, schema, category, question_id, problem, event_id, value):
+        key = (schema, category, question_id, problem)
+        self.counts[key] += 1
+        if len(self.samples[key]) < self.sample_limit:
+            self.samples[key].append({'event': str(event_id), 'value': value})
+
+    def to_dict(self):
+        """Nest the violations as schema -> category -> question -> problem"""
+        grouped = {}
+        for (schema, category, question_id, problem), count in sorted(self.counts.items(), key=str):
+            questions = grouped.setdefault(schema, {}).setdefault(category, {})
+            questions.setdefault(question_id, {})[problem] = {
+                'count': count,
+                'samples': self.samples[(schema, category, question_id, problem)]
+            }
+        return {
+            'eventsChecked': self.events_checked,
+            'eventsWithViolations': dict(self.events_with_violations),
+            'violations': grouped
+        }
+
+
+def validate_events(events, forms, report=None):
+    """Check every event's customAnswers against each compiled schema in one pass"""
+    report = report or ViolationReport()
+    for event in events:
+        report.events_checked += 1
+        category = event.get('category')
+        answers = event.get('customAnswers') or {}
+        for schema, index in forms.items():
+            if category not in index:
+                report.add(schema, category, '*', 'no form for category', event.get('_id'), None)
+                report.events_with_violations[schema] += 1
+                continue
+            found = False
+            try:
+                for question_id, problem, value in index[category].check_answers(answers):
+                    report.add(schema, category, question_id, problem, event.get('_id'), value)
+                    found = True
+            except Exception as e:
+                # A malformed stored answer is a finding, not a reason to stop the scan
+                report.add(schema, category, '*', f"could not check answers: {e}", event.get('_id'), repr(answers))
+                found = True
+            report.events_with_violations[schema] += found
+    return report
+
+
+def print_report(report):
+    """Print violations grouped by schema, category and question"""
+    print(f"\nChecked {report.events_checked} events")
+    summary = report.to_dict()
+    for schema, event_count in report.events_with_violations.items():
+        print(f"\n{schema}: {event_count} events with violations")
+        for category, questions in summary['violations'].get(schema, {}).items():
+            print(f"  {category}")
+            for question_id, problems in questions.items():
+                for problem, details in problems.items():
+                    examples = ', '.join(repr(sample['value']) for sample in details['samples'][:3])
+                    print(f"    - {question_id}: {problem} x{details['count']} (e.g. {examples})")
+
+
+def main():
+    start_time = time.time()
+    forms = load_forms()
+    for schema, index in forms.items():
+        print(f"Compiled {len(index)} {schema} forms")
+
+    report = validate_events(iter_events(), forms)
+    print_report(report)
+
+    with open(REPORT_PATH, 'w') as f:
+        json.dump(report.to_dict(), f, indent=2, default=str)
+    print(f"\nReport written to {REPORT_PATH} in {time.time() - start_time:.2f} seconds")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except Exception as e:
+        print(f"Error validating event answers: {e}")
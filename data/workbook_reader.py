@@ -0,0 +1,153 @@
+import os
+import datetime
+import zipfile
+import itertools
+import xml.etree.ElementTree as ET
+
+try:
+    import openpyxl
+except ImportError:
+    openpyxl = None  # Only needed for .xlsx; .ods is read with the standard library
+
+# Sheets are often formatted down to the last spreadsheet row, so stop reading
+# a sheet after this many blank rows in a row
+MAX_BLANK_ROWS = 1000
+
+_TABLE = '{urn:oasis:names:tc:opendocument:xmlns:table:1.0}'
+_OFFICE = '{urn:oasis:names:tc:opendocument:xmlns:office:1.0}'
+_TEXT = '{urn:oasis:names:tc:opendocument:xmlns:text:1.0}'
+
+
+def cell_text(value):
+    """Render a cell value the way a CSV export of the sheet would"""
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return str(value).upper()
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    return str(value)
+
+
+def _trim_row(values):
+    """Drop trailing empty cells; returns an empty tuple for a blank row"""
+    end = len(values)
+    while end and values[end - 1] == '':
+        end -= 1
+    return tuple(values[:end])
+
+
+def iter_xlsx_rows(path, max_blank_rows=MAX_BLANK_ROWS):
+    """Yield (sheet_name, row) for every non-blank row of an .xlsx workbook, sheet by sheet"""
+    if openpyxl is None:
+        raise ImportError(f"openpyxl is required to read {path} (pip install openpyxl)")
+
+    # read_only streams each worksheet's XML instead of loading the whole workbook
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        for sheet in workbook.worksheets:
+            blank_rows = 0
+            for values in sheet.iter_rows(values_only=True):
+                row = _trim_row([cell_text(value) for value in values])
+                if not row:
+                    blank_rows += 1
+                    if blank_rows > max_blank_rows:
+                        break
+                    continue
+                blank_rows = 0
+                yield sheet.title, row
+    finally:
+        workbook.close()
+
+
+def _ods_text(elem):
+    """Collect the text of an ODS paragraph, expanding <text:s>, tabs and line breaks"""
+    parts = [elem.text or '']
+    for child in elem:
+        if child.tag == f'{_TEXT}s':
+            parts.append(' ' * int(child.get(f'{_TEXT}c', 1)))
+        elif child.tag == f'{_TEXT}tab':
+            parts.append('\t')
+        elif child.tag == f'{_TEXT}line-break':
+            parts.append('\n')
+        else:
+            parts.append(_ods_text(child))
+        parts.append(child.tail or '')
+    return ''.join(parts)
+
+
+def _ods_cell_text(cell):
+    value_type = cell.get(f'{_OFFICE}value-type')
+    if value_type in ('float', 'percentage', 'currency'):
+        return cell_text(float(cell.get(f'{_OFFICE}value')))
+    if value_type == 'date':
+        return cell.get(f'{_OFFICE}date-value')
+    if value_type == 'time':
+        return cell.get(f'{_OFFICE}time-value')
+    if value_type == 'boolean':
+        return cell.get(f'{_OFFICE}boolean-value').upper()
+    return '\n'.join(_ods_text(p) for p in cell.iter(f'{_TEXT}p'))
+
+
+def iter_ods_rows(path):
+    """Yield (sheet_name, row) for every non-blank row of an .ods workbook, sheet by sheet
+
+    content.xml is parsed incrementally and each row is discarded once read,
+    so memory stays flat however large the spreadsheet is.
+    """
+    with zipfile.ZipFile(path) as archive, archive.open('content.xml') as content:
+        sheet_name = None
+        for event, elem in ET.iterparse(content, events=('start', 'end')):
+            if event == 'start':
+                if elem.tag == f'{_TABLE}table':
+                    sheet_name = elem.get(f'{_TABLE}name')
+                continue
+
+            if elem.tag == f'{_TABLE}table-row':
+                values = []
+                pending_blanks = 0  # Repeated empty cells are only expanded if data follows
+                for cell in elem:
+                    if cell.tag not in (f'{_TABLE}table-cell', f'{_TABLE}covered-table-cell'):
+                        continue
+                    repeat = int(cell.get(f'{_TABLE}number-columns-repeated', 1))
+                    text = _ods_cell_text(cell)
+                    if text == '':
+                        pending_blanks += repeat
+                        continue
+                    values.extend([''] * pending_blanks)
+                    values.extend([text] * repeat)
+                    pending_blanks = 0
+
+                row = tuple(values)
+                if row:
+                    for _ in range(int(elem.get(f'{_TABLE}number-rows-repeated', 1))):
+                        yield sheet_name, row
+                elem.clear()
+            elif elem.tag == f'{_TABLE}table':
+                elem.clear()
+
+
+def iter_workbook_rows(path, max_blank_rows=MAX_BLANK_ROWS):
+    """Yield (sheet_name, row) from an .xlsx or .ods workbook; rows are tuples of cell text"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.ods':
+        return iter_ods_rows(path)
+    if extension in ('.xlsx', '.xlsm'):
+        return iter_xlsx_rows(path, max_blank_rows)
+    raise ValueError(f"Unsupported workbook format: {path}")
+
+
+def iter_workbook_sheets(path, max_blank_rows=MAX_BLANK_ROWS):
+    """Yield (sheet_name, header, rows) for each sheet of a workbook
+
+    rows is a lazy iterator over the sheet's data rows, padded with '' to the
+    header width, and must be consumed before moving on to the next sheet.
+    Sheets with no rows are skipped.
+    """
+    rows = iter_workbook_rows(path, max_blank_rows)
+    for sheet_name, sheet_rows in itertools.groupby(rows, key=lambda item: item[0]):
+        header = next(sheet_rows)[1]
+        width = len(header)
+        yield sheet_name, list(header), (row + ('',) * (width - len(row)) for _, row in sheet_rows)
@@ -7,6 +7,13 @@ import datetime
 from bson import ObjectId
 import time
 from tqdm import tqdm
+import os
+import sys
+
+# Shared seeding helpers live with the roster tooling in data/
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data'))
+from seed_indexes import build_class_index
+from points_engine import PointsEngine, LEGACY_POSITION_POINTS
 
 # Initialize faker
 fake = Faker('en_IN')
@@ -35,14 +42,12 @@ EVENT_ORGANIZERS = ['Industry Based', 'College Based']
 EVENT_TYPES = ['Individual', 'Team']
 COLLEGES = ['IIT Madras', 'NIT Trichy', 'VIT University', 'SRM University', 'Anna University']
 
-# Points configuration
-POINTS_CONFIG = {
-    'First': {'International': 100, 'National': 75, 'State': 50},
-    'Second': {'International': 75, 'National': 50, 'State': 30},
-    'Third': {'International': 50, 'National': 30, 'State': 20},
-    'Participant': {'International': 25, 'National': 15, 'State': 10},
-    'None': {'International': 10, 'National': 5, 'State': 3}
-}
+# Points configuration: these events carry participationType/eventScope/eventOrganizer/positionSecured
+# and no customAnswers, so they are scored with the version 2 rules, the latest ones keyed by those
+# attributes (the active rules score customAnswers). Events those rules have no entry for
+# (Ideathon, Conference, Coding at State scope, position 'None') keep the original position x scope points.
+POINTS_CONFIG_VERSION = 2
+POINTS_ENGINE = PointsEngine.from_dump(version=POINTS_CONFIG_VERSION, fallback=LEGACY_POSITION_POINTS)
 
 # Year to registration year mapping
 YEAR_TO_REG = {
@@ -284,6 +289,14 @@ def create_events(students, classes_data, faculty_data):
     now = datetime.datetime.now()
     one_year_ago = now - datetime.timedelta(days=365)
     
+    # Resolve each student's class in constant time
+    class_by_id = build_class_index(
+        class_obj
+        for dept_classes in classes_data.values()
+        for year_classes in dept_classes.values()
+        for class_obj in year_classes
+    )
+    
     # Create events with random distribution
     for student in tqdm(students):
         # Randomly decide how many events this student has (0-5)
@@ -294,16 +307,9 @@ def create_events(students, classes_data, faculty_data):
         
         # Get the faculty for this student's class
         student_class_id = student["class"]
-        student_dept = student["department"]
-        student_year = student["year"]
         
         # Find the class object and its assigned faculty
-        class_obj = None
-        for cls in classes_data[student_dept][student_year]:
-            if cls["_id"] == student_class_id:
-                class_obj = cls
-                break
-        
+        class_obj = class_by_id.get(student_class_id)
         if not class_obj:
             continue  # Skip if class not found
             
@@ -339,15 +345,15 @@ def create_events(students, classes_data, faculty_data):
                 
             # Position and points
             position = random.choice(EVENT_POSITIONS)
-            points = 0
-            
             if position in ['First', 'Second', 'Third'] and event_scope:
-                points = POINTS_CONFIG[position][event_scope]
                 price_money = random.randint(1000, 50000)
-            elif position == 'Participant' and event_scope:
-                points = POINTS_CONFIG['Participant'][event_scope]
-            elif event_scope:
-                points = POINTS_CONFIG['None'][event_scope]
+            
+            points = POINTS_ENGINE.score(category, event={
+                "participationType": participation_type,
+                "eventScope": event_scope,
+                "eventOrganizer": event_organizer,
+                "positionSecured": position
+            })
             
             # Status (randomly choose, with bias toward approval)
             status = random.choices(
@@ -459,7 +465,7 @@ def seed_database():
             all_classes.extend(classes[dept][year])
     
     # Insert classes
-    db.class.insert_many(all_classes)
+    db["class"].insert_many(all_classes)
     print(f"Inserted {len(all_classes)} classes")
     
     # Insert students